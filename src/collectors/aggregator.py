@@ -8,26 +8,34 @@ into a single unified collection with deduplication.
 import gc
 import gzip
 import hashlib
-import json
 import logging
+import os
+import random
+import tempfile
 import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
 from .aredn_collector import AREDNCollector
 from .base import (
-    deduplicate_features, make_feature_collection, make_geometry_feature,
+    BaseCollector, json_dumps_bytes, json_loads, make_feature_collection, make_geometry_feature,
     make_link_feature, normalize_bboxes, point_in_region,
 )
 from .hamclock_collector import HamClockCollector
 from .mesh_client_collector import MeshClientCollector
 from .meshtastic_collector import MeshtasticCollector
 from .meshcore_collector import MeshCoreCollector
-from .mqtt_subscriber import MQTTNodeStore, MQTTSubscriber
+from .mqtt_subscriber import MQTTNodeStore, MQTTSubscriber, _classify_snr
 from .noaa_alert_collector import NOAAAlertCollector
 from .reticulum_collector import ReticulumCollector
 from ..utils.config import REGION_PRESETS
-from ..utils.event_bus import EventBus
+from ..utils.event_bus import Event, EventBus, EventType
+from ..utils.paths import get_data_dir
 from ..utils.perf_monitor import PerfMonitor
 
 logger = logging.getLogger(__name__)
@@ -36,6 +44,12 @@ logger = logging.getLogger(__name__)
 DEFAULT_COLLECTOR_RETRIES = 2
 
 
+def _jittered_ttl(seconds: float) -> int:
+    """Spread a cache TTL by +/-10% so collectors seeded together don't all
+    expire (and hit their upstreams) in the same collect cycle."""
+    return int(seconds * random.uniform(0.9, 1.1))  # noqa: S311 — load spreading, not cryptographic
+
+
 def _mqtt_store_cap(config) -> int:
     """Tiered MQTTNodeStore capacity based on deployment profile."""
     if getattr(config, "is_lite", False):
@@ -63,6 +77,7 @@ def _resolve_broker_specs(config) -> List[Dict[str, Any]]:
                 "broker": entry["broker"],
                 "port": int(entry.get("port", 1883)),
                 "topic": entry.get("topic", "msh/#"),
+                "topics": entry.get("topics") or [entry.get("topic", "msh/#")],
                 "username": entry.get("username"),
                 "password": entry.get("password"),
                 "use_tls": bool(entry.get("use_tls", False)),
@@ -73,6 +88,7 @@ def _resolve_broker_specs(config) -> List[Dict[str, Any]]:
             "broker": config.get("mqtt_broker", "mqtt.meshtastic.org"),
             "port": int(config.get("mqtt_port", 1883)),
             "topic": config.get("mqtt_topic", "msh/#"),
+            "topics": config.get("mqtt_topics") or [config.get("mqtt_topic", "msh/#")],
             "username": config.get("mqtt_username") or "",
             "password": config.get("mqtt_password") or "",
             "use_tls": bool(config.get("mqtt_use_tls", False)),
@@ -81,6 +97,25 @@ def _resolve_broker_specs(config) -> List[Dict[str, Any]]:
     return specs
 
 
+@dataclass(frozen=True)
+class _AggState:
+    """Immutable snapshot of the last collect_all() bookkeeping.
+
+    Swapped in whole by writers; readers grab the reference once and never
+    take a lock (attribute assignment is atomic in CPython).
+    """
+    overlay: Mapping[str, Any]
+    ts: float
+    counts: Mapping[str, int]
+
+
+# MQTTSubscriber update types that change a node's map feature (the same
+# set the aggregator subscribes to on the event bus).
+_LIVE_UPDATE_TYPES = frozenset({"position", "nodeinfo", "telemetry"})
+
+_EMPTY_STATE = _AggState(MappingProxyType({}), 0, MappingProxyType({}))
+
+
 class DataAggregator:
     """Aggregates data from all enabled collectors into unified GeoJSON."""
 
@@ -91,26 +126,52 @@ class DataAggregator:
         cache_ttl = _get("cache_ttl_minutes", 15) * 60
         self._collectors = {}
         self._data_lock = threading.Lock()
-        self._cached_overlay: Dict[str, Any] = {}
-        self._last_collect_time: float = 0
-        self._last_collect_counts: Dict[str, int] = {}
+        # Overlay/timestamp/counts snapshot: lock-free reads, writers hold
+        # _data_lock only to serialize against each other.
+        self._state: _AggState = _EMPTY_STATE
         self._cached_result: Optional[Dict[str, Any]] = None
-        self._cached_result_time: float = 0
-        self._RESULT_CACHE_TTL = 2.0  # seconds — dedup rapid requests
-        # Pre-serialized JSON cache (avoids json.dumps + gzip on every request)
+        self._cached_result_time: float = float("-inf")
+        # Held for the duration of a collector fan-out (single-flight)
+        self._collect_lock = threading.Lock()
+        # Stale-while-revalidate refresh for get_aggregated(): one worker so a
+        # refresh never competes with the collector fan-out pool below.
+        self._refresh_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aggregate-refresh")
+        self._refresh_future: Optional[Future] = None
+        # (version tag, result) for get_topology_geojson(); see _topology_tag()
+        self._topo_cache: Optional[Tuple[Any, Dict[str, Any]]] = None
+        # ((collector, version), features) for the AREDN half of the topology
+        self._aredn_links_cache: Optional[Tuple[Any, List[Dict[str, Any]]]] = None
+        # Pre-serialized JSON cache (avoids re-serializing + gzip on every request)
         self._cached_json: Optional[bytes] = None
         self._cached_json_gzip: Optional[bytes] = None
         self._cached_json_etag: Optional[str] = None
         self._node_history = None  # Optional NodeHistoryDB for analytics recording
+        # Optional on-disk copy of the last aggregated result, so a restarted
+        # (or second) process serves the last snapshot instead of a cold
+        # "collecting" response while its first collect_all() runs.
+        self._snapshot_path = (
+            get_data_dir() / "cache" / "aggregated.json"
+            if config.get("aggregate_snapshot", False) else None
+        )
         self._obs_thread: Optional[threading.Thread] = None
 
         # Event bus for decoupled real-time communication
         self._event_bus = EventBus()
+        # Sources whose live slice changed since the last collect_all().
+        # Own lock: marked from the paho network thread, which must not
+        # wait out _data_lock while a cycle serializes and gzips.
+        self._dirty_sources: Set[str] = set()
+        self._dirty_lock = threading.Lock()
+        for event_type in (EventType.NODE_POSITION, EventType.NODE_INFO, EventType.NODE_TELEMETRY):
+            self._event_bus.subscribe(event_type, self._on_mqtt_node_event)
 
         # Performance monitor for collection timing
         self._perf_monitor = PerfMonitor()
 
         retries = DEFAULT_COLLECTOR_RETRIES
+        # Remote-API collectors can keep their last result on disk so a
+        # restart within the cache TTL skips the cold fetch.
+        persist = bool(config.get("persist_collector_cache", False))
 
         # Log deployment profile
         is_lite = getattr(config, "is_lite", False)
@@ -137,12 +198,11 @@ class DataAggregator:
         elif lite_unscoped:
             logger.info("Lite + world/no region: meshcore and AREDN worldmap disabled (safety)")
 
-        # Initialize live MQTT subscribers for Meshtastic.
+        # Meshtastic: live MQTT subscribers plus the collector that reads them.
         # Multiple brokers can feed the same MQTTNodeStore concurrently; the
         # first entry is the "primary" used for topology/stats reporting.
         self._mqtt_subscriber: Optional[MQTTSubscriber] = None
         self._mqtt_secondary: List[MQTTSubscriber] = []
-        mqtt_store: Optional[MQTTNodeStore] = None
         if config.get("enable_meshtastic", True):
             node_store = MQTTNodeStore(max_nodes=_mqtt_store_cap(config))
             broker_specs = _resolve_broker_specs(config)
@@ -151,11 +211,13 @@ class DataAggregator:
                     broker=spec["broker"],
                     port=spec["port"],
                     topic=spec["topic"],
+                    topics=spec.get("topics"),
                     username=spec.get("username"),
                     password=spec.get("password"),
                     tls=spec.get("use_tls", False),
                     node_store=node_store,
                     event_bus=self._event_bus if idx == 0 else None,
+                    on_node_update=self._on_secondary_node_update if idx else None,
                 )
                 if not sub.available:
                     logger.warning("MQTT: paho-mqtt unavailable; skipping broker %s", spec["broker"])
@@ -167,14 +229,12 @@ class DataAggregator:
                     self._mqtt_secondary.append(sub)
                 logger.info("MQTT broker started: %s:%d (%s)",
                             spec["broker"], spec["port"], spec.get("label") or "primary" if idx == 0 else spec.get("label") or f"broker{idx}")
-            if self._mqtt_subscriber is not None:
-                mqtt_store = self._mqtt_subscriber.store
+            mqtt_store = self._mqtt_subscriber.store if self._mqtt_subscriber else None
 
-        if config.get("enable_meshtastic", True):
             self._collectors["meshtastic"] = MeshtasticCollector(
                 meshtasticd_host=config.get("meshtasticd_host", "localhost"),
                 meshtasticd_port=config.get("meshtasticd_port", 4403),
-                cache_ttl_seconds=cache_ttl,
+                cache_ttl_seconds=_jittered_ttl(cache_ttl),
                 max_retries=retries,
                 mqtt_store=mqtt_store,
                 source_mode=config.get("meshtastic_source", "auto"),
@@ -182,11 +242,11 @@ class DataAggregator:
 
         # Mesh-client GeoJSON snapshot ingest (issue #78). Opt-in; placed after
         # meshtastic so a node present in both feeds keeps the live broker copy
-        # (deduplicate_features is first-by-id, and these share node ids).
+        # (collect_all dedup is first-by-id, and these share node ids).
         if config.get("enable_mesh_client", False):
             self._collectors["mesh_client"] = MeshClientCollector(
                 path=config.get("mesh_client_path", "/var/lib/meshforge/nodes.geojson"),
-                cache_ttl_seconds=cache_ttl,
+                cache_ttl_seconds=_jittered_ttl(cache_ttl),
                 max_retries=retries,
             )
 
@@ -196,8 +256,9 @@ class DataAggregator:
                 rch_port=config.get("rch_port", 8000),
                 rch_api_key=config.get("rch_api_key"),
                 enable_rmap_public=config.get("enable_rmap_public", True),
-                cache_ttl_seconds=cache_ttl,
+                cache_ttl_seconds=_jittered_ttl(cache_ttl),
                 max_retries=retries,
+                persistent_cache=persist,
                 region_bboxes=region_bboxes,
                 region_polygons=region_polygons,
             )
@@ -207,8 +268,9 @@ class DataAggregator:
                 hamclock_host=config.get("hamclock_host", "localhost"),
                 hamclock_port=config.get("hamclock_port", 8080),
                 openhamclock_port=config.get("openhamclock_port", 3000),
-                cache_ttl_seconds=cache_ttl,
+                cache_ttl_seconds=_jittered_ttl(cache_ttl),
                 max_retries=retries,
+                persistent_cache=persist,
             )
 
         if config.get("enable_aredn", True):
@@ -216,8 +278,9 @@ class DataAggregator:
             self._collectors["aredn"] = AREDNCollector(
                 node_targets=config.get("aredn_node_ips"),
                 enable_worldmap=aredn_worldmap,
-                cache_ttl_seconds=cache_ttl,
+                cache_ttl_seconds=_jittered_ttl(cache_ttl),
                 max_retries=retries,
+                persistent_cache=persist,
                 region_bboxes=region_bboxes,
                 region_polygons=region_polygons,
             )
@@ -225,8 +288,9 @@ class DataAggregator:
         if _get("enable_meshcore", True) and not lite_unscoped:
             self._collectors["meshcore"] = MeshCoreCollector(
                 enable_map=_get("enable_meshcore_map", True),
-                cache_ttl_seconds=max(cache_ttl, 1800),  # 30min min for large API
+                cache_ttl_seconds=_jittered_ttl(max(cache_ttl, 1800)),  # ~30min min for large API
                 max_retries=retries,
+                persistent_cache=persist,
                 region_bboxes=region_bboxes,
                 region_polygons=region_polygons,
             )
@@ -236,14 +300,48 @@ class DataAggregator:
             self._collectors["noaa_alerts"] = NOAAAlertCollector(
                 area=config.get("noaa_alerts_area"),
                 severity_filter=config.get("noaa_alerts_severity"),
-                cache_ttl_seconds=min(cache_ttl, 300),  # Cap at 5 min for alerts
+                cache_ttl_seconds=_jittered_ttl(min(cache_ttl, 300)),  # ~5 min cap for alerts
                 max_retries=retries,
+                persistent_cache=persist,
             )
 
+        # Collectors are I/O-bound and independent, so collect_all() fans them
+        # out on a shared pool: cycle time tracks the slowest source, not the sum.
+        node_sources = [n for n in self._collectors if n not in self._OVERLAY_ONLY_COLLECTORS]
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, len(node_sources)),
+            thread_name_prefix="collector",
+        )
+
+        if self._snapshot_path is not None:
+            self._load_snapshot()
+
     # Collectors that return polygon/overlay data — excluded from collect_all()
     # because their features are not mesh node points.
     _OVERLAY_ONLY_COLLECTORS = {"noaa_alerts"}
 
+    # FeatureCollection properties harvested into overlay_data / /api/overlay.
+    _OVERLAY_KEYS = frozenset({"space_weather", "solar_terminator", "hamclock"})
+
+    # collect_all() returns its last result unchanged within this window, so
+    # bursts from the background loop, refreshes and direct callers collapse
+    # into one fan-out.
+    _RESULT_CACHE_TTL = 5.0
+
+    # get_aggregated() serves results younger than this as fresh. The
+    # MapServer background loop re-collects every 120s; the 30s margin covers
+    # the collection itself, so requests arriving mid-cycle don't submit a
+    # redundant refresh. Past 2x the loop has stalled.
+    _AGGREGATE_TTL = 120.0 + 30.0
+
+    # Longest an HTTP request waits on a blocking refresh before it gets the
+    # stale result instead (a hung collector must not hang every request).
+    _REFRESH_WAIT_TIMEOUT = 10.0
+
+    # Snapshots older than this are ignored at startup (matches the
+    # per-collector persistent cache limit).
+    _SNAPSHOT_MAX_AGE = 14400
+
     def set_node_history(self, db) -> None:
         """Set optional NodeHistoryDB for recording observations from all sources."""
         self._node_history = db
@@ -283,19 +381,80 @@ class DataAggregator:
             except Exception as e:
                 logger.warning("Observation recording failed: %s", e)
 
-    def collect_all(self) -> Dict[str, Any]:
-        """Collect from all enabled sources and merge into one FeatureCollection.
+    def _on_mqtt_node_event(self, event: Event) -> None:
+        """Mark the meshtastic live-MQTT slice stale on any MQTT node update."""
+        with self._dirty_lock:
+            self._dirty_sources.add("meshtastic")
 
-        Results are cached for 2 seconds to avoid redundant collection cycles
-        when multiple clients request data simultaneously.
+    def _on_secondary_node_update(self, node_id: str, update_type: str) -> None:
+        """Mark the live-MQTT slice stale for updates from secondary brokers.
+
+        Only the primary broker publishes to the event bus (so a packet heard
+        on several brokers isn't broadcast to WebSocket clients repeatedly);
+        secondaries report through their on_node_update callback instead.
         """
+        if update_type in _LIVE_UPDATE_TYPES:
+            with self._dirty_lock:
+                self._dirty_sources.add("meshtastic")
+
+    def _collect_timed(self, name: str, collector: Any, dirty: bool = False) -> Dict[str, Any]:
+        """Run one collector on a pool worker, recording its timing.
+
+        A dirty collector that supports it re-merges only its live slice
+        (refresh_live) instead of waiting out its cache TTL; PerfMonitor
+        counts that as a live refresh rather than a cache hit.
+        """
+        with self._perf_monitor.time_collection(name) as src_ctx:
+            if dirty and hasattr(collector, "refresh_live"):
+                # Re-merged into the cache, but not a cache hit
+                src_ctx.live_refresh = True
+                fc = collector.refresh_live()
+            else:
+                fc = collector.collect()
+                src_ctx.from_cache = collector.is_cache_hit(fc)
+            src_ctx.node_count = len(fc.get("features", []))
+        return fc
+
+    def _report_failure(self, name: str, collector: Any, error: Exception) -> None:
+        """Log an exception that escaped collect() through the collector's gate."""
+        if isinstance(collector, BaseCollector):
+            collector.report_failure(error)
+        else:
+            logger.error("Collector %s failed: %s", name, error)
+
+    def _recent_result(self) -> Optional[Dict[str, Any]]:
+        """Cached collect_all() result if younger than _RESULT_CACHE_TTL."""
         now = time.monotonic()
         with self._data_lock:
             if (self._cached_result is not None
                     and now - self._cached_result_time < self._RESULT_CACHE_TTL):
                 return self._cached_result
+        return None
+
+    def collect_all(self) -> Dict[str, Any]:
+        """Collect from all enabled sources and merge into one FeatureCollection.
 
-        per_source_features: List[List[Dict[str, Any]]] = []
+        Results are cached for _RESULT_CACHE_TTL seconds to avoid redundant
+        collection cycles when multiple clients request data simultaneously.
+        Overlapping calls are single-flight: callers that arrive while a
+        collection is running wait for it and share its result.
+        """
+        result = self._recent_result()
+        if result is not None:
+            return result
+        with self._collect_lock:
+            # Re-check: the collection we waited on has just published
+            result = self._recent_result()
+            if result is not None:
+                return result
+            return self._collect_all_uncached()
+
+    def _collect_all_uncached(self) -> Dict[str, Any]:
+        """One full collector fan-out and merge. Caller holds _collect_lock."""
+        # Single-pass dedup: first source to report an id wins; id-less
+        # features (e.g. metadata-only) are kept unconditionally.
+        merged: Dict[str, Dict[str, Any]] = {}
+        anonymous: List[Dict[str, Any]] = []
         source_counts: Dict[str, int] = {}
         overlay_data: Dict[str, Any] = {}
 
@@ -304,45 +463,65 @@ class DataAggregator:
             if name not in self._OVERLAY_ONLY_COLLECTORS:
                 source_counts[name] = 0
 
+        with self._dirty_lock:
+            dirty, self._dirty_sources = self._dirty_sources, set()
+
         with self._perf_monitor.time_cycle() as cycle_ctx:
-            for name, collector in self._collectors.items():
-                if name in self._OVERLAY_ONLY_COLLECTORS:
-                    continue
+            futures = {
+                name: self._pool.submit(self._collect_timed, name, collector, name in dirty)
+                for name, collector in self._collectors.items()
+                if name not in self._OVERLAY_ONLY_COLLECTORS
+            }
+            # Merge in collector order (not completion order) so dedup keeps
+            # its first-source-wins priority regardless of which fetch lands first.
+            for name, future in futures.items():
                 try:
-                    with self._perf_monitor.time_collection(name) as src_ctx:
-                        fc = collector.collect()
-                        features = fc.get("features", [])
-                        source_counts[name] = len(features)
-                        src_ctx.node_count = len(features)
-                        src_ctx.from_cache = collector.is_cache_hit(fc)
-
-                    per_source_features.append(features)
+                    fc = future.result()
+                    features = fc.get("features", [])
+                    source_counts[name] = len(features)
+                    for feature in features:
+                        if feature is None:
+                            continue
+                        fid = (feature.get("properties") or {}).get("id")
+                        if fid:
+                            merged.setdefault(fid, feature)
+                        else:
+                            anonymous.append(feature)
 
                     # Capture overlay data (space weather, terminator, etc.)
                     fc_props = fc.get("properties", {})
-                    for key in ("space_weather", "solar_terminator", "hamclock"):
-                        if key in fc_props:
-                            overlay_data[key] = fc_props[key]
+                    overlay_data.update({k: fc_props[k] for k in self._OVERLAY_KEYS.intersection(fc_props)})
 
                 except Exception as e:
-                    logger.error("Collector %s failed: %s", name, e)
+                    self._report_failure(name, self._collectors[name], e)
                     source_counts[name] = 0
 
-            all_features = deduplicate_features(per_source_features, allow_no_id=True)
+            # Failures whose log lines were rate-limited stay visible in /api/perf
+            for name in futures:
+                collector = self._collectors[name]
+                if isinstance(collector, BaseCollector):
+                    self._perf_monitor.record_errors_suppressed(name, collector.errors_suppressed)
+
+            # Materialize the merged features once; the region filter runs
+            # while building the list rather than over a full-size copy.
+            candidates = chain(merged.values(), anonymous)
             if self._region_bboxes or self._region_polygons:
-                before = len(all_features)
-                kept: List[Dict[str, Any]] = []
-                for feat in all_features:
+                before = len(merged) + len(anonymous)
+                all_features: List[Dict[str, Any]] = []
+                keep = all_features.append
+                for feat in candidates:
                     coords = feat.get("geometry", {}).get("coordinates", [])
                     if len(coords) < 2:
                         continue
                     if point_in_region(coords[1], coords[0],
                                        self._region_bboxes, self._region_polygons):
-                        kept.append(feat)
-                dropped = before - len(kept)
+                        keep(feat)
+                dropped = before - len(all_features)
                 if dropped:
                     logger.debug("Region post-filter dropped %d of %d features", dropped, before)
-                all_features = kept
+            else:
+                all_features = list(candidates)
+            del merged, anonymous  # drop the dedup index before serializing
             cycle_ctx.node_count = len(all_features)
 
         # Record observations in background thread (non-blocking)
@@ -359,18 +538,24 @@ class DataAggregator:
                     )
                     can_spawn = False
             if can_spawn:
+                # No defensive copy: the feature list is shared read-only
+                # with every caller of the cached result from here on.
                 self._obs_thread = threading.Thread(
                     target=self._record_observations,
-                    args=(list(all_features),),
+                    args=(all_features,),
                     daemon=True,
                 )
                 self._obs_thread.start()
 
-        # Cache overlay data so /api/overlay doesn't trigger a full re-collect
+        # Cache overlay data so /api/overlay doesn't trigger a full re-collect.
+        # Keys this cycle didn't produce (HamClock failed with no cache) keep
+        # their last good value rather than being wiped.
         with self._data_lock:
-            self._cached_overlay = overlay_data
-            self._last_collect_time = time.time()
-            self._last_collect_counts = dict(source_counts)
+            overlay_data = {**self._state.overlay, **overlay_data}
+            self._state = _AggState(
+                MappingProxyType(overlay_data), time.time(),
+                MappingProxyType(dict(source_counts)),
+            )
             # Cache the full result for dedup (cleared after _RESULT_CACHE_TTL)
             self._cached_result_time = time.monotonic()
 
@@ -380,19 +565,17 @@ class DataAggregator:
         result["properties"]["enabled_sources"] = list(self._collectors.keys())
         result["properties"]["overlay_data"] = overlay_data
 
+        raw: Optional[bytes] = None
         with self._data_lock:
             self._cached_result = result
             # Pre-serialize JSON + gzip so HTTP handler avoids per-request cost
             try:
-                raw = json.dumps(result, default=str).encode("utf-8")
-                self._cached_json = raw
-                self._cached_json_gzip = gzip.compress(raw)
-                self._cached_json_etag = hashlib.md5(raw, usedforsecurity=False).hexdigest()
+                raw = json_dumps_bytes(result)
             except Exception as e:
                 logger.debug("JSON pre-serialization failed: %s", e)
-                self._cached_json = None
-                self._cached_json_gzip = None
-                self._cached_json_etag = None
+            self._set_serialized_locked(raw)
+        if raw is not None and self._snapshot_path is not None:
+            self._save_snapshot(raw)
 
         logger.info(
             "Aggregated %d nodes from %d sources: %s",
@@ -405,11 +588,122 @@ class DataAggregator:
         gc.collect()
         return result
 
+    def _set_serialized_locked(self, raw: Optional[bytes]) -> None:
+        """Publish (json, gzip, etag) for raw. Caller holds _data_lock."""
+        if raw is None:
+            self._cached_json = None
+            self._cached_json_gzip = None
+            self._cached_json_etag = None
+            return
+        self._cached_json = raw
+        self._cached_json_gzip = gzip.compress(raw)
+        self._cached_json_etag = hashlib.md5(raw, usedforsecurity=False).hexdigest()
+
+    def _save_snapshot(self, raw: bytes) -> None:
+        """Atomically write the serialized aggregate to the snapshot file."""
+        path = self._snapshot_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".aggregated_", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(raw)
+                os.replace(tmp_path, str(path))
+            except OSError:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logger.debug("Aggregate snapshot save failed: %s", e)
+
+    def _load_snapshot(self) -> None:
+        """Seed the result cache from the snapshot file if it is recent enough.
+
+        The result is aged by the file's mtime, so get_aggregated() treats it
+        as stale and refreshes in the background (or blocks if it is older
+        than 2x the aggregate TTL).
+        """
+        path = self._snapshot_path
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self._SNAPSHOT_MAX_AGE:
+                logger.debug("Aggregate snapshot too stale (%.0fs)", age)
+                return
+            raw = path.read_bytes()
+            result = json_loads(raw)
+        except (OSError, ValueError) as e:
+            logger.debug("Aggregate snapshot load failed: %s", e)
+            return
+        if not isinstance(result, dict) or result.get("type") != "FeatureCollection":
+            logger.debug("Aggregate snapshot has invalid format")
+            return
+        props = result.get("properties") or {}
+        with self._data_lock:
+            if self._cached_result is not None:
+                return
+            self._state = _AggState(
+                MappingProxyType(dict(props.get("overlay_data") or {})),
+                time.time() - age,
+                MappingProxyType(dict(props.get("sources") or {})),
+            )
+            self._cached_result = result
+            self._cached_result_time = time.monotonic() - age
+            self._set_serialized_locked(raw)
+        logger.info("Loaded aggregate snapshot (%d features, %.0fs old)",
+                    len(result.get("features", [])), age)
+
     def get_cached_result(self) -> Optional[Dict[str, Any]]:
         """Return cached collect_all() result without triggering collection."""
         with self._data_lock:
             return self._cached_result
 
+    def _submit_refresh(self) -> Optional[Future]:
+        """Start a background collect_all(), or join the one already running.
+
+        Returns None once shutdown() has stopped the refresh pool.
+        """
+        with self._data_lock:
+            future = self._refresh_future
+            if future is None or future.done():
+                try:
+                    future = self._refresh_pool.submit(self.collect_all)
+                except RuntimeError:  # "cannot schedule new futures after shutdown"
+                    return None
+                self._refresh_future = future
+            return future
+
+    def get_aggregated(self) -> Optional[Dict[str, Any]]:
+        """Return the aggregated result with stale-while-revalidate semantics.
+
+        Fresh results are returned as-is. Stale results (up to 2x TTL) are
+        returned immediately while a background refresh runs. Older results
+        wait on that refresh for up to _REFRESH_WAIT_TIMEOUT seconds, then
+        fall back to the stale result. Before the first collection this
+        starts a refresh and returns None so callers can show a "collecting"
+        state.
+        """
+        with self._data_lock:
+            result = self._cached_result
+            age = time.monotonic() - self._cached_result_time
+        if result is not None and age < self._AGGREGATE_TTL:
+            return result
+        future = self._submit_refresh()
+        if future is None or result is None or age < 2 * self._AGGREGATE_TTL:
+            return result
+        try:
+            return future.result(timeout=self._REFRESH_WAIT_TIMEOUT)
+        except FutureTimeoutError:
+            logger.warning(
+                "Aggregate refresh still running after %.0fs, serving stale result",
+                self._REFRESH_WAIT_TIMEOUT,
+            )
+            return result
+        except Exception as e:
+            logger.error("Aggregate refresh failed, serving stale result: %s", e)
+            return result
+
     def get_cached_json(self) -> Optional[Tuple[bytes, bytes, str]]:
         """Return pre-serialized (json_bytes, gzip_bytes, etag) or None."""
         with self._data_lock:
@@ -418,6 +712,19 @@ class DataAggregator:
                         self._cached_json_etag)
             return None
 
+    def iter_geojson_seq(self) -> Iterator[bytes]:
+        """Yield cached aggregated features as RFC 8142 GeoJSON text sequence records.
+
+        Each record is ``RS <feature JSON> LF`` so a client can render nodes
+        as they arrive instead of waiting for one monolithic document.
+        Yields nothing until the first collect_all() has completed.
+        """
+        result = self.get_cached_result()
+        if result is None:
+            return
+        for feature in result.get("features", []):
+            yield b"\x1e" + json_dumps_bytes(feature) + b"\n"
+
     def collect_source(self, source_name: str) -> Dict[str, Any]:
         """Collect from a single named source."""
         collector = self._collectors.get(source_name)
@@ -436,12 +743,33 @@ class DataAggregator:
             links.extend(aredn.get_topology_links())
         return links
 
+    def _topology_tag(self) -> Optional[Tuple[Any, ...]]:
+        """Version tag identifying the current topology inputs.
+
+        Includes the MQTT store object itself so restart_mqtt() (which swaps
+        in a new store) invalidates the cache. Returns None when a source
+        can't report a version, which disables caching.
+        """
+        store = self._mqtt_subscriber.store if self._mqtt_subscriber else None
+        aredn = self._collectors.get("aredn")
+        mqtt_ver = getattr(store, "topology_version", None) if store else 0
+        aredn_ver = getattr(aredn, "topology_version", None) if aredn else 0
+        if mqtt_ver is None or aredn_ver is None:
+            return None
+        return (store, mqtt_ver, aredn, aredn_ver)
+
     def get_topology_geojson(self) -> Dict[str, Any]:
         """Get topology as GeoJSON FeatureCollection with SNR-colored edges.
 
         Combines Meshtastic MQTT topology with AREDN LQM topology links.
+        The result is cached until either source's topology version moves;
+        callers share the returned dict and must not mutate it.
         """
-        from .mqtt_subscriber import _classify_snr
+        tag = self._topology_tag()
+        with self._data_lock:
+            cached = self._topo_cache
+        if tag is not None and cached is not None and cached[0] == tag:
+            return cached[1]
 
         # Start with MQTT topology GeoJSON if available
         if self._mqtt_subscriber:
@@ -452,56 +780,79 @@ class DataAggregator:
         # Add AREDN LQM links as GeoJSON features
         aredn = self._collectors.get("aredn")
         if aredn and hasattr(aredn, "get_topology_links"):
-            for link in aredn.get_topology_links():
-                # Include partially-resolved links as metadata-only features
-                if "source_lat" not in link or "target_lat" not in link:
-                    partial_feature = make_geometry_feature(
-                        None,
-                        source=link.get("source", ""),
-                        target=link.get("target", ""),
-                        network="aredn",
-                        link_type=link.get("link_type", ""),
-                        quality=link.get("quality"),
-                        partial=True,
-                    )
-                    result["features"].append(partial_feature)
-                    continue
-                snr = link.get("snr")
-                quality_label, color = _classify_snr(snr)
-                feature = make_link_feature(
-                    link.get("source", ""), link.get("target", ""),
-                    (link["source_lon"], link["source_lat"]),
-                    (link["target_lon"], link["target_lat"]),
-                    snr=snr, quality=quality_label, color=color,
-                    network="aredn", link_type=link.get("link_type", ""),
-                    aredn_quality=link.get("quality"),
-                )
-                result["features"].append(feature)
+            result["features"].extend(self._aredn_link_features(aredn))
 
         result["properties"]["link_count"] = len(result["features"])
+        if tag is not None:
+            with self._data_lock:
+                self._topo_cache = (tag, result)
         return result
 
+    def _aredn_link_features(self, aredn: Any) -> List[Dict[str, Any]]:
+        """AREDN LQM links as GeoJSON features, memoized per AREDN topology.
+
+        MQTT position traffic invalidates the combined topology cache far
+        more often than AREDN's LQM refresh does, so the (potentially
+        large) AREDN half is kept separately and reused across rebuilds.
+        """
+        version = getattr(aredn, "topology_version", None)
+        with self._data_lock:
+            cached = self._aredn_links_cache
+        if version is not None and cached is not None and cached[0] == (aredn, version):
+            return cached[1]
+
+        features: List[Dict[str, Any]] = []
+        append = features.append
+        for link in aredn.get_topology_links():
+            # Include partially-resolved links as metadata-only features
+            if "source_lat" not in link or "target_lat" not in link:
+                append(make_geometry_feature(
+                    None,
+                    source=link.get("source", ""),
+                    target=link.get("target", ""),
+                    network="aredn",
+                    link_type=link.get("link_type", ""),
+                    quality=link.get("quality"),
+                    partial=True,
+                ))
+                continue
+            snr = link.get("snr")
+            quality_label, color = _classify_snr(snr)
+            append(make_link_feature(
+                link.get("source", ""), link.get("target", ""),
+                (link["source_lon"], link["source_lat"]),
+                (link["target_lon"], link["target_lat"]),
+                snr=snr, quality=quality_label, color=color,
+                network="aredn", link_type=link.get("link_type", ""),
+                aredn_quality=link.get("quality"),
+            ))
+
+        if version is not None:
+            with self._data_lock:
+                self._aredn_links_cache = ((aredn, version), features)
+        return features
+
     def get_cached_overlay(self) -> Dict[str, Any]:
         """Return cached overlay data from the last collect_all() call.
 
         Falls back to collecting from hamclock only if no cache exists,
         avoiding a full multi-source aggregation.
         """
-        with self._data_lock:
-            if self._cached_overlay:
-                return dict(self._cached_overlay)
+        state = self._state
+        if state.overlay:
+            return dict(state.overlay)
         # No cache yet -- collect overlay from hamclock only
         hamclock = self._collectors.get("hamclock")
         if hamclock:
             try:
                 fc = hamclock.collect()
                 fc_props = fc.get("properties", {})
-                overlay: Dict[str, Any] = {}
-                for key in ("space_weather", "solar_terminator", "hamclock"):
-                    if key in fc_props:
-                        overlay[key] = fc_props[key]
+                overlay = {k: fc_props[k] for k in self._OVERLAY_KEYS.intersection(fc_props)}
                 with self._data_lock:
-                    self._cached_overlay = overlay
+                    state = self._state
+                    self._state = _AggState(
+                        MappingProxyType(dict(overlay)), state.ts, state.counts,
+                    )
                 return overlay
             except Exception as e:
                 logger.error("Overlay-only collection failed: %s", e)
@@ -510,16 +861,19 @@ class DataAggregator:
     @property
     def last_collect_age_seconds(self) -> Optional[float]:
         """Seconds since last successful collect_all(), or None if never collected."""
-        with self._data_lock:
-            t = self._last_collect_time
+        t = self._state.ts
         if t == 0:
             return None
         return time.time() - t
 
     @property
-    def last_collect_counts(self) -> Dict[str, int]:
-        with self._data_lock:
-            return dict(self._last_collect_counts)
+    def last_collect_counts(self) -> Mapping[str, int]:
+        """Per-source node counts from the last collect_all().
+
+        A read-only view of the published snapshot (no per-call copy);
+        callers that need a mutable or JSON-serializable dict must copy it.
+        """
+        return self._state.counts
 
     @property
     def event_bus(self) -> EventBus:
@@ -593,11 +947,13 @@ class DataAggregator:
                 broker=spec["broker"],
                 port=spec["port"],
                 topic=spec["topic"],
+                topics=spec.get("topics"),
                 username=spec.get("username"),
                 password=spec.get("password"),
                 tls=spec.get("use_tls", False),
                 node_store=node_store,
                 event_bus=self._event_bus if idx == 0 else None,
+                on_node_update=self._on_secondary_node_update if idx else None,
             )
             if not sub.available:
                 logger.warning("MQTT restart: paho-mqtt unavailable")
@@ -621,8 +977,11 @@ class DataAggregator:
         for collector in self._collectors.values():
             collector.clear_cache()
         with self._data_lock:
-            self._cached_overlay = {}
+            state = self._state
+            self._state = _AggState(MappingProxyType({}), state.ts, state.counts)
             self._cached_result = None
+            self._topo_cache = None
+            self._aredn_links_cache = None
 
     def shutdown(self) -> None:
         """Stop MQTT subscribers, reset event bus, and release resources."""
@@ -632,6 +991,12 @@ class DataAggregator:
         self._mqtt_secondary = []
         if self._obs_thread and self._obs_thread.is_alive():
             self._obs_thread.join(timeout=30)
+        self._pool.shutdown(wait=False)
+        self._refresh_pool.shutdown(wait=False)
+        for collector in self._collectors.values():
+            close = getattr(collector, "close", None)
+            if close is not None:
+                close()
         self._event_bus.reset()
-        self._cached_overlay = {}
+        self._state = _EMPTY_STATE
         logger.info("DataAggregator shut down")
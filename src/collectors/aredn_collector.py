@@ -16,22 +16,29 @@ Nodes must be reachable on the local mesh for direct queries.
 See: https://docs.arednmesh.org/en/latest/arednHow-toGuides/devtools.html
 """
 
-import json
 import logging
+import mmap
 import re
+import sys
 import threading
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.error import URLError
 from urllib.request import Request, urlopen
 
 import time as _time
 
+from ..utils.http_pool import KeepAlivePool
 from .base import (
     MESHFORGE_DATA_DIR,
     UNIFIED_CACHE_PATH,
     BaseCollector,
     bounded_read,
+    deduplicate_features,
     is_node_online,
+    json_loads,
     make_feature,
     make_feature_collection,
     point_in_region,
@@ -52,10 +59,30 @@ AREDN_CACHE_PATH = MESHFORGE_DATA_DIR / "aredn_nodes.json"
 # Default AREDN node discovery targets
 DEFAULT_AREDN_NODES: List[str] = ["localnode.local.mesh", "10.0.0.1", "localnode"]
 
+# Upper bound for one node's sysinfo?lqm=1 response. Real nodes return a few
+# KB; anything near this is a misbehaving node or a non-AREDN service.
+SYSINFO_MAX_BYTES = 4 * 1024 * 1024
+
+# Byte-level markers for the keys a sysinfo response must contain (one of)
+_AREDN_KEY_MARKERS = (b'"node"', b'"sysinfo"', b'"meshrf"')
+
 # AREDN Worldmap public data URL
 AREDN_WORLDMAP_URL = "https://worldmap.arednmesh.org/data/out.csv"
 
 
+@dataclass(frozen=True)
+class _TopoSnapshot:
+    """One fetch cycle's LQM topology, published as a single reference.
+
+    Readers load ``collector._topo`` once and see a matching version,
+    link list and coordinate map; the containers are never mutated after
+    publication.
+    """
+    version: int
+    links: List[Dict[str, Any]]   # LQM links (source, target, snr, ...)
+    coords: Dict[str, tuple]      # node_name -> (lat, lon)
+
+
 class AREDNCollector(BaseCollector):
     """Collects AREDN mesh node data via sysinfo.json API."""
 
@@ -67,60 +94,52 @@ class AREDNCollector(BaseCollector):
         enable_worldmap: bool = True,
         cache_ttl_seconds: int = 900,
         max_retries: int = 0,
+        persistent_cache: bool = False,
         region_bboxes: Optional[List[List[float]]] = None,
         region_polygons: Optional[List[List[List[float]]]] = None,
     ):
-        super().__init__(cache_ttl_seconds, max_retries=max_retries)
+        super().__init__(cache_ttl_seconds, max_retries=max_retries, persistent_cache=persistent_cache)
         self._node_targets = node_targets or list(DEFAULT_AREDN_NODES)
         self._enable_worldmap = enable_worldmap
         self._region_bboxes = region_bboxes
         self._region_polygons = region_polygons
+        # Published topology: readers take self._topo without locking;
+        # _topo_lock only serializes writers' version bumps.
         self._topo_lock = threading.Lock()
-        # Topology links from LQM data (source_name -> [{neighbor, snr, quality, ...}])
-        self._lqm_links: List[Dict[str, Any]] = []
-        # Known node coordinates for resolving LQM neighbor positions
-        self._node_coords: Dict[str, tuple] = {}  # node_name -> (lat, lon)
+        self._topo: _TopoSnapshot = _TopoSnapshot(0, [], {})
+        # Sysinfo probes hit the same few nodes every cycle; keep their
+        # connections alive instead of a TCP handshake per probe.
+        self._http = KeepAlivePool()
+        # Long-lived probe workers: threads start on first use and are
+        # reused every cycle instead of being spawned and joined per fetch.
+        self._probe_pool = ThreadPoolExecutor(
+            max_workers=self._MAX_PROBE_WORKERS, thread_name_prefix="aredn-probe",
+        )
+        # path -> ((mtime_ns, size), features); see _load_cached_features()
+        self._file_cache: Dict[Path, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
 
     def _fetch(self) -> Dict[str, Any]:
-        features: List[Dict[str, Any]] = []
-        seen_ids: set = set()
+        # Sources merge in priority order; the first copy of an id wins.
+        sources: List[List[Dict[str, Any]]] = []
         lqm_links: List[Dict[str, Any]] = []
 
         # Source 1: Direct AREDN node queries (if on mesh)
         if not self._node_targets:
             logger.debug("AREDN: no node_targets configured, skipping direct queries")
-        for target in self._node_targets:
-            node_features, links = self._fetch_from_node(target)
+        for node_features, links in self._probe_nodes(self._node_targets):
             lqm_links.extend(links)
-            for f in node_features:
-                fid = f["properties"].get("id")
-                if fid and fid not in seen_ids:
-                    seen_ids.add(fid)
-                    features.append(f)
+            sources.append(node_features)
 
         # Source 2: AREDN worldmap (public data)
         if self._enable_worldmap:
-            for f in self._fetch_from_worldmap():
-                fid = f["properties"].get("id")
-                if fid and fid not in seen_ids:
-                    seen_ids.add(fid)
-                    features.append(f)
+            sources.append(self._fetch_from_worldmap())
 
         # Source 3: MeshForge AREDN cache
-        cache_features = self._fetch_from_cache()
-        for f in cache_features:
-            fid = f["properties"].get("id")
-            if fid and fid not in seen_ids:
-                seen_ids.add(fid)
-                features.append(f)
+        sources.append(self._fetch_from_cache())
 
         # Source 3: MeshForge unified node cache (AREDN entries)
-        unified = self._fetch_from_unified_cache()
-        for f in unified:
-            fid = f["properties"].get("id")
-            if fid and fid not in seen_ids:
-                seen_ids.add(fid)
-                features.append(f)
+        sources.append(self._fetch_from_unified_cache())
+        features = deduplicate_features(sources, allow_no_id=False)
 
         # Build coordinate lookup for all known nodes
         node_coords: Dict[str, tuple] = {}
@@ -132,13 +151,37 @@ class AREDNCollector(BaseCollector):
             if fid and len(coords) >= 2:
                 node_coords[fid] = (coords[1], coords[0])  # lat, lon
 
-        # Swap topology data under lock for thread safety
-        with self._topo_lock:
-            self._lqm_links = lqm_links
-            self._node_coords = node_coords
+        self._publish_topology(lqm_links, node_coords)
 
         return make_feature_collection(features, self.source_name)
 
+    # Upper bound on concurrent sysinfo probes per collect cycle
+    _MAX_PROBE_WORKERS = 32
+
+    def _probe_nodes(self, targets: List[str]) -> List[tuple]:
+        """Query every node target concurrently; results keep target order.
+
+        Each probe is a blocking HTTP GET with its own timeout, so running
+        them side by side bounds the cycle by the slowest node rather than the
+        sum. Order is preserved so dedup still prefers earlier targets.
+        """
+        if len(targets) <= 1:
+            return [self._probe_one(t) for t in targets]
+        return list(self._probe_pool.map(self._probe_one, targets))
+
+    def _probe_one(self, target: str) -> tuple:
+        """_fetch_from_node, isolating one node's failure from the others.
+
+        Transport errors are already handled inside _fetch_from_node; this
+        catches anything a malformed response trips in parsing, so one bad
+        node cannot discard every other node's result for the cycle.
+        """
+        try:
+            return self._fetch_from_node(target)
+        except Exception as e:
+            logger.warning("AREDN node %s probe failed: %s", target, e)
+            return [], []
+
     def _fetch_from_node(self, target: str) -> tuple:
         """Query a single AREDN node's sysinfo API with LQM data.
 
@@ -171,11 +214,17 @@ class AREDNCollector(BaseCollector):
         last_err = None
         for url in endpoints:
             try:
-                req = Request(url, headers=headers)
-                with urlopen(req, timeout=5) as resp:
-                    data = json.loads(bounded_read(resp).decode())
+                body = self._http.get(
+                    url, headers=headers, timeout=5, max_bytes=SYSINFO_MAX_BYTES,
+                )
+                # Cheap reject before parsing: a web UI or other service on
+                # this port returns HTML/JSON without any AREDN key at all.
+                if not any(key in body for key in _AREDN_KEY_MARKERS):
+                    raise ValueError("response has no AREDN fields")
+                # Parse the UTF-8 bytes directly (no decoded str copy)
+                data = json_loads(body)
                 break
-            except (URLError, OSError, json.JSONDecodeError) as e:
+            except (URLError, OSError, ValueError) as e:
                 last_err = e
                 continue
 
@@ -208,6 +257,11 @@ class AREDNCollector(BaseCollector):
         logger.debug("AREDN node %s returned %d entries", target, len(features))
         return features, links
 
+    def close(self) -> None:
+        """Stop the probe workers and release pooled node connections."""
+        self._probe_pool.shutdown(wait=False)
+        self._http.close()
+
     def _parse_sysinfo(
         self, data: Dict[str, Any], target: str
     ) -> Optional[Dict[str, Any]]:
@@ -240,7 +294,8 @@ class AREDNCollector(BaseCollector):
             uptime=uptime,
             load_avg=loads[0] if loads else None,
             last_seen=_time.time(),
-            is_online=is_node_online(_time.time(), "aredn"),
+            # Just answered a live probe, so online by definition
+            is_online=True,
             grid_square=data.get("grid_square", ""),
             description=f"AREDN {model} - {firmware}",
         )
@@ -278,6 +333,8 @@ class AREDNCollector(BaseCollector):
         tx_quality = neighbor.get("tx_quality")
         rx_quality = neighbor.get("rx_quality")
         link_type = neighbor.get("type", "")
+        if isinstance(link_type, str):
+            link_type = sys.intern(link_type)  # RF/DTD/TUN, repeated per link
 
         # Validate SNR if present
         if snr is not None:
@@ -295,19 +352,48 @@ class AREDNCollector(BaseCollector):
             except (ValueError, TypeError):
                 quality = None
 
-        link = {
-            "source": source_node,
-            "target": name,
-            "snr": snr,
-            "noise": noise,
-            "quality": quality,
-            "tx_quality": tx_quality,
-            "rx_quality": rx_quality,
-            "link_type": link_type,
-            "network": "aredn",
-        }
-        # Strip None values
-        return {k: v for k, v in link.items() if v is not None}
+        # Insert only the values that are present (one dict, no strip pass)
+        link: Dict[str, Any] = {}
+        for key, value in (
+            ("source", source_node),
+            ("target", name),
+            ("snr", snr),
+            ("noise", noise),
+            ("quality", quality),
+            ("tx_quality", tx_quality),
+            ("rx_quality", rx_quality),
+            ("link_type", link_type),
+        ):
+            if value is not None:
+                link[key] = value
+        link["network"] = "aredn"
+        return link
+
+    def _publish_topology(self, links: List[Dict[str, Any]],
+                          coords: Dict[str, tuple]) -> None:
+        """Publish a new topology snapshot with a bumped version."""
+        with self._topo_lock:
+            self._topo = _TopoSnapshot(self._topo.version + 1, links, coords)
+
+    @property
+    def topology_version(self) -> int:
+        """Counter that changes whenever a fetch replaces the LQM topology."""
+        return self._topo.version
+
+    @staticmethod
+    def _read_cache_json(path: Path) -> Any:
+        """Parse a (non-empty) cache file in place through a read-only mmap.
+
+        orjson parses straight from the mapped pages, so a multi-MB unified
+        cache is never copied into a bytes object first. Returns None when
+        the file holds no AREDN entries: the unified cache often has none,
+        and there is no point building its whole dict tree to discard it.
+        """
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'"aredn"') == -1:
+                return None
+            with memoryview(mm) as view:
+                return json_loads(view)
 
     def get_topology_links(self) -> List[Dict[str, Any]]:
         """Return AREDN topology links with coordinates resolved.
@@ -316,12 +402,11 @@ class AREDNCollector(BaseCollector):
         known node positions. Links where both endpoints have known
         coordinates are returned with full positioning data.
         """
-        with self._topo_lock:
-            lqm_links = list(self._lqm_links)
-            node_coords = dict(self._node_coords)
+        topo = self._topo  # one atomic load: links and coords always match
+        node_coords = topo.coords
 
         resolved = []
-        for link in lqm_links:
+        for link in topo.links:
             src = link.get("source", "")
             tgt = link.get("target", "")
             src_coords = node_coords.get(src)
@@ -413,40 +498,50 @@ class AREDNCollector(BaseCollector):
 
     def _fetch_from_cache(self) -> List[Dict[str, Any]]:
         """Read MeshForge's AREDN node cache."""
-        features = []
-        if not AREDN_CACHE_PATH.exists():
-            return features
-        try:
-            with open(AREDN_CACHE_PATH, "r") as f:
-                data = json.load(f)
-
-            if data.get("type") == "FeatureCollection":
-                features = [
-                    f
-                    for f in data.get("features", [])
-                    if f.get("properties", {}).get("network") == "aredn"
-                ]
-            logger.debug("AREDN cache returned %d nodes", len(features))
-        except (json.JSONDecodeError, OSError) as e:
-            logger.debug("AREDN cache read failed: %s", e)
-        return features
+        return self._load_cached_features(AREDN_CACHE_PATH, "AREDN cache")
 
     def _fetch_from_unified_cache(self) -> List[Dict[str, Any]]:
         """Read AREDN nodes from MeshForge's unified node cache."""
-        features = []
-        unified_path = UNIFIED_CACHE_PATH
-        if not unified_path.exists():
-            return features
+        return self._load_cached_features(UNIFIED_CACHE_PATH, "Unified cache")
+
+    def _load_cached_features(self, path: Path, label: str) -> List[Dict[str, Any]]:
+        """Return the AREDN features in a MeshForge cache file.
+
+        The parsed list is kept per path and reused while the file's
+        (mtime_ns, size) is unchanged, so a cache file MeshForge rewrites
+        every few minutes is not re-parsed on every collect cycle.
+        Callers must not mutate the returned list.
+        """
         try:
-            with open(unified_path, "r") as f:
-                data = json.load(f)
-            if data.get("type") == "FeatureCollection":
-                features = [
-                    f
-                    for f in data.get("features", [])
-                    if f.get("properties", {}).get("network") == "aredn"
-                ]
-            logger.debug("Unified cache returned %d AREDN nodes", len(features))
-        except (json.JSONDecodeError, OSError) as e:
-            logger.debug("Unified cache read failed: %s", e)
-        return features
+            st = path.stat()  # one syscall answers both "exists?" and "changed?"
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            logger.debug("%s read failed: %s", label, e)
+            return []
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        features: List[Dict[str, Any]] = []
+        try:
+            data = self._read_cache_json(path) if st.st_size else None
+            if isinstance(data, dict) and data.get("type") == "FeatureCollection":
+                append = features.append
+                for f in data.get("features") or ():
+                    # Fail fast on malformed entries; no throwaway {} per miss
+                    props = f.get("properties") if isinstance(f, dict) else None
+                    if isinstance(props, dict) and props.get("network") == "aredn":
+                        # Share one string object per repeated value instead
+                        # of a fresh copy per feature; this list is long-lived.
+                        props["network"] = "aredn"
+                        node_type = props.get("node_type")
+                        if isinstance(node_type, str):
+                            props["node_type"] = sys.intern(node_type)
+                        append(f)
+            self._file_cache[path] = (key, features)
+            logger.debug("%s returned %d AREDN nodes", label, len(features))
+            return features
+        except (ValueError, OSError) as e:
+            logger.debug("%s read failed: %s", label, e)
+            return []
@@ -7,16 +7,24 @@ Each collector outputs standardized GeoJSON FeatureCollections.
 
 import json
 import logging
-import math
+import os
 import re
+import tempfile
 import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
 
 from ..utils.paths import get_data_dir
 from ..utils.reconnect import ReconnectStrategy
 
+# orjson is an optional C-accelerated codec; stdlib json is the fallback.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 # Node IDs must be hex strings, optionally prefixed with '!'
@@ -83,6 +91,35 @@ def bounded_read(resp: Any, max_bytes: int = DEFAULT_MAX_RESPONSE_BYTES) -> byte
     return data
 
 
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize *data* to UTF-8 JSON bytes, via orjson when installed.
+
+    Unserializable values are stringified in both paths, matching the
+    ``json.dumps(..., default=str)`` convention used by the HTTP server.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str).encode("utf-8")
+
+
+def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse JSON from bytes-like or str, via orjson when installed.
+
+    Both paths raise a ``ValueError`` subclass on malformed input. orjson
+    is stricter than stdlib json (no NaN/Infinity literals, no integers
+    beyond 64 bits), which Python-written MeshForge caches can contain, so
+    input it rejects is retried with stdlib json before giving up.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()  # stdlib json only takes bytes/str
+    return json.loads(data)
+
+
 def validate_node_id(node_id: str) -> bool:
     """Validate that a node ID looks like a valid Meshtastic hex ID."""
     return bool(NODE_ID_RE.match(node_id))
@@ -116,13 +153,8 @@ def validate_coordinates(
     except (ValueError, TypeError):
         return None
 
-    # Guard against NaN and Infinity
-    if math.isnan(lat) or math.isnan(lon):
-        return None
-    if math.isinf(lat) or math.isinf(lon):
-        return None
-
-    # Range check
+    # Range check. Also rejects NaN (fails every comparison) and
+    # Infinity (out of range), so no separate isnan/isinf calls.
     if not (-90 <= lat <= 90 and -180 <= lon <= 180):
         return None
 
@@ -134,6 +166,25 @@ def validate_coordinates(
     return (lat, lon)
 
 
+def validate_coordinates_batch(
+    rows: Iterable[Tuple[Hashable, Any, Any]], convert_int: bool = False
+) -> Dict[Hashable, Tuple[float, float]]:
+    """Validate many ``(key, lat, lon)`` rows in one pass.
+
+    Returns ``{key: (lat, lon)}`` for the rows that pass
+    validate_coordinates(); invalid rows are omitted. Lets callers that
+    look the same node up repeatedly (e.g. once per topology edge)
+    validate each node once.
+    """
+    validate = validate_coordinates
+    out: Dict[Hashable, Tuple[float, float]] = {}
+    for key, lat, lon in rows:
+        coords = validate(lat, lon, convert_int)
+        if coords is not None:
+            out[key] = coords
+    return out
+
+
 def normalize_bboxes(bbox: Any) -> Optional[List[List[float]]]:
     """Coerce a REGION_PRESETS bbox value to a list of [s,w,n,e] tuples, or None.
 
@@ -229,6 +280,14 @@ def point_in_region(
     return False
 
 
+# make_feature() emits these optional properties right after the identity
+# keys, in this order, ahead of any other extras.
+_FEATURE_PROP_ORDER = (
+    "is_online", "last_seen", "hardware", "role", "battery",
+    "snr", "rssi", "altitude", "description",
+)
+
+
 def make_feature(
     node_id: str,
     lat: float,
@@ -247,25 +306,18 @@ def make_feature(
         return None
     lat, lon = coords
 
-    properties = {
-        "id": node_id,
-        "name": name or node_id,
-        "network": network,
-        "node_type": node_type,
-        "is_online": extra_props.pop("is_online", None),
-        "last_seen": extra_props.pop("last_seen", None),
-        "hardware": extra_props.pop("hardware", None),
-        "role": extra_props.pop("role", None),
-        "battery": extra_props.pop("battery", None),
-        "snr": extra_props.pop("snr", None),
-        "rssi": extra_props.pop("rssi", None),
-        "altitude": extra_props.pop("altitude", None),
-        "description": extra_props.pop("description", None),
-    }
-    # Add any remaining extra properties
-    properties.update(extra_props)
-    # Strip None values
-    properties = {k: v for k, v in properties.items() if v is not None}
+    # Fixed keys first, then well-known extras in a fixed order, then any
+    # other extras; None values are skipped as they are added.
+    properties = {"id": node_id, "name": name or node_id,
+                  "network": network, "node_type": node_type}
+    pop = extra_props.pop
+    for k in _FEATURE_PROP_ORDER:
+        v = pop(k, None)
+        if v is not None:
+            properties[k] = v
+    for k, v in extra_props.items():
+        if v is not None:
+            properties[k] = v
 
     return {
         "type": "Feature",
@@ -286,20 +338,22 @@ def make_link_feature(
 ) -> Dict[str, Any]:
     """Create a GeoJSON Feature with LineString geometry for a network link.
 
-    Coordinates are (lon, lat) pairs as required by GeoJSON.
+    Coordinates are (lon, lat) pairs as required by GeoJSON. They are kept
+    as tuples (serialized as JSON arrays) so tuple inputs are not copied
+    into fresh lists for every link.
     """
-    properties = {
-        "source": source_id,
-        "target": target_id,
-    }
-    properties.update(extra_props)
-    properties = {k: v for k, v in properties.items() if v is not None}
+    # Same idiom as make_feature(): seed the fixed keys, then add non-None
+    # extras in one pass (no intermediate dict to update() and re-filter).
+    properties = {"source": source_id, "target": target_id}
+    for k, v in extra_props.items():
+        if v is not None:
+            properties[k] = v
 
     return {
         "type": "Feature",
         "geometry": {
             "type": "LineString",
-            "coordinates": [list(source_coords), list(target_coords)],
+            "coordinates": (tuple(source_coords), tuple(target_coords)),
         },
         "properties": properties,
     }
@@ -322,6 +376,22 @@ def make_geometry_feature(
     }
 
 
+# (epoch second, ISO string) of the last formatted timestamp. Replaced as a
+# whole tuple, so concurrent readers never see a mismatched pair.
+_ts_cache: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601, formatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    cached = _ts_cache
+    if cached[0] != now:
+        cached = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+        _ts_cache = cached
+    return cached[1]
+
+
 def make_feature_collection(
     features: List[Dict[str, Any]],
     source: str,
@@ -329,7 +399,7 @@ def make_feature_collection(
 ) -> Dict[str, Any]:
     """Wrap features in a GeoJSON FeatureCollection with metadata."""
     if collected_at is None:
-        collected_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        collected_at = _utc_timestamp()
     return {
         "type": "FeatureCollection",
         "features": features,
@@ -349,21 +419,21 @@ def deduplicate_features(
 
     Features are deduplicated by their ``properties.id`` field. The first
     occurrence of each ID wins. Features without an ID are included
-    unconditionally when *allow_no_id* is True.
+    unconditionally when *allow_no_id* is True, after the ID'd features.
     """
-    result: List[Dict[str, Any]] = []
-    seen_ids: set = set()
+    by_id: Dict[str, Dict[str, Any]] = {}
+    no_id: List[Dict[str, Any]] = []
     for features in feature_lists:
         for feature in features:
             if feature is None:
                 continue
-            fid = feature.get("properties", {}).get("id")
+            fid = (feature.get("properties") or {}).get("id")
             if fid:
-                if fid not in seen_ids:
-                    seen_ids.add(fid)
-                    result.append(feature)
+                by_id.setdefault(fid, feature)
             elif allow_no_id:
-                result.append(feature)
+                no_id.append(feature)
+    result = list(by_id.values())
+    result.extend(no_id)
     return result
 
 
@@ -379,6 +449,11 @@ class BaseCollector(ABC):
     # Maximum age of a persistent cache file to consider valid (4 hours)
     _PERSISTENT_CACHE_MAX_STALENESS = 14400
 
+    # A source that fails every cycle logs its first failure, then at most
+    # once per interval. Every failure still counts in health_info, and the
+    # skipped log lines are counted in errors_suppressed.
+    _ERROR_LOG_INTERVAL = 60.0
+
     def __init__(
         self,
         cache_ttl_seconds: int = 900,
@@ -386,15 +461,27 @@ class BaseCollector(ABC):
         persistent_cache: bool = False,
     ):
         self._cache_lock = threading.Lock()
+        # Held while a fetch (with retries) is in flight; see collect()
+        self._fetch_lock = threading.Lock()
         self._cache: Optional[Dict[str, Any]] = None
-        self._cache_time: float = 0
+        self._cache_time: float = float("-inf")  # time.monotonic() of last store
         self._cache_ttl = cache_ttl_seconds
         self._max_retries = max_retries
+        # Retry budget is fixed at construction, so the backoff schedule is too;
+        # collect() only adds jitter per attempt.
+        self._retry_strategy = ReconnectStrategy.for_collector()
+        self._retry_delays = self._retry_strategy.schedule(max_retries)
         self._last_error: Optional[str] = None
         self._last_error_time: float = 0
         self._last_success_time: float = 0
         self._total_collections: int = 0
         self._total_errors: int = 0
+        # Failure-log gate (see report_failure): monotonic time of the last
+        # logged failure, failures skipped since then, and skipped in total.
+        self._error_log_lock = threading.Lock()
+        self._error_log_time: float = float("-inf")
+        self._errors_pending: int = 0
+        self._errors_suppressed: int = 0
         self._persistent_cache = persistent_cache
         self._persistent_cache_path = (
             get_data_dir() / "cache" / f"{self.source_name}.json"
@@ -414,30 +501,45 @@ class BaseCollector(ABC):
                     "%s: persistent cache too stale (%.0fs)", self.source_name, age,
                 )
                 return
-            with open(path, "r") as f:
-                data = json.load(f)
+            data = json_loads(path.read_bytes())
             if not isinstance(data, dict) or data.get("type") != "FeatureCollection":
                 logger.debug("%s: invalid persistent cache format", self.source_name)
                 return
             with self._cache_lock:
                 if self._cache is None:
                     self._cache = data
-                    self._cache_time = path.stat().st_mtime
+                    # Carry the file's age over to the monotonic clock
+                    self._cache_time = time.monotonic() - age
                     logger.info(
                         "%s: loaded persistent cache (%d features, %.0fs old)",
                         self.source_name,
                         len(data.get("features", [])),
                         age,
                     )
-        except (json.JSONDecodeError, OSError, ValueError) as e:
+        except (OSError, ValueError) as e:
             logger.debug("%s: persistent cache load failed: %s", self.source_name, e)
 
     def _save_persistent_cache(self, data: Dict[str, Any]) -> None:
-        """Write cache data to disk for persistence across restarts."""
+        """Write cache data to disk for persistence across restarts.
+
+        Written to a temp file and renamed over the old one, so a crash or a
+        concurrent startup never sees a half-written cache.
+        """
+        path = self._persistent_cache_path
         try:
-            self._persistent_cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._persistent_cache_path, "w") as f:
-                json.dump(data, f, default=str)
+            raw = json_dumps_bytes(data)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{self.source_name}_", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(raw)
+                os.replace(tmp_path, str(path))
+            except OSError:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
         except (OSError, TypeError) as e:
             logger.debug("%s: persistent cache save failed: %s", self.source_name, e)
 
@@ -445,24 +547,48 @@ class BaseCollector(ABC):
         """Collect data, using cache if fresh enough.
 
         Retries with exponential backoff before falling back to stale cache.
+        Only one fetch runs at a time: concurrent callers get the stale
+        cache if there is one, otherwise they wait for the in-flight fetch.
         """
-        now = time.time()
+        fresh = self._fresh_cache()
+        if fresh is not None:
+            logger.debug("%s: returning cached data", self.source_name)
+            return fresh
+
+        if not self._fetch_lock.acquire(blocking=False):
+            with self._cache_lock:
+                if self._cache:
+                    return self._cache
+            self._fetch_lock.acquire()
+        try:
+            # The fetch we waited on (or raced with) may have refreshed it
+            fresh = self._fresh_cache()
+            if fresh is not None:
+                return fresh
+            return self._collect_with_retries()
+        finally:
+            self._fetch_lock.release()
+
+    def _fresh_cache(self) -> Optional[Dict[str, Any]]:
+        """Return the cached data if it is within the TTL, else None."""
+        now = time.monotonic()
         with self._cache_lock:
             if self._cache and (now - self._cache_time) < self._cache_ttl:
-                logger.debug("%s: returning cached data", self.source_name)
                 return self._cache
+        return None
 
-        # Retry loop with backoff (single strategy instance preserves escalating delays)
+    def _collect_with_retries(self) -> Dict[str, Any]:
+        """Run _fetch() with retries; called with _fetch_lock held."""
+        # Retry loop with backoff (escalating delays precomputed in __init__)
         last_error: Optional[Exception] = None
         attempts = 1 + self._max_retries
-        strategy = ReconnectStrategy.for_collector()
 
         for attempt in range(attempts):
             try:
                 data = self._fetch()
                 with self._cache_lock:
                     self._cache = data
-                    self._cache_time = time.time()
+                    self._cache_time = time.monotonic()
                 self._last_success_time = time.time()
                 self._total_collections += 1
                 if self._persistent_cache:
@@ -483,7 +609,7 @@ class BaseCollector(ABC):
             except Exception as e:
                 last_error = e
                 if attempt < self._max_retries:
-                    delay = strategy.next_delay()
+                    delay = self._retry_strategy.jittered(self._retry_delays[attempt])
                     logger.debug(
                         "%s: attempt %d failed (%s), retrying in %.1fs",
                         self.source_name,
@@ -497,13 +623,40 @@ class BaseCollector(ABC):
         self._last_error = str(last_error) if last_error else "unknown error"
         self._last_error_time = time.time()
         self._total_errors += 1
-        logger.error("%s: collection failed: %s", self.source_name, last_error)
+        self.report_failure(last_error)
         with self._cache_lock:
             if self._cache:
                 logger.warning("%s: returning stale cache", self.source_name)
                 return self._cache
         return make_feature_collection([], self.source_name)
 
+    def report_failure(self, error: Any) -> None:
+        """Log a collection failure, at most once per _ERROR_LOG_INTERVAL.
+
+        The single failure-log gate for a source: collect() reports its
+        exhausted retries here, and DataAggregator reports exceptions that
+        escape collect(). Failures skipped in between are named in the next
+        line that is logged and counted in errors_suppressed.
+        """
+        now = time.monotonic()
+        with self._error_log_lock:
+            if now - self._error_log_time < self._ERROR_LOG_INTERVAL:
+                self._errors_pending += 1
+                self._errors_suppressed += 1
+                return
+            pending, self._errors_pending = self._errors_pending, 0
+            self._error_log_time = now
+        if pending:
+            logger.error("%s: collection failed: %s (%d similar failures suppressed)",
+                         self.source_name, error, pending)
+        else:
+            logger.error("%s: collection failed: %s", self.source_name, error)
+
+    @property
+    def errors_suppressed(self) -> int:
+        """Total failure log lines skipped by report_failure() so far."""
+        return self._errors_suppressed
+
     @abstractmethod
     def _fetch(self) -> Dict[str, Any]:
         """Fetch fresh data from the source. Returns a GeoJSON FeatureCollection."""
@@ -519,6 +672,7 @@ class BaseCollector(ABC):
             "source": self.source_name,
             "total_collections": self._total_collections,
             "total_errors": self._total_errors,
+            "errors_suppressed": self._errors_suppressed,
             "has_cache": has_cache,
         }
         if self._last_success_time:
@@ -536,4 +690,4 @@ class BaseCollector(ABC):
     def clear_cache(self) -> None:
         with self._cache_lock:
             self._cache = None
-            self._cache_time = 0
+            self._cache_time = float("-inf")
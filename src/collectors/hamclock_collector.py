@@ -22,19 +22,18 @@ Original HamClock (WB0OEW): ceases operation June 2026.
 OpenHamClock: https://github.com/accius/openhamclock (MIT, port 3000).
 """
 
-import json
 import logging
 import math
 import re
 import threading
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.error import HTTPError, URLError
 
-from .base import BaseCollector, bounded_read, make_feature_collection
+from .base import BaseCollector, _utc_timestamp, json_loads, make_feature_collection
 from .. import __version__
+from ..utils.http_pool import KeepAlivePool
 from ..utils.openhamclock_compat import (
     detect_variant,
     get_endpoint_map,
@@ -46,21 +45,130 @@ logger = logging.getLogger(__name__)
 
 # User-Agent string for HTTP requests
 _USER_AGENT = f"MeshForge-Maps/{__version__}"
+_TEXT_HEADERS = {"User-Agent": _USER_AGENT}
+_JSON_HEADERS = {"Accept": "application/json", "User-Agent": _USER_AGENT}
 
 # NOAA SWPC endpoints (fallback when HamClock is unavailable)
 SWPC_SOLAR_FLUX = "https://services.swpc.noaa.gov/products/summary/10cm-flux.json"
 SWPC_KP_INDEX = "https://services.swpc.noaa.gov/products/noaa-planetary-k-index.json"
 SWPC_SOLAR_WIND = "https://services.swpc.noaa.gov/products/summary/solar-wind-speed.json"
 
+# Approximate solar declination (degrees) by day of year, index 1..366.
+# It only changes daily, so the table replaces a cos() per collection.
+_DECLINATION_BY_DOY = tuple(
+    -23.44 * math.cos(math.radians(360 / 365 * (doy + 10)))
+    for doy in range(367)
+)
+
+
+def _isoformat_utc(tm: time.struct_time, micros: int) -> str:
+    """Format like datetime.isoformat() on an aware UTC datetime.
+
+    Keeps the API-visible shape (microseconds only when non-zero, "+00:00"
+    suffix) without building a datetime for every collection.
+    """
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", tm)
+    if micros:
+        return f"{stamp}.{micros:06d}+00:00"
+    return f"{stamp}+00:00"
+
+
+# Plain decimal number as found in SWPC JSON string fields ("2.33", "-1")
+_NUMBER_RE = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*$")
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Convert a numeric SWPC field to float, or None if not a number.
+
+    Checks the type/shape first instead of relying on float() raising,
+    and rejects NaN/Infinity spellings that float() would accept.
+    """
+    if isinstance(value, (int, float)):
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, str) and _NUMBER_RE.match(value):
+        return float(value)
+    return None
+
+
+def _latest_solar_flux(data: Any) -> Optional[float]:
+    """Latest 10.7cm (2800 MHz) solar flux from the SWPC summary feed."""
+    if data and isinstance(data, list):
+        latest = data[-1]
+        if isinstance(latest, dict):
+            return _as_float(latest.get("flux", 0))
+    return None
+
+
+def _latest_kp_index(data: Any) -> Optional[float]:
+    """Latest planetary K-index; rows are dicts or [time_tag, Kp, ...] lists."""
+    if data and isinstance(data, list):
+        latest = data[-1]
+        if isinstance(latest, dict):
+            return _as_float(latest.get("Kp", 0))
+        if isinstance(latest, list) and len(latest) >= 2:
+            return _as_float(latest[1])
+    return None
+
+
+def _latest_solar_wind(data: Any) -> Optional[float]:
+    """Latest solar wind proton speed from the SWPC summary feed."""
+    if data and isinstance(data, list):
+        latest = data[-1]
+        if isinstance(latest, dict):
+            return _as_float(latest.get("proton_speed", 0))
+    return None
+
+
+# SWPC fallback fields: (weather key, feed URL, reuse seconds, parser).
+# The feeds update at very different rates (flux a few times a day, Kp
+# every 3h, solar wind every minute), so each value is reused for its
+# own TTL instead of refetching all three every collection.
+_SWPC_FIELDS = (
+    ("solar_flux", SWPC_SOLAR_FLUX, 3600, _latest_solar_flux),
+    ("kp_index", SWPC_KP_INDEX, 1800, _latest_kp_index),
+    ("solar_wind_speed", SWPC_SOLAR_WIND, 60, _latest_solar_wind),
+)
+
+
+# HamClock get_spacewx.txt key (lowercased) -> standard weather field.
+# HamClock returns keys like: SFI, Kp, A, Xray, SSN, Proton, Aurora
+_SPACEWX_STANDARD_KEYS = {
+    alias: standard
+    for standard, aliases in (
+        ("solar_flux", ("sfi", "flux")),
+        ("kp_index", ("kp",)),
+        ("a_index", ("a", "a_index")),
+        ("xray_flux", ("xray", "x-ray")),
+        ("ssn", ("ssn", "sunspot", "sunspots")),
+        ("proton_flux", ("proton", "pf")),
+        ("aurora", ("aurora", "aur")),
+    )
+    for alias in aliases
+}
+
+
+def _iter_key_values(data: str) -> Iterator[Tuple[str, str]]:
+    """Yield stripped (key, value) pairs from HamClock key=value text."""
+    for line in data.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            yield key.strip(), value.strip()
+
 
 def _parse_key_value(data: str) -> Dict[str, str]:
     """Parse HamClock key=value text response into a dict."""
-    result = {}
-    for line in data.strip().split("\n"):
-        if "=" in line:
-            key, value = line.split("=", 1)
-            result[key.strip()] = value.strip()
-    return result
+    return dict(_iter_key_values(data))
+
+
+# get_bc.txt band number -> band-pair label. The lookbehind keeps "140"
+# from matching "40" and "100" from matching "10".
+_BAND_RE = re.compile(r"(?<!\d)(80|40|30|20|17|15|12|10)m?\b", re.IGNORECASE)
+_BAND_GROUPS = {
+    "80": "80m-40m", "40": "80m-40m",
+    "30": "30m-20m", "20": "30m-20m",
+    "17": "17m-15m", "15": "17m-15m",
+    "12": "12m-10m", "10": "12m-10m",
+}
 
 
 def _is_hamclock_sys_response(raw: Optional[str]) -> bool:
@@ -98,6 +206,9 @@ class HamClockCollector(BaseCollector):
     # OpenHamClock default port (community successor, MIT license)
     OPENHAMCLOCK_DEFAULT_PORT = 3000
 
+    # Concurrent GETs per cycle: six OpenHamClock endpoints or three SWPC feeds
+    _MAX_FETCH_WORKERS = 6
+
     def __init__(
         self,
         hamclock_host: str = "localhost",
@@ -105,8 +216,9 @@ class HamClockCollector(BaseCollector):
         openhamclock_port: int = OPENHAMCLOCK_DEFAULT_PORT,
         cache_ttl_seconds: int = 900,
         max_retries: int = 0,
+        persistent_cache: bool = False,
     ):
-        super().__init__(cache_ttl_seconds, max_retries=max_retries)
+        super().__init__(cache_ttl_seconds, max_retries=max_retries, persistent_cache=persistent_cache)
         self._hamclock_host = hamclock_host
         self._hamclock_port = hamclock_port
         self._openhamclock_port = openhamclock_port
@@ -117,6 +229,23 @@ class HamClockCollector(BaseCollector):
         # Endpoint map (updated when variant is detected)
         self._endpoints = get_endpoint_map("hamclock")
         self._detection_lock = threading.Lock()
+        # Independent GETs within a cycle run concurrently, so a cycle
+        # costs about one round trip instead of one per endpoint.
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=self._MAX_FETCH_WORKERS, thread_name_prefix="hamclock-fetch",
+        )
+        # Keep-alive connections to HamClock and SWPC, reused every cycle
+        # instead of a new TCP (and TLS) handshake per request.
+        self._http = KeepAlivePool(max_idle_per_host=self._MAX_FETCH_WORKERS)
+        # weather key -> (time.monotonic() expiry, value); see _SWPC_FIELDS
+        self._swpc_cache: Dict[str, Tuple[float, float]] = {}
+        # url -> (ETag, parsed body) for conditional GETs in _fetch_json()
+        self._etags: Dict[str, Tuple[str, Any]] = {}
+
+    def close(self) -> None:
+        """Stop the fetch workers and release pooled connections."""
+        self._fetch_pool.shutdown(wait=False)
+        self._http.close()
 
     # ==================== Public API ====================
 
@@ -174,12 +303,22 @@ class HamClockCollector(BaseCollector):
         hamclock_up = self.is_hamclock_available()
 
         if hamclock_up:
-            space_weather = self._fetch_space_weather_hamclock()
-            band_conditions = self._fetch_band_conditions_hamclock()
-            voacap = self._fetch_voacap()
-            de_info = self._fetch_de()
-            dx_info = self._fetch_dx()
-            dxspots = self._fetch_dxspots()
+            fetchers = (
+                self._fetch_space_weather_hamclock,
+                self._fetch_band_conditions_hamclock,
+                self._fetch_voacap,
+                self._fetch_de,
+                self._fetch_dx,
+                self._fetch_dxspots,
+            )
+            if self._detected_variant == "openhamclock":
+                # OpenHamClock (Node.js) serves requests concurrently. The
+                # legacy HamClock web server handles one client at a time,
+                # so parallel requests there would only queue.
+                results = list(self._fetch_pool.map(lambda fetch: fetch(), fetchers))
+            else:
+                results = [fetch() for fetch in fetchers]
+            space_weather, band_conditions, voacap, de_info, dx_info, dxspots = results
         else:
             space_weather = self._fetch_space_weather_noaa()
             band_conditions = None
@@ -234,7 +373,7 @@ class HamClockCollector(BaseCollector):
         source_label = "OpenHamClock API" if self._detected_variant == "openhamclock" else "HamClock API"
         weather: Dict[str, Any] = {
             "source": source_label,
-            "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "fetched_at": _utc_timestamp(),
         }
 
         endpoint = self._endpoints.get("spacewx", "/get_spacewx.txt")
@@ -244,23 +383,12 @@ class HamClockCollector(BaseCollector):
 
         parsed = normalize_spacewx(_parse_key_value(raw))
 
-        # Map HamClock response keys to standard names
-        # HamClock returns keys like: SFI, Kp, A, Xray, SSN, Proton, Aurora
-        key_map = {
-            "solar_flux": ["sfi", "flux"],
-            "kp_index": ["kp"],
-            "a_index": ["a", "a_index"],
-            "xray_flux": ["xray", "x-ray"],
-            "ssn": ["ssn", "sunspot", "sunspots"],
-            "proton_flux": ["proton", "pf"],
-            "aurora": ["aurora", "aur"],
-        }
-
-        for standard_key, possible_keys in key_map.items():
-            for raw_key, value in parsed.items():
-                if raw_key.lower() in possible_keys:
-                    weather[standard_key] = value
-                    break
+        # Map response keys to standard names; the first key seen for a
+        # standard name wins.
+        for raw_key, value in parsed.items():
+            standard_key = _SPACEWX_STANDARD_KEYS.get(raw_key.lower())
+            if standard_key is not None and standard_key not in weather:
+                weather[standard_key] = value
 
         # Derive band conditions from Kp + SFI
         weather["band_conditions"] = self._assess_band_conditions(
@@ -279,23 +407,10 @@ class HamClockCollector(BaseCollector):
         parsed = _parse_key_value(raw)
         bands: Dict[str, str] = {}
 
-        # Use negative lookbehind to avoid false positives
-        # (e.g., "140" matching "40", "100" matching "10")
-        _band_re = re.compile(r'(?<!\d)(80|40|30|20|17|15|12|10)m?\b', re.IGNORECASE)
-
         for key, value in parsed.items():
-            match = _band_re.search(key)
-            if not match:
-                continue
-            band_num = match.group(1)
-            if band_num in ("80", "40"):
-                bands["80m-40m"] = value
-            elif band_num in ("30", "20"):
-                bands["30m-20m"] = value
-            elif band_num in ("17", "15"):
-                bands["17m-15m"] = value
-            elif band_num in ("12", "10"):
-                bands["12m-10m"] = value
+            match = _BAND_RE.search(key)
+            if match:
+                bands[_BAND_GROUPS[match.group(1)]] = value
 
         return {"bands": bands, "raw": parsed} if bands else None
 
@@ -307,45 +422,35 @@ class HamClockCollector(BaseCollector):
             return None
 
         voacap: Dict[str, Any] = {"path": "", "utc": "", "bands": {}}
+        bands = voacap["bands"]
+        # Best band is tracked while parsing (first band with the highest
+        # reliability wins) rather than in a second sweep.
+        best_band = None
+        best_rel = 0
 
-        for line in raw.strip().split("\n"):
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip().lower()
-            value = value.strip()
-
+        for key, value in _iter_key_values(raw):
+            key = key.lower()
             if key == "path":
                 voacap["path"] = value
             elif key == "utc":
                 voacap["utc"] = value
             elif "m" in key:
                 # Band data: "80m=23,12" -> reliability=23%, SNR=12dB
+                rel_text, comma, snr_text = value.partition(",")
                 try:
-                    if "," in value:
-                        rel, snr = value.split(",", 1)
-                        voacap["bands"][key] = {
-                            "reliability": int(rel.strip()),
-                            "snr": int(snr.strip()),
-                            "status": self._reliability_to_status(int(rel.strip())),
-                        }
-                    else:
-                        rel = int(value)
-                        voacap["bands"][key] = {
-                            "reliability": rel,
-                            "snr": 0,
-                            "status": self._reliability_to_status(rel),
-                        }
+                    rel = int(rel_text)
+                    snr = int(snr_text) if comma else 0
                 except ValueError:
                     logger.debug("Could not parse VOACAP band %s: %s", key, value)
-
-        # Calculate best band
-        best_band = None
-        best_rel = 0
-        for band, data in voacap["bands"].items():
-            if data["reliability"] > best_rel:
-                best_rel = data["reliability"]
-                best_band = band
+                    continue
+                bands[key] = {
+                    "reliability": rel,
+                    "snr": snr,
+                    "status": self._reliability_to_status(rel),
+                }
+                if rel > best_rel:
+                    best_rel = rel
+                    best_band = key
         voacap["best_band"] = best_band
         voacap["best_reliability"] = best_rel
 
@@ -353,21 +458,15 @@ class HamClockCollector(BaseCollector):
 
     def _fetch_de(self) -> Optional[Dict[str, str]]:
         """Fetch home (DE) location from HamClock (get_de.txt)."""
-        endpoint = self._endpoints.get("de", "/get_de.txt")
-        raw = self._fetch_text(f"{self._hamclock_api}{endpoint}")
-        if not raw:
-            return None
-        parsed = normalize_de_dx(_parse_key_value(raw))
-        return {
-            "lat": parsed.get("lat", ""),
-            "lon": parsed.get("lng", parsed.get("lon", "")),
-            "grid": parsed.get("grid", ""),
-            "call": parsed.get("call", ""),
-        }
+        return self._fetch_location("de")
 
     def _fetch_dx(self) -> Optional[Dict[str, str]]:
         """Fetch target (DX) location from HamClock (get_dx.txt)."""
-        endpoint = self._endpoints.get("dx", "/get_dx.txt")
+        return self._fetch_location("dx")
+
+    def _fetch_location(self, kind: str) -> Optional[Dict[str, str]]:
+        """Fetch and normalize a DE or DX location (get_<kind>.txt)."""
+        endpoint = self._endpoints.get(kind, f"/get_{kind}.txt")
         raw = self._fetch_text(f"{self._hamclock_api}{endpoint}")
         if not raw:
             return None
@@ -391,23 +490,16 @@ class HamClockCollector(BaseCollector):
             return None
 
         spots: list = []
-        for line in raw.strip().split("\n"):
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip().lower()
-            value = value.strip()
-
+        for key, value in _iter_key_values(raw):
             # DX spots come as indexed entries: Spot0=call freq de utc ...
-            if key.startswith("spot"):
+            if key.lower().startswith("spot"):
                 parts = value.split()
                 if len(parts) >= 3:
                     spot: Dict[str, Any] = {
                         "dx_call": parts[0],
                         "freq_khz": parts[1],
+                        "de_call": parts[2],
                     }
-                    if len(parts) >= 3:
-                        spot["de_call"] = parts[2]
                     if len(parts) >= 4:
                         spot["utc"] = parts[3]
                     if len(parts) >= 5:
@@ -457,40 +549,26 @@ class HamClockCollector(BaseCollector):
             "solar_wind_speed": None,
             "band_conditions": "unknown",
             "source": "NOAA SWPC",
-            "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "fetched_at": _utc_timestamp(),
         }
 
-        # Solar flux (10.7cm / 2800 MHz)
-        sfi = self._fetch_json(SWPC_SOLAR_FLUX)
-        if sfi and isinstance(sfi, list) and len(sfi) > 0:
-            latest = sfi[-1]
-            if isinstance(latest, dict):
-                try:
-                    weather["solar_flux"] = float(latest.get("flux", 0))
-                except (ValueError, TypeError):
-                    pass
-
-        # Planetary K-index
-        kp = self._fetch_json(SWPC_KP_INDEX)
-        if kp and isinstance(kp, list) and len(kp) > 0:
-            latest = kp[-1]
-            try:
-                if isinstance(latest, dict):
-                    weather["kp_index"] = float(latest.get("Kp", 0))
-                elif isinstance(latest, list) and len(latest) >= 2:
-                    weather["kp_index"] = float(latest[1])
-            except (ValueError, TypeError):
-                pass
-
-        # Solar wind speed
-        sw = self._fetch_json(SWPC_SOLAR_WIND)
-        if sw and isinstance(sw, list) and len(sw) > 0:
-            latest = sw[-1]
-            if isinstance(latest, dict):
-                try:
-                    weather["solar_wind_speed"] = float(latest.get("proton_speed", 0))
-                except (ValueError, TypeError):
-                    pass
+        # Refetch only the fields whose TTL ran out, concurrently. A failed
+        # or unparsable feed is not cached, so it is retried next cycle.
+        now = time.monotonic()
+        cache = self._swpc_cache
+        due = [f for f in _SWPC_FIELDS if cache.get(f[0], (now,))[0] <= now]
+        if due:
+            bodies = self._fetch_pool.map(self._fetch_json, [f[1] for f in due])
+            for (key, _url, ttl, parse), body in zip(due, bodies):
+                value = parse(body)
+                if value is None:
+                    cache.pop(key, None)
+                else:
+                    cache[key] = (now + ttl, value)
+        for key, _url, _ttl, _parse in _SWPC_FIELDS:
+            entry = cache.get(key)
+            if entry is not None:
+                weather[key] = entry[1]
 
         # Derive band conditions
         weather["band_conditions"] = self._assess_band_conditions(
@@ -503,12 +581,8 @@ class HamClockCollector(BaseCollector):
 
     def _assess_band_conditions(self, sfi: Any, kp: Any) -> str:
         """Simple band condition assessment from SFI and Kp."""
-        try:
-            sfi_val = float(sfi) if sfi else None
-            kp_val = float(kp) if kp else None
-        except (ValueError, TypeError):
-            return "unknown"
-
+        sfi_val = _as_float(sfi) if sfi else None
+        kp_val = _as_float(kp) if kp else None
         if sfi_val is None or kp_val is None:
             return "unknown"
 
@@ -543,53 +617,58 @@ class HamClockCollector(BaseCollector):
         Returns the subsolar point and terminator metadata.
         The actual terminator line rendering happens client-side.
         """
-        now = datetime.now(timezone.utc)
-        day_of_year = now.timetuple().tm_yday
-        hour_utc = now.hour + now.minute / 60.0
-
-        # Solar declination (approximate)
-        declination = -23.44 * math.cos(
-            math.radians(360 / 365 * (day_of_year + 10))
-        )
-
-        # Subsolar longitude (moves 15 deg/hour westward from noon)
+        # One clock reading, split like datetime.fromtimestamp() does
+        frac, secs = math.modf(time.time())
+        micros = round(frac * 1e6)
+        if micros >= 1_000_000:
+            secs += 1
+            micros -= 1_000_000
+        now = time.gmtime(secs)
+        hour_utc = now.tm_hour + now.tm_min / 60.0
+
+        declination = _DECLINATION_BY_DOY[now.tm_yday]
+
+        # Subsolar longitude (moves 15 deg/hour westward from noon). With
+        # 0 <= hour_utc < 24 this already lies in (-180, 180]; no wrap.
         subsolar_lon = (12.0 - hour_utc) * 15.0
-        if subsolar_lon > 180:
-            subsolar_lon -= 360
-        elif subsolar_lon < -180:
-            subsolar_lon += 360
 
         return {
             "subsolar_lat": declination,
             "subsolar_lon": subsolar_lon,
-            "timestamp": now.isoformat(),
+            "timestamp": _isoformat_utc(now, micros),
         }
 
     def _fetch_text(self, url: str) -> Optional[str]:
         """Fetch raw text from a URL with timeout."""
         try:
-            req = Request(
-                url,
-                headers={"User-Agent": _USER_AGENT},
-            )
-            with urlopen(req, timeout=10) as resp:
-                return bounded_read(resp).decode("utf-8")
+            body = self._http.get(url, headers=_TEXT_HEADERS, timeout=10)
+            return body.decode("utf-8")
         except (URLError, OSError, ValueError) as e:
             logger.debug("Failed to fetch %s: %s", url, e)
             return None
 
     def _fetch_json(self, url: str) -> Any:
-        """Fetch JSON from a URL with timeout."""
+        """Fetch JSON from a URL with timeout.
+
+        Revalidates with If-None-Match when the last response carried an
+        ETag; a 304 returns the previously parsed body without a download.
+        """
+        cached = self._etags.get(url)
+        headers = _JSON_HEADERS if cached is None else {**_JSON_HEADERS, "If-None-Match": cached[0]}
         try:
-            req = Request(
-                url,
-                headers={
-                    "Accept": "application/json",
-                    "User-Agent": _USER_AGENT,
-                },
-            )
-            with urlopen(req, timeout=10) as resp:
-                return json.loads(bounded_read(resp).decode())
-        except (URLError, OSError, json.JSONDecodeError, ValueError) as e:
+            body, resp_headers = self._http.get_with_headers(url, headers=headers, timeout=10)
+            data = json_loads(body)
+        except HTTPError as e:
+            if e.code == 304 and cached is not None:
+                return cached[1]
             logger.debug("Failed to fetch %s: %s", url, e)
             return None
+        except (URLError, OSError, ValueError) as e:
+            logger.debug("Failed to fetch %s: %s", url, e)
+            return None
+        etag = resp_headers.get("ETag")
+        if etag:
+            self._etags[url] = (etag, data)
+        else:
+            self._etags.pop(url, None)
+        return data
@@ -38,6 +38,7 @@ from .base import (
     NODE_ID_RE,
     BaseCollector,
     is_node_online,
+    json_loads,
     make_feature,
     make_feature_collection,
 )
@@ -97,8 +98,8 @@ class MeshClientCollector(BaseCollector):
             return self._empty()
 
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = json_loads(f.read())
         except (json.JSONDecodeError, OSError, ValueError, UnicodeDecodeError) as e:
             logger.warning("mesh_client: failed to read/parse %s: %s", path, e)
             return self._empty()
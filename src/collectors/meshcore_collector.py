@@ -24,6 +24,7 @@ from .base import (
     BaseCollector,
     bounded_read,
     is_node_online,
+    json_loads,
     make_feature,
     make_feature_collection,
     point_in_region,
@@ -59,10 +60,11 @@ class MeshCoreCollector(BaseCollector):
         enable_map: bool = True,
         cache_ttl_seconds: int = 1800,
         max_retries: int = 0,
+        persistent_cache: bool = False,
         region_bboxes: Optional[List[List[float]]] = None,
         region_polygons: Optional[List[List[List[float]]]] = None,
     ):
-        super().__init__(cache_ttl_seconds, max_retries=max_retries)
+        super().__init__(cache_ttl_seconds, max_retries=max_retries, persistent_cache=persistent_cache)
         self._enable_map = enable_map
         self._region_bboxes = region_bboxes
         self._region_polygons = region_polygons
@@ -86,7 +88,7 @@ class MeshCoreCollector(BaseCollector):
             )
             with urlopen(req, timeout=30) as resp:
                 # API may redirect (307 .dev -> .io), urlopen follows by default for GET
-                data = json.loads(
+                data = json_loads(
                     bounded_read(resp, max_bytes=MESHCORE_MAX_RESPONSE_BYTES)
                     .decode("utf-8", errors="replace")
                 )
@@ -11,14 +11,13 @@ Meshtastic nodes broadcast: POSITION_APP, NODEINFO_APP, NEIGHBORINFO_APP,
 TELEMETRY_APP, TRACEROUTE_APP via protobuf over MQTT.
 """
 
-import json
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.error import URLError
 from urllib.request import Request, urlopen
 
-from .base import MESHFORGE_DATA_DIR, BaseCollector, bounded_read, is_node_online, make_feature, make_feature_collection, validate_coordinates
+from .base import MESHFORGE_DATA_DIR, BaseCollector, bounded_read, deduplicate_features, is_node_online, json_loads, make_feature, make_feature_collection, validate_coordinates
 from ..utils.connection_manager import ConnectionManager
 
 logger = logging.getLogger(__name__)
@@ -60,49 +59,72 @@ class MeshtasticCollector(BaseCollector):
         self._connection_timeout = connection_timeout
         # "auto" = API → MQTT → cache; "mqtt_only" = skip API; "local_only" = API only
         self._source_mode = source_mode
+        # (api, mqtt cache file, meshmap) features from the last _fetch()
+        self._polled_sources: Optional[Tuple[List[Dict[str, Any]], ...]] = None
+        # ((mtime_ns, size), features) of the last parsed mqtt_nodes.json
+        self._mqtt_cache_file: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
 
     def _fetch(self) -> Dict[str, Any]:
-        features: List[Dict[str, Any]] = []
-        seen_ids: set = set()
+        api_nodes: List[Dict[str, Any]] = []
+        live_nodes: List[Dict[str, Any]] = []
+        mqtt_nodes: List[Dict[str, Any]] = []
+        meshmap_nodes: List[Dict[str, Any]] = []
 
         # Source 1: Local meshtasticd HTTP API (skipped in mqtt_only mode)
         if self._source_mode != "mqtt_only":
             api_nodes = self._fetch_from_api()
-            for f in api_nodes:
-                fid = f["properties"].get("id")
-                if fid and fid not in seen_ids:
-                    seen_ids.add(fid)
-                    features.append(f)
 
-        # Source 2: Live MQTT subscriber (real-time nodes) (skipped in local_only mode)
         if self._source_mode != "local_only":
+            # Source 2: Live MQTT subscriber (real-time nodes)
             live_nodes = self._fetch_from_live_mqtt()
-            for f in live_nodes:
-                fid = f["properties"].get("id")
-                if fid and fid not in seen_ids:
-                    seen_ids.add(fid)
-                    features.append(f)
-
-        # Source 3: MQTT subscriber cache file (skipped in local_only mode)
-        if self._source_mode != "local_only":
+            # Source 3: MQTT subscriber cache file
             mqtt_nodes = self._fetch_from_mqtt_cache()
-            for f in mqtt_nodes:
-                fid = f["properties"].get("id")
-                if fid and fid not in seen_ids:
-                    seen_ids.add(fid)
-                    features.append(f)
-
-        # Source 4: meshmap.net public API (skipped in local_only mode)
-        if self._source_mode != "local_only":
+            # Source 4: meshmap.net public API
             meshmap_nodes = self._fetch_from_meshmap()
-            for f in meshmap_nodes:
-                fid = f["properties"].get("id")
-                if fid and fid not in seen_ids:
-                    seen_ids.add(fid)
-                    features.append(f)
 
+        # Keep the polled sources so refresh_live() can re-merge fresh MQTT
+        # nodes between TTL expiries without hitting the network again.
+        self._polled_sources = (api_nodes, mqtt_nodes, meshmap_nodes)
+        return self._merge_sources(api_nodes, live_nodes, mqtt_nodes, meshmap_nodes)
+
+    def _merge_sources(self, *sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge per-source feature lists in priority order (first id wins)."""
+        features = deduplicate_features(list(sources), allow_no_id=False)
         return make_feature_collection(features, self.source_name)
 
+    def refresh_live(self) -> Dict[str, Any]:
+        """Re-merge live MQTT nodes into the cached collection.
+
+        Called when the event bus reports MQTT node updates. The polled
+        sources (API, cache file, meshmap.net) are reused from the last
+        fetch, and the cache timestamp is left alone so the TTL still
+        governs when they are refetched. Falls back to collect() when
+        there is no fresh cache to merge into.
+        """
+        # Hold _fetch_lock so a concurrent collect() can't store newer polled
+        # sources that this merge, built from the older tuple, would then
+        # overwrite. If a fetch is running, its result supersedes ours.
+        if not self._fetch_lock.acquire(blocking=False):
+            with self._cache_lock:
+                cached = self._cache
+            return cached if cached is not None else self.collect()
+        try:
+            now = time.monotonic()
+            with self._cache_lock:
+                fresh = self._cache is not None and (now - self._cache_time) < self._cache_ttl
+            polled = self._polled_sources
+            if fresh and polled is not None and self._source_mode != "local_only":
+                api_nodes, mqtt_nodes, meshmap_nodes = polled
+                data = self._merge_sources(
+                    api_nodes, self._fetch_from_live_mqtt(), mqtt_nodes, meshmap_nodes,
+                )
+                with self._cache_lock:
+                    self._cache = data
+                return data
+        finally:
+            self._fetch_lock.release()
+        return self.collect()
+
     def _fetch_from_api(self) -> List[Dict[str, Any]]:
         """Fetch from local meshtasticd HTTP API.
 
@@ -138,17 +160,15 @@ class MeshtasticCollector(BaseCollector):
                     try:
                         req = Request(url, headers={"Accept": "application/json"})
                         with urlopen(req, timeout=http_timeout) as resp:
-                            data = json.loads(bounded_read(resp).decode())
+                            data = json_loads(bounded_read(resp))
 
                         nodes = data if isinstance(data, list) else data.get("nodes", [])
-                        for node in nodes:
-                            feature = self._parse_api_node(node)
-                            if feature:
-                                features.append(feature)
+                        parse = self._parse_api_node
+                        features = [f for f in map(parse, nodes) if f]
                         logger.debug("meshtasticd API returned %d nodes", len(features))
                         last_err = None
                         break
-                    except (URLError, OSError, json.JSONDecodeError) as e:
+                    except (URLError, OSError, ValueError) as e:
                         last_err = e
                         if attempt == 0 and isinstance(e, (URLError, OSError)):
                             logger.debug(
@@ -239,29 +259,49 @@ class MeshtasticCollector(BaseCollector):
             return []
 
     def _fetch_from_mqtt_cache(self) -> List[Dict[str, Any]]:
-        """Read cached MQTT node data from meshforge's mqtt_nodes.json."""
-        features = []
-        if not MQTT_CACHE_PATH.exists():
-            return features
+        """Read cached MQTT node data from meshforge's mqtt_nodes.json.
+
+        The parsed features are reused while the file's (mtime_ns, size) is
+        unchanged, so the file is parsed once per rewrite rather than once
+        per collect cycle. Callers must not mutate the returned list.
+        """
         try:
-            with open(MQTT_CACHE_PATH, "r") as f:
-                data = json.load(f)
-
-            # mqtt_nodes.json may be a GeoJSON FeatureCollection or a dict of nodes
-            if data.get("type") == "FeatureCollection":
-                for f_item in data.get("features", []):
-                    props = f_item.get("properties", {})
-                    if props.get("network") == "meshtastic":
-                        features.append(f_item)
-            elif isinstance(data, dict):
-                for node_id, node_data in data.items():
-                    feature = self._parse_mqtt_node(node_id, node_data)
-                    if feature:
-                        features.append(feature)
+            st = MQTT_CACHE_PATH.stat()
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            logger.debug("MQTT cache read failed: %s", e)
+            return []
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._mqtt_cache_file
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-            logger.debug("MQTT cache returned %d meshtastic nodes", len(features))
-        except (json.JSONDecodeError, OSError) as e:
+        features: List[Dict[str, Any]] = []
+        try:
+            data = json_loads(MQTT_CACHE_PATH.read_bytes())
+        except (ValueError, OSError) as e:
             logger.debug("MQTT cache read failed: %s", e)
+            return features
+
+        # mqtt_nodes.json may be a GeoJSON FeatureCollection or a dict of nodes
+        if isinstance(data, dict) and data.get("type") == "FeatureCollection":
+            append = features.append
+            for f_item in data.get("features") or ():
+                props = f_item.get("properties") if isinstance(f_item, dict) else None
+                if isinstance(props, dict) and props.get("network") == "meshtastic":
+                    append(f_item)
+        elif isinstance(data, dict):
+            parse = self._parse_mqtt_node
+            append = features.append
+            for node_id, node_data in data.items():
+                if isinstance(node_data, dict):
+                    feature = parse(node_id, node_data)
+                    if feature:
+                        append(feature)
+
+        self._mqtt_cache_file = (key, features)
+        logger.debug("MQTT cache returned %d meshtastic nodes", len(features))
         return features
 
     def _parse_mqtt_node(
@@ -341,7 +381,7 @@ class MeshtasticCollector(BaseCollector):
                 },
             )
             with urlopen(req, timeout=15) as resp:
-                data = json.loads(bounded_read(resp).decode())
+                data = json_loads(bounded_read(resp))
 
             for num_id, node in data.items():
                 feature = self._parse_meshmap_node(num_id, node)
@@ -349,7 +389,7 @@ class MeshtasticCollector(BaseCollector):
                     features.append(feature)
             if features:
                 logger.debug("meshmap.net returned %d meshtastic nodes", len(features))
-        except (URLError, OSError, json.JSONDecodeError, ValueError) as e:
+        except (URLError, OSError, ValueError) as e:
             logger.debug("meshmap.net unavailable: %s", e)
         return features
 
@@ -27,7 +27,9 @@ import socket
 import struct
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base import json_loads, make_link_feature, validate_coordinates, validate_coordinates_batch
 
 logger = logging.getLogger(__name__)
 
@@ -144,21 +146,35 @@ SNR_DEFAULT = ("bad", "#f44336")       # Red (SNR < -10)
 SNR_UNKNOWN = ("unknown", "#9e9e9e")   # Grey (no SNR data)
 
 
+def _snr_tier(snr_val: float) -> tuple:
+    """Walk SNR_TIERS for a numeric SNR. Used to build _SNR_TABLE."""
+    for threshold, label, color in SNR_TIERS:
+        if snr_val > threshold:
+            return (label, color)
+    return SNR_DEFAULT
+
+
+# Every tier threshold is a whole dB value, and for integer t, x > t holds
+# exactly when ceil(x) > t — so looking up ceil(snr) is exact. The table spans
+# real-world LoRa/AREDN SNR; values beyond it clamp to the end tiers.
+_SNR_TABLE_MIN = -30
+_SNR_TABLE_MAX = 40
+_SNR_TABLE = {db: _snr_tier(db) for db in range(_SNR_TABLE_MIN, _SNR_TABLE_MAX + 1)}
+
+
 def _classify_snr(snr: Optional[float]) -> tuple:
     """Classify SNR value into quality tier and color.
 
-    Returns (quality_label, hex_color) tuple.
+    Returns (quality_label, hex_color) tuple. Non-numeric and non-finite
+    values classify as unknown.
     """
     if snr is None:
         return SNR_UNKNOWN
     try:
-        snr_val = float(snr)
-    except (ValueError, TypeError):
+        key = math.ceil(float(snr))
+    except (ValueError, TypeError, OverflowError):
         return SNR_UNKNOWN
-    for threshold, label, color in SNR_TIERS:
-        if snr_val > threshold:
-            return (label, color)
-    return SNR_DEFAULT
+    return _SNR_TABLE[min(max(key, _SNR_TABLE_MIN), _SNR_TABLE_MAX)]
 
 
 class MQTTNodeStore:
@@ -179,6 +195,11 @@ class MQTTNodeStore:
         self._remove_seconds = remove_seconds
         self._max_nodes = max_nodes
         self._on_node_removed = on_node_removed
+        # Bumped whenever positions, neighbors or membership change, so
+        # topology consumers can cache derived output until it moves.
+        self._topology_version = 0
+        # (version, links) memo for get_topology_links()
+        self._links_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
 
     def update_position(self, node_id: str, lat: float, lon: float,
                         altitude: Optional[int] = None, timestamp: Optional[int] = None) -> None:
@@ -193,6 +214,7 @@ class MQTTNodeStore:
                 node["altitude"] = altitude
             node["last_seen"] = timestamp or int(time.time())
             node["is_online"] = True
+            self._topology_version += 1
         # Invoke removal callback outside lock to prevent deadlock
         cb = self._on_node_removed
         if evicted_id and cb:
@@ -253,6 +275,7 @@ class MQTTNodeStore:
                          neighbors: List[Dict[str, Any]]) -> None:
         with self._lock:
             self._neighbors[node_id] = neighbors
+            self._topology_version += 1
 
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         """Return a single node by ID, or None if not found.
@@ -274,8 +297,6 @@ class MQTTNodeStore:
 
         Returns copies of node dicts; does not mutate the store.
         """
-        from .base import validate_coordinates
-
         now = int(time.time())
         with self._lock:
             result = []
@@ -293,24 +314,28 @@ class MQTTNodeStore:
             return result
 
     def get_topology_links(self) -> List[Dict[str, Any]]:
-        """Return neighbor/link data for topology visualization."""
-        from .base import validate_coordinates
+        """Return neighbor/link data for topology visualization.
 
+        The link list is rebuilt only when the topology version moves;
+        callers get a fresh list but share the (read-only) link dicts.
+        """
         with self._lock:
+            cached = self._links_cache
+            if cached is not None and cached[0] == self._topology_version:
+                return list(cached[1])
+            # Validate each node once, not once per edge it appears on
+            node_coords = validate_coordinates_batch(
+                (nid, node.get("latitude"), node.get("longitude"))
+                for nid, node in self._nodes.items()
+            )
             links = []
             for node_id, neighbors in self._neighbors.items():
-                source = self._nodes.get(node_id, {})
-                src_coords = validate_coordinates(
-                    source.get("latitude"), source.get("longitude")
-                )
+                src_coords = node_coords.get(node_id)
                 if src_coords is None:
                     continue
                 for neighbor in neighbors:
                     nid = neighbor.get("node_id", "")
-                    target = self._nodes.get(nid, {})
-                    tgt_coords = validate_coordinates(
-                        target.get("latitude"), target.get("longitude")
-                    )
+                    tgt_coords = node_coords.get(nid)
                     if tgt_coords is None:
                         continue
                     links.append({
@@ -322,7 +347,8 @@ class MQTTNodeStore:
                         "target_lon": tgt_coords[1],
                         "snr": neighbor.get("snr"),
                     })
-            return links
+            self._links_cache = (self._topology_version, links)
+            return list(links)
 
     def get_topology_geojson(self) -> Dict[str, Any]:
         """Return topology as a GeoJSON FeatureCollection with SNR-colored edges.
@@ -338,8 +364,6 @@ class MQTTNodeStore:
           - Bad (SNR < -10):        #f44336 (red)
           - Unknown (no SNR):       #9e9e9e (grey)
         """
-        from .base import make_link_feature
-
         links = self.get_topology_links()
         features = []
         for link in links:
@@ -365,6 +389,12 @@ class MQTTNodeStore:
         with self._lock:
             return len(self._nodes)
 
+    @property
+    def topology_version(self) -> int:
+        """Counter that changes whenever get_topology_links() output may change."""
+        with self._lock:
+            return self._topology_version
+
     def cleanup_stale_nodes(self) -> int:
         """Remove nodes not seen for longer than remove_seconds.
 
@@ -381,6 +411,8 @@ class MQTTNodeStore:
                 del self._nodes[nid]
                 self._neighbors.pop(nid, None)
                 removed_ids.append(nid)
+            if removed_ids:
+                self._topology_version += 1
         # Notify dependent modules outside the lock
         cb = self._on_node_removed
         if cb and removed_ids:
@@ -406,6 +438,7 @@ class MQTTNodeStore:
         )
         del self._nodes[oldest_id]
         self._neighbors.pop(oldest_id, None)
+        self._topology_version += 1
         return oldest_id
 
 
@@ -430,10 +463,14 @@ class MQTTSubscriber:
         node_store: Optional[MQTTNodeStore] = None,
         on_node_update: Optional[Callable] = None,
         event_bus: Optional[Any] = None,
+        topics: Optional[List[str]] = None,
     ):
         self._broker = broker
         self._port = port
-        self._topic = topic
+        # Multiple topics are subscribed in one SUBSCRIBE packet; the first
+        # entry is reported as the primary topic in status output.
+        self._topics = [t for t in (topics or []) if t] or [topic]
+        self._topic = self._topics[0]
         self._username = username
         self._password = password
         # Default to TLS when credentials are provided (protect passwords)
@@ -559,6 +596,7 @@ class MQTTSubscriber:
             "broker": self._broker,
             "port": self._port,
             "topic": self._topic,
+            "topics": list(self._topics),
             "connected": self._connected.is_set(),
             "running": self._running.is_set(),
             "has_credentials": self._username is not None,
@@ -617,19 +655,28 @@ class MQTTSubscriber:
         logger.info("MQTT connected to %s (rc=%s), store has %d nodes",
                     self._broker, rc, self._store.node_count)
 
-        # Auto-expand root topics (e.g. "msh/US/HI") to full subscription path
-        topic = self._topic
-        if not topic.endswith("/#") and "/2/e/" not in topic and "/2/json/" not in topic:
-            topic = topic.rstrip("/") + "/2/e/#"
-            logger.info("MQTT topic expanded: %s -> %s", self._topic, topic)
+        topics = self._subscription_topics()
+        # One SUBSCRIBE packet for every topic instead of a round-trip each
+        client.subscribe([(t, 0) for t in topics])
+        logger.info("MQTT subscribed to %d topic(s): %s", len(topics), ", ".join(topics))
 
-        client.subscribe(topic)
+    def _subscription_topics(self) -> List[str]:
+        """Expand configured topics into the full, de-duplicated filter list.
 
-        # Also subscribe to JSON topic for pre-decoded packets
-        if "/2/e/" in topic:
-            json_topic = topic.replace("/2/e/", "/2/json/")
-            client.subscribe(json_topic)
-            logger.info("MQTT also subscribed to JSON topic: %s", json_topic)
+        Root topics (e.g. "msh/US/HI") are expanded to ".../2/e/#", and every
+        encrypted "/2/e/" filter gains its "/2/json/" twin for pre-decoded
+        packets.
+        """
+        expanded: List[str] = []
+        for configured in self._topics:
+            topic = configured
+            if not topic.endswith("/#") and "/2/e/" not in topic and "/2/json/" not in topic:
+                topic = topic.rstrip("/") + "/2/e/#"
+                logger.info("MQTT topic expanded: %s -> %s", configured, topic)
+            expanded.append(topic)
+            if "/2/e/" in topic:
+                expanded.append(topic.replace("/2/e/", "/2/json/"))
+        return list(dict.fromkeys(expanded))
 
     def _on_disconnect(self, client: Any, userdata: Any, rc: Any,
                        *args: Any) -> None:
@@ -772,8 +819,6 @@ class MQTTSubscriber:
             return None
 
     def _handle_position(self, node_id: str, payload: bytes) -> None:
-        from .base import validate_coordinates
-
         mesh_pb2 = self._proto["mesh_pb2"]
         pos = mesh_pb2.Position()
         pos.ParseFromString(payload)
@@ -969,7 +1014,6 @@ class MQTTSubscriber:
         lat_i = getattr(report, "latitude_i", 0)
         lon_i = getattr(report, "longitude_i", 0)
         if lat_i and lon_i:
-            from .base import validate_coordinates
             coords = validate_coordinates(lat_i, lon_i, convert_int=True)
             if coords:
                 lat, lon = coords
@@ -995,7 +1039,7 @@ class MQTTSubscriber:
     def _decode_json(self, payload: bytes, topic: str) -> None:
         """Fallback: try to decode as JSON (when device has JSON MQTT enabled)."""
         try:
-            data = json.loads(payload.decode("utf-8"))
+            data = json_loads(payload)
         except (json.JSONDecodeError, UnicodeDecodeError):
             return
 
@@ -14,7 +14,7 @@ from urllib.error import URLError
 
 from datetime import datetime, timezone
 
-from .base import BaseCollector, bounded_read, make_feature_collection, make_geometry_feature
+from .base import BaseCollector, bounded_read, json_loads, make_feature_collection, make_geometry_feature
 
 logger = logging.getLogger(__name__)
 
@@ -85,8 +85,13 @@ class NOAAAlertCollector(BaseCollector):
         severity_filter: Optional[List[str]] = None,
         cache_ttl_seconds: int = 300,
         max_retries: int = 0,
+        persistent_cache: bool = False,
     ):
-        super().__init__(cache_ttl_seconds=cache_ttl_seconds, max_retries=max_retries)
+        super().__init__(
+            cache_ttl_seconds=cache_ttl_seconds,
+            max_retries=max_retries,
+            persistent_cache=persistent_cache,
+        )
         self._base_url = api_url
         self._area = area
         self._severity_filter = severity_filter
@@ -114,7 +119,7 @@ class NOAAAlertCollector(BaseCollector):
                 "Accept": "application/geo+json",
             })
             with urlopen(req, timeout=15) as resp:
-                raw = json.loads(bounded_read(resp).decode("utf-8"))
+                raw = json_loads(bounded_read(resp))
         except (URLError, OSError, json.JSONDecodeError, ValueError) as e:
             logger.debug("NOAA alert fetch failed: %s", e)
             return make_feature_collection([], self.source_name)
@@ -37,6 +37,7 @@ from .base import (
     BaseCollector,
     bounded_read,
     deduplicate_features,
+    json_loads,
     make_feature,
     make_feature_collection,
     point_in_region,
@@ -84,10 +85,11 @@ class ReticulumCollector(BaseCollector):
         enable_rmap_public: bool = True,
         cache_ttl_seconds: int = 900,
         max_retries: int = 0,
+        persistent_cache: bool = False,
         region_bboxes: Optional[List[List[float]]] = None,
         region_polygons: Optional[List[List[List[float]]]] = None,
     ):
-        super().__init__(cache_ttl_seconds, max_retries=max_retries)
+        super().__init__(cache_ttl_seconds, max_retries=max_retries, persistent_cache=persistent_cache)
         self._rch_base = f"http://{rch_host}:{rch_port}"
         self._rch_api_key = rch_api_key
         self._enable_rmap_public = enable_rmap_public
@@ -141,7 +143,7 @@ class ReticulumCollector(BaseCollector):
                 logger.debug("rnstatus not available or failed (rc=%d)", result.returncode)
                 return features
 
-            data = json.loads(result.stdout)
+            data = json_loads(result.stdout)
             interfaces = data.get("interfaces", [])
             for iface in interfaces:
                 feature = self._parse_rns_interface(iface)
@@ -152,7 +154,7 @@ class ReticulumCollector(BaseCollector):
             logger.warning("rnstatus timed out after 10s — Reticulum data may be stale")
         except FileNotFoundError:
             logger.debug("rnstatus command not found")
-        except (json.JSONDecodeError, OSError) as e:
+        except (ValueError, OSError) as e:
             logger.debug("rnstatus failed: %s", e)
         return features
 
@@ -201,7 +203,7 @@ class ReticulumCollector(BaseCollector):
                     headers["X-API-Key"] = self._rch_api_key
                 req = Request(url, headers=headers)
                 with urlopen(req, timeout=10) as resp:
-                    data = json.loads(bounded_read(resp).decode())
+                    data = json_loads(bounded_read(resp))
 
                 nodes = data if isinstance(data, list) else data.get("items", data.get("nodes", []))
                 for node in nodes:
@@ -283,7 +285,7 @@ class ReticulumCollector(BaseCollector):
                 ctx.verify_mode = ssl.CERT_NONE
                 logger.debug("RMAP.world: TLS verification disabled (rmap_verify_ssl=false)")
             with urlopen(req, timeout=15, context=ctx) as resp:
-                data = json.loads(bounded_read(resp).decode())
+                data = json_loads(bounded_read(resp))
 
             nodes = data.get("nodes", []) if isinstance(data, dict) else []
             for node in nodes:
@@ -350,8 +352,8 @@ class ReticulumCollector(BaseCollector):
         if not path.exists():
             return features
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                data = json_loads(f.read())
 
             if data.get("type") == "FeatureCollection":
                 for feature in data.get("features", []):
@@ -377,6 +379,6 @@ class ReticulumCollector(BaseCollector):
                             if feature is not None:
                                 features.append(feature)
             logger.debug("Cache %s returned %d nodes", path.name, len(features))
-        except (json.JSONDecodeError, OSError) as e:
+        except (ValueError, OSError) as e:
             logger.debug("Cache read failed for %s: %s", path.name, e)
         return features
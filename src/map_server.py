@@ -27,7 +27,7 @@ from urllib.parse import parse_qs, unquote, urlparse
 
 from . import __version__
 from .collectors.aggregator import DataAggregator
-from .collectors.base import point_in_bboxes, validate_node_id
+from .collectors.base import json_dumps_bytes, point_in_bboxes, validate_node_id
 from .utils.alert_engine import Alert, AlertEngine
 from .utils.analytics import HistoricalAnalytics
 from .utils.config import NETWORK_COLORS, REGION_PRESETS, TILE_PROVIDERS, MapsConfig
@@ -160,6 +160,7 @@ class MapRequestHandler(SimpleHTTPRequestHandler):
         "": "_serve_map",
         "/index.html": "_serve_map",
         "/api/nodes/geojson": "_serve_geojson",
+        "/api/nodes/geojson-seq": "_serve_geojson_seq",
         "/api/config": "_serve_config",
         "/api/tile-providers": "_serve_tile_providers",
         "/api/sources": "_serve_sources",
@@ -491,7 +492,7 @@ class MapRequestHandler(SimpleHTTPRequestHandler):
                 validated[k] = preset[k]
 
         # Check if MQTT settings are changing
-        mqtt_keys = {"mqtt_broker", "mqtt_port", "mqtt_topic",
+        mqtt_keys = {"mqtt_broker", "mqtt_port", "mqtt_topic", "mqtt_topics",
                      "mqtt_username", "mqtt_password", "mqtt_use_tls"}
         mqtt_changed = any(k in validated for k in mqtt_keys)
 
@@ -588,7 +589,7 @@ class MapRequestHandler(SimpleHTTPRequestHandler):
         if not aggregator:
             self._send_json({"error": "Aggregator not initialized"}, 503)
             return
-        data = aggregator.get_cached_result()
+        data = aggregator.get_aggregated()
         if data is None:
             data = {"type": "FeatureCollection", "features": [],
                     "properties": {"source": "aggregated", "total_nodes": 0,
@@ -656,6 +657,38 @@ class MapRequestHandler(SimpleHTTPRequestHandler):
 
         self._send_json(data)
 
+    # Features per write() when streaming GeoJSON-Seq (wfile is unbuffered)
+    _GEOJSON_SEQ_BATCH = 256
+
+    def _serve_geojson_seq(self) -> None:
+        """Stream aggregated nodes as GeoJSON text sequences (RFC 8142).
+
+        Features are serialized one at a time from the cached result, so the
+        response never holds a second full copy of the collection in memory.
+        """
+        aggregator = self._ctx.aggregator
+        if not aggregator:
+            self._send_json({"error": "Aggregator not initialized"}, 503)
+            return
+        self._response_status = 200
+        self.send_response(200)
+        self.send_header("Content-Type", "application/geo+json-seq")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-Content-Type-Options", "nosniff")
+        self.send_header("X-Frame-Options", "DENY")
+        cors_origin = self._get_cors_origin()
+        if cors_origin:
+            self.send_header("Access-Control-Allow-Origin", cors_origin)
+        self.end_headers()
+        batch: List[bytes] = []
+        for record in aggregator.iter_geojson_seq():
+            batch.append(record)
+            if len(batch) >= self._GEOJSON_SEQ_BATCH:
+                self.wfile.write(b"".join(batch))
+                batch = []
+        if batch:
+            self.wfile.write(b"".join(batch))
+
     def _serve_source_geojson(self, source: str) -> None:
         """Serve GeoJSON from a single source."""
         aggregator = self._ctx.aggregator
@@ -916,7 +949,7 @@ class MapRequestHandler(SimpleHTTPRequestHandler):
                 "sources": {"score": round(source_score, 1), "max": 50},
             },
             "data_age_seconds": int(data_age) if data_age is not None else None,
-            "sources_reporting": source_counts,
+            "sources_reporting": dict(source_counts),
             "node_history_write_error_at": write_error_state["last_write_error_at"],
             "node_history_write_error_msg": write_error_state["last_write_error_msg"],
         })
@@ -1448,7 +1481,7 @@ class MapRequestHandler(SimpleHTTPRequestHandler):
                 # Data older than 2x cache TTL is considered stale
                 cache_ttl = (config.get("cache_ttl_minutes", 15) if config else 15) * 60
                 data_stale = data_age > (cache_ttl * 2)
-            source_counts = aggregator.last_collect_counts
+            source_counts = dict(aggregator.last_collect_counts)
 
         # WebSocket server stats
         ws_server = self._ctx.ws_server
@@ -1529,6 +1562,7 @@ class MapRequestHandler(SimpleHTTPRequestHandler):
             ("websockets", "Real-time WebSocket push"),
             ("pyOpenSSL", "TLS for MQTT connections"),
             ("cryptography", "Cryptographic backend for TLS"),
+            ("orjson", "Fast JSON serialization"),
         ]
 
         results = []
@@ -1606,7 +1640,7 @@ class MapRequestHandler(SimpleHTTPRequestHandler):
     def _send_json(self, data: Any, status: int = 200) -> None:
         self._response_status = status
         try:
-            body = json.dumps(data, default=str).encode("utf-8")
+            body = json_dumps_bytes(data)
         except (TypeError, ValueError) as e:
             logger.error("JSON serialization error: %s", e)
             body = b'{"error": "serialization error"}'
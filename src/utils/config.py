@@ -48,6 +48,14 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "map_center_lon": -100.0,
     "map_default_zoom": 4,
     "cache_ttl_minutes": 15,
+    # Persist the last aggregated GeoJSON to the data dir so a restart serves
+    # it immediately while the first collection runs. Off by default to
+    # spare SD-card writes on Pi deployments.
+    "aggregate_snapshot": False,
+    # Keep each remote-API collector's (RMAP, AREDN, MeshCore, HamClock,
+    # NOAA) last result on disk so a restart within its TTL skips the cold
+    # fetch. Off by default for the same SD-card reason.
+    "persist_collector_cache": False,
     # 1-day retention is the fleet default after the 2026-05-21 moc1 incident
     # — a 2.4 GB history DB blocked startup for 1h18m on Pi 4B SD while the
     # built-in compaction ran. Operators on dense regions hit this cliff with
@@ -71,13 +79,16 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "mqtt_broker": "mqtt.meshtastic.org",
     "mqtt_port": 1883,
     "mqtt_topic": "msh/US/2/e/#",
+    # Optional: several topic filters on the same broker, subscribed in a
+    # single SUBSCRIBE packet. Empty = just mqtt_topic.
+    "mqtt_topics": [],
     "mqtt_username": "meshdev",
     "mqtt_password": "large4cats",
     "mqtt_use_tls": False,
     # Optional: additional MQTT brokers that feed the same node store in parallel.
-    # Each entry: {"broker": host, "port": int, "topic": str, "username": str,
-    # "password": str, "use_tls": bool, "label": str}. If empty, only the scalar
-    # mqtt_* keys above are used.
+    # Each entry: {"broker": host, "port": int, "topic": str, "topics": [str],
+    # "username": str, "password": str, "use_tls": bool, "label": str}. If
+    # empty, only the scalar mqtt_* keys above are used.
     "mqtt_brokers": [],
     # CORS: None = same-origin (no CORS headers sent). Set to a concrete
     # origin like "https://maps.example.com" to enable. Wildcards ("*") are
@@ -530,6 +541,12 @@ class MapsConfig:
                     errors.append("mqtt_topic must be a non-empty string")
                     continue
                 validated[key] = value.strip()
+            elif key == "mqtt_topics":
+                if not isinstance(value, list) or not all(
+                        isinstance(t, str) and t.strip() for t in value):
+                    errors.append("mqtt_topics must be a list of non-empty strings")
+                    continue
+                validated[key] = [t.strip() for t in value]
             elif key == "mqtt_use_tls":
                 if not isinstance(value, bool):
                     errors.append("mqtt_use_tls must be a boolean")
@@ -0,0 +1,213 @@
+"""
+MeshForge Maps - Keep-alive HTTP connection pool
+
+urllib's urlopen() sends "Connection: close" and opens a fresh TCP
+connection per request. Collectors that poll the same hosts every cycle
+(AREDN sysinfo, HamClock) pay a handshake each time. KeepAlivePool keeps
+idle http.client connections per (scheme, host) and reuses them.
+
+Requests keep urlopen()'s behavior where it matters for deployments: one
+same-host redirect hop is followed on the pooled connection (longer or
+cross-host chains are handed to a urllib opener), and when an
+HTTP(S)_PROXY applies to the host the request goes through that opener
+so NO_PROXY and proxy auth work as before. Both paths enforce the same
+max_bytes cap.
+
+Errors surface as urllib.error types (HTTPError for non-2xx, URLError for
+protocol failures) so callers keep their existing URLError/OSError
+handling.
+"""
+
+import http.client
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import SplitResult, urljoin, urlsplit
+from urllib.request import ProxyHandler, Request, build_opener, getproxies, proxy_bypass
+
+# Matches base.DEFAULT_MAX_RESPONSE_BYTES (utils must not import collectors)
+DEFAULT_MAX_RESPONSE_BYTES = 10 * 1024 * 1024
+
+# Failures that mean a reused idle connection was dropped by the server;
+# the request is retried once on a fresh connection.
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+
+
+class KeepAlivePool:
+    """Thread-safe pool of persistent HTTP/1.1 connections keyed by host.
+
+    A connection is checked out for the duration of one request, so
+    concurrent callers never share a socket. At most *max_idle_per_host*
+    idle connections are kept per host; extras are closed on return.
+    """
+
+    def __init__(self, max_idle_per_host: int = 2):
+        self._max_idle = max_idle_per_host
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._closed = False
+        # Read once, like urlopen()'s default opener does on first use
+        self._proxies = getproxies()
+        self._opener = build_opener(ProxyHandler(self._proxies))
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+        max_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+    ) -> bytes:
+        """GET *url* and return the body bytes.
+
+        Raises HTTPError on a non-2xx status, URLError on protocol errors,
+        OSError on socket errors/timeouts, and ValueError if the body
+        exceeds *max_bytes*.
+        """
+        return self.get_with_headers(url, headers, timeout, max_bytes)[0]
+
+    def get_with_headers(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+        max_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+    ) -> Tuple[bytes, http.client.HTTPMessage]:
+        """Like get(), but also return the response headers (e.g. ETag).
+
+        A 304 Not Modified raises HTTPError with code 304; its headers are
+        on the exception.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise URLError(f"unsupported URL scheme: {parts.scheme!r}")
+        if self._proxied(parts):
+            return self._urlopen(url, headers, timeout, max_bytes)
+
+        body, resp = self._pooled_get(parts, headers, timeout, max_bytes)
+        if resp.status in _REDIRECT_CODES and resp.headers.get("Location"):
+            target = urljoin(url, resp.headers["Location"])
+            tparts = urlsplit(target)
+            if (tparts.hostname != parts.hostname
+                    or tparts.scheme not in ("http", "https")
+                    or self._proxied(tparts)):
+                return self._urlopen(target, headers, timeout, max_bytes)
+            url = target
+            body, resp = self._pooled_get(tparts, headers, timeout, max_bytes)
+            if resp.status in _REDIRECT_CODES and resp.headers.get("Location"):
+                # Redirect chains: let urllib's handler apply its own limits
+                return self._urlopen(urljoin(url, resp.headers["Location"]),
+                                     headers, timeout, max_bytes)
+        if not 200 <= resp.status < 300:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return body, resp.headers
+
+    def close(self) -> None:
+        """Close every idle connection and stop pooling new ones."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _pooled_get(
+        self,
+        parts: SplitResult,
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        max_bytes: int,
+    ) -> Tuple[bytes, http.client.HTTPResponse]:
+        """One GET on a pooled connection; returns (body, response) for any status."""
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        conn, reused = self._checkout(key, timeout)
+        try:
+            try:
+                resp = self._request(conn, path, headers, timeout)
+            except _STALE_ERRORS:
+                if not reused:
+                    raise
+                conn.close()
+                conn = self._new_connection(key, timeout)
+                resp = self._request(conn, path, headers, timeout)
+            # Refuse up front when the server declares an oversized body
+            if resp.length is not None and resp.length > max_bytes:
+                conn.close()
+                raise ValueError(f"HTTP response Content-Length {resp.length} exceeds {max_bytes} bytes")
+            body = resp.read(max_bytes + 1)
+        except http.client.HTTPException as e:
+            conn.close()
+            raise URLError(e) from e
+        except Exception:
+            conn.close()
+            raise
+
+        if len(body) > max_bytes:
+            conn.close()
+            raise ValueError(f"HTTP response exceeded {max_bytes} bytes — refusing to buffer")
+        if resp.will_close or not resp.isclosed():
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return body, resp
+
+    def _proxied(self, parts: SplitResult) -> bool:
+        """True when an environment proxy applies to this URL's host."""
+        return parts.scheme in self._proxies and not proxy_bypass(parts.hostname or "")
+
+    def _urlopen(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        max_bytes: int,
+    ) -> Tuple[bytes, http.client.HTTPMessage]:
+        """Unpooled GET via urllib (proxies, cross-host redirects), same caps."""
+        try:
+            with self._opener.open(Request(url, headers=headers or {}), timeout=timeout) as resp:
+                if resp.length is not None and resp.length > max_bytes:
+                    raise ValueError(f"HTTP response Content-Length {resp.length} exceeds {max_bytes} bytes")
+                body = resp.read(max_bytes + 1)
+                resp_headers = resp.headers
+        except http.client.HTTPException as e:
+            raise URLError(e) from e
+        if len(body) > max_bytes:
+            raise ValueError(f"HTTP response exceeded {max_bytes} bytes — refusing to buffer")
+        return body, resp_headers
+
+    @staticmethod
+    def _request(conn: http.client.HTTPConnection, path: str,
+                 headers: Optional[Dict[str, str]], timeout: float) -> http.client.HTTPResponse:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        conn.request("GET", path, headers=headers or {})
+        return conn.getresponse()
+
+    @staticmethod
+    def _new_connection(key: Tuple[str, str], timeout: float) -> http.client.HTTPConnection:
+        scheme, netloc = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=timeout)
+        return http.client.HTTPConnection(netloc, timeout=timeout)
+
+    def _checkout(self, key: Tuple[str, str], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            conns = self._idle.get(key)
+            if conns:
+                return conns.pop(), True
+        return self._new_connection(key, timeout), False
+
+    def _checkin(self, key: Tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if not self._closed:
+                conns = self._idle.setdefault(key, [])
+                if len(conns) < self._max_idle:
+                    conns.append(conn)
+                    return
+        conn.close()
@@ -47,31 +47,49 @@ class PerfMonitor:
         duration_ms: float,
         node_count: int = 0,
         from_cache: bool = False,
+        live_refresh: bool = False,
     ) -> None:
-        """Record a timing sample for a source."""
+        """Record a timing sample for a source.
+
+        live_refresh marks an event-driven re-merge of live data; it is
+        counted separately and never as a cache hit.
+        """
         with self._lock:
-            if source not in self._sources:
-                self._sources[source] = {
-                    "count": 0, "total_ms": 0.0,
-                    "cache_hits": 0, "total_nodes": 0,
-                    "last_ms": 0.0, "last_time": 0.0,
-                    "min_ms": float("inf"), "max_ms": 0.0,
-                    "samples": deque(maxlen=self._SAMPLE_WINDOW),
-                }
-            s = self._sources[source]
+            s = self._source_entry(source)
             s["count"] += 1
             s["total_ms"] += duration_ms
             s["last_ms"] = duration_ms
             s["last_time"] = time.time()
             s["total_nodes"] += node_count
             s["samples"].append(duration_ms)
-            if from_cache:
+            if live_refresh:
+                s["live_refreshes"] += 1
+            elif from_cache:
                 s["cache_hits"] += 1
             if duration_ms < s["min_ms"]:
                 s["min_ms"] = duration_ms
             if duration_ms > s["max_ms"]:
                 s["max_ms"] = duration_ms
 
+    def record_errors_suppressed(self, source: str, count: int) -> None:
+        """Record how many failure log lines a source has suppressed in total."""
+        with self._lock:
+            self._source_entry(source)["errors_suppressed"] = count
+
+    def _source_entry(self, source: str) -> Dict[str, Any]:
+        """Return the stats dict for source, creating it. Caller holds _lock."""
+        s = self._sources.get(source)
+        if s is None:
+            s = self._sources[source] = {
+                "count": 0, "total_ms": 0.0,
+                "cache_hits": 0, "live_refreshes": 0, "total_nodes": 0,
+                "last_ms": 0.0, "last_time": 0.0,
+                "min_ms": float("inf"), "max_ms": 0.0,
+                "errors_suppressed": 0,
+                "samples": deque(maxlen=self._SAMPLE_WINDOW),
+            }
+        return s
+
     def record_cycle(self, duration_ms: float, total_nodes: int = 0) -> None:
         """Record a full collection cycle timing."""
         with self._lock:
@@ -163,7 +181,9 @@ class PerfMonitor:
             "last_duration_ms": round(s["last_ms"], 2),
             "last_timestamp": s["last_time"],
             "cache_hit_ratio": round(s["cache_hits"] / count, 3) if count else 0,
+            "live_refreshes": s["live_refreshes"],
             "total_nodes_collected": s["total_nodes"],
+            "errors_suppressed": s["errors_suppressed"],
             **pct,
         }
 
@@ -177,6 +197,7 @@ class TimingContext:
         self._start: float = 0
         self.node_count: int = 0
         self.from_cache: bool = False
+        self.live_refresh: bool = False
 
     def __enter__(self) -> "TimingContext":
         self._start = time.monotonic()
@@ -188,5 +209,6 @@ class TimingContext:
             self._monitor.record_cycle(elapsed_ms, self.node_count)
         else:
             self._monitor.record_timing(
-                self._source, elapsed_ms, self.node_count, self.from_cache
+                self._source, elapsed_ms, self.node_count, self.from_cache,
+                self.live_refresh,
             )
@@ -12,7 +12,7 @@ import logging
 import random
 import threading
 import time
-from typing import Optional
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +74,21 @@ class ReconnectStrategy:
 
         return delay
 
+    def schedule(self, count: int) -> Tuple[float, ...]:
+        """Un-jittered delays for the first *count* attempts.
+
+        Lets callers with a fixed retry budget compute the schedule once and
+        apply jitter per attempt via jittered(), without per-call state.
+        """
+        return tuple(
+            min(self._base_delay * (self._multiplier ** i), self._max_delay)
+            for i in range(count)
+        )
+
+    def jittered(self, delay: float) -> float:
+        """Add this strategy's random jitter to a precomputed delay."""
+        return delay + random.uniform(0, delay * self._jitter_factor)  # noqa: S311 — backoff jitter, not cryptographic
+
     def should_retry(self) -> bool:
         """Check if another retry is allowed.
 
@@ -35,10 +35,10 @@ class TestNetworkFailures:
         (OSError("timed out"), "test-node.local.mesh"),
         (URLError("Name or service not known"), "nonexistent.local.mesh"),
     ])
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_network_error_returns_empty(self, mock_urlopen, collector,
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_network_error_returns_empty(self, mock_get, collector,
                                          side_effect, hostname):
-        mock_urlopen.side_effect = side_effect
+        mock_get.side_effect = side_effect
         features, links = collector._fetch_from_node(hostname)
         assert features == []
 
@@ -48,18 +48,25 @@ class TestNetworkFailures:
         (json.dumps([1, 2, 3]).encode(), "json_array_not_object"),
         (json.dumps({"random": "data"}).encode(), "missing_aredn_fields"),
     ])
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_bad_response_body_returns_empty(self, mock_urlopen, collector,
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_bad_response_body_returns_empty(self, mock_get, collector,
                                               body, desc):
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = body
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_get.return_value = body
         features, links = collector._fetch_from_node("test-node")
         assert features == []
 
 
+    @patch("src.collectors.aredn_collector.json_loads")
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_non_aredn_body_not_parsed(self, mock_get, mock_loads, collector):
+        """A body without any AREDN key is rejected before JSON parsing."""
+        mock_get.return_value = b"<html><body>router login</body></html>" * 100
+        features, links = collector._fetch_from_node("test-node")
+        assert features == []
+        mock_loads.assert_not_called()
+        assert mock_get.call_count == 2  # legacy endpoint still tried
+
+
 class TestSysinfoEdgeCases:
     """Tests for _parse_sysinfo edge cases."""
 
@@ -75,6 +82,14 @@ class TestSysinfoEdgeCases:
         geom = result["geometry"]
         assert abs(geom["coordinates"][1] - 34.0522) < 0.001
 
+    def test_probed_node_is_online_even_if_clock_steps_back(self, collector):
+        """A node that just answered is online; no second clock read can flip it."""
+        data = {"node": "test", "lat": "34.0", "lon": "-118.0"}
+        with patch("src.collectors.aredn_collector._time.time", side_effect=[2000.0, 1000.0]):
+            result = collector._parse_sysinfo(data, "test")
+        assert result["properties"]["is_online"] is True
+        assert result["properties"]["last_seen"] == 2000.0
+
     def test_nan_coordinates(self, collector):
         data = {"node": "test", "lat": float("nan"), "lon": float("nan")}
         result = collector._parse_sysinfo(data, "test")
@@ -201,8 +216,8 @@ class TestCacheFileHandling:
     def collector(self):
         return AREDNCollector(cache_ttl_seconds=0)
 
-    def test_cache_file_missing(self, collector):
-        with patch.object(Path, "exists", return_value=False):
+    def test_cache_file_missing(self, collector, tmp_path):
+        with patch("src.collectors.aredn_collector.AREDN_CACHE_PATH", tmp_path / "absent.json"):
             result = collector._fetch_from_cache()
             assert result == []
 
@@ -243,6 +258,9 @@ class TestCacheFileHandling:
                 {"properties": {"network": "aredn", "id": "a1"}},
                 {"properties": {"network": "meshtastic", "id": "m1"}},
                 {"properties": {"network": "aredn", "id": "a2"}},
+                {"properties": None},
+                None,
+                "not-a-feature",
             ],
         }
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
@@ -255,6 +273,73 @@ class TestCacheFileHandling:
                     assert feat["properties"]["network"] == "aredn"
         os.unlink(f.name)
 
+    def test_cache_file_without_aredn_not_parsed(self, collector, tmp_path):
+        path = tmp_path / "node_cache.json"
+        path.write_text(json.dumps({
+            "type": "FeatureCollection",
+            "features": [{"properties": {"network": "meshtastic", "id": "m1"}}],
+        }))
+        with patch("src.collectors.aredn_collector.UNIFIED_CACHE_PATH", path), \
+                patch("src.collectors.aredn_collector.json_loads") as mock_loads:
+            assert collector._fetch_from_unified_cache() == []
+        mock_loads.assert_not_called()
+
+    def test_cached_features_share_repeated_strings(self, collector, tmp_path):
+        path = tmp_path / "aredn_nodes.json"
+        path.write_text(json.dumps({
+            "type": "FeatureCollection",
+            "features": [
+                {"properties": {"network": "aredn", "id": f"a{i}", "node_type": "aredn_node"}}
+                for i in range(3)
+            ],
+        }))
+        with patch("src.collectors.aredn_collector.AREDN_CACHE_PATH", path):
+            result = collector._fetch_from_cache()
+        assert len({id(f["properties"]["network"]) for f in result}) == 1
+        assert len({id(f["properties"]["node_type"]) for f in result}) == 1
+
+    def test_empty_cache_file(self, collector, tmp_path):
+        path = tmp_path / "aredn_nodes.json"
+        path.write_bytes(b"")
+        with patch("src.collectors.aredn_collector.AREDN_CACHE_PATH", path):
+            assert collector._fetch_from_cache() == []
+
+    def test_cache_file_parsed_without_orjson(self, collector, tmp_path, monkeypatch):
+        import src.collectors.base as base
+        monkeypatch.setattr(base, "HAS_ORJSON", False)
+        path = tmp_path / "aredn_nodes.json"
+        path.write_text(json.dumps({
+            "type": "FeatureCollection",
+            "features": [{"properties": {"network": "aredn", "id": "a1"}}],
+        }))
+        with patch("src.collectors.aredn_collector.AREDN_CACHE_PATH", path):
+            assert len(collector._fetch_from_cache()) == 1
+
+    def test_cache_file_parsed_once_until_changed(self, collector, tmp_path):
+        """An unchanged cache file is served from memory; a rewrite re-parses."""
+        from src.collectors.base import json_loads as base_json_loads
+        path = tmp_path / "aredn_nodes.json"
+        path.write_text(json.dumps({
+            "type": "FeatureCollection",
+            "features": [{"properties": {"network": "aredn", "id": "a1"}}],
+        }))
+        with patch("src.collectors.aredn_collector.AREDN_CACHE_PATH", path), \
+                patch("src.collectors.aredn_collector.json_loads",
+                      wraps=base_json_loads) as mock_loads:
+            assert len(collector._fetch_from_cache()) == 1
+            assert len(collector._fetch_from_cache()) == 1
+            assert mock_loads.call_count == 1
+
+            path.write_text(json.dumps({
+                "type": "FeatureCollection",
+                "features": [
+                    {"properties": {"network": "aredn", "id": "a1"}},
+                    {"properties": {"network": "aredn", "id": "a2"}},
+                ],
+            }))
+            assert len(collector._fetch_from_cache()) == 2
+            assert mock_loads.call_count == 2
+
 
 
 class TestFetchDeduplication:
@@ -322,6 +407,61 @@ class TestFetchDeduplication:
         assert len(result["features"]) == 0
 
 
+    @patch.object(AREDNCollector, "_fetch_from_cache", return_value=[])
+    @patch.object(AREDNCollector, "_fetch_from_unified_cache", return_value=[])
+    def test_node_probes_run_concurrently_and_keep_order(self, _u, _c, collector):
+        """Slow targets overlap; the first target still wins dedup."""
+        import threading
+        import time
+        barrier = threading.Barrier(3, timeout=2)
+
+        def probe(target):
+            barrier.wait()  # all three must be in flight at once
+            if target == "slow":
+                time.sleep(0.05)
+            return ([{"properties": {"id": "DUP", "src": target},
+                      "geometry": {"coordinates": [-118.0, 34.0]}}], [])
+
+        collector._node_targets = ["slow", "b", "c"]
+        with patch.object(collector, "_fetch_from_node", side_effect=probe):
+            result = collector._fetch()
+        assert [f["properties"]["src"] for f in result["features"]] == ["slow"]
+
+    @patch.object(AREDNCollector, "_fetch_from_cache", return_value=[])
+    @patch.object(AREDNCollector, "_fetch_from_unified_cache", return_value=[])
+    def test_one_failing_probe_does_not_drop_others(self, _u, _c, collector):
+        def probe(target):
+            if target == "bad":
+                raise KeyError("lqm")
+            return ([{"properties": {"id": target},
+                      "geometry": {"coordinates": [-118.0, 34.0]}}], [])
+
+        collector._node_targets = ["a", "bad", "b"]
+        with patch.object(collector, "_fetch_from_node", side_effect=probe):
+            result = collector._fetch()
+        assert [f["properties"]["id"] for f in result["features"]] == ["a", "b"]
+
+    @patch.object(AREDNCollector, "_fetch_from_cache", return_value=[])
+    @patch.object(AREDNCollector, "_fetch_from_unified_cache", return_value=[])
+    def test_probe_threads_reused_across_cycles(self, _u, _c, collector):
+        """Probe workers persist between fetches instead of being respawned."""
+        import threading
+        seen = set()
+
+        def probe(target):
+            seen.add(threading.get_ident())
+            return ([], [])
+
+        collector._node_targets = ["a", "b"]
+        with patch.object(collector, "_fetch_from_node", side_effect=probe):
+            collector._fetch()
+            collector._fetch()
+        pool_threads = {t.ident for t in collector._probe_pool._threads}
+        assert seen and seen <= pool_threads
+        assert len(pool_threads) <= 2
+        collector.close()
+
+
 class TestTopologyEdgeCases:
     """Tests for topology link resolution edge cases."""
 
@@ -331,12 +471,13 @@ class TestTopologyEdgeCases:
 
     def test_partial_coordinate_resolution(self, collector):
         """Link where only source has coordinates."""
-        collector._lqm_links = [
+        links = [
             {"source": "nodeA", "target": "nodeB", "network": "aredn"},
         ]
-        collector._node_coords = {
+        coords = {
             "nodeA": (35.0, 139.0),
         }
+        collector._publish_topology(links, coords)
         links = collector.get_topology_links()
         assert len(links) == 1
         # Should be included but without resolved coordinates
@@ -344,37 +485,54 @@ class TestTopologyEdgeCases:
 
     def test_duplicate_links(self, collector):
         """Multiple links between same nodes."""
-        collector._lqm_links = [
+        links = [
             {"source": "A", "target": "B", "snr": 20.0, "network": "aredn"},
             {"source": "A", "target": "B", "snr": 18.0, "network": "aredn"},
         ]
-        collector._node_coords = {}
+        coords = {}
+        collector._publish_topology(links, coords)
         links = collector.get_topology_links()
         assert len(links) == 2  # Both included (no dedup in topology)
 
     def test_circular_link(self, collector):
         """Self-referencing link (source == target)."""
-        collector._lqm_links = [
+        links = [
             {"source": "nodeA", "target": "nodeA", "network": "aredn"},
         ]
-        collector._node_coords = {
+        coords = {
             "nodeA": (35.0, 139.0),
         }
+        collector._publish_topology(links, coords)
         links = collector.get_topology_links()
         assert len(links) == 1
         assert links[0]["source_lat"] == 35.0
         assert links[0]["target_lat"] == 35.0
 
     def test_fetch_clears_lqm_links(self, collector):
-        """_fetch() should reset _lqm_links on each call."""
-        collector._lqm_links = [
-            {"source": "old", "target": "data", "network": "aredn"},
-        ]
+        """_fetch() should reset the LQM links on each call."""
+        collector._publish_topology(
+            [{"source": "old", "target": "data", "network": "aredn"}], {},
+        )
         with patch.object(collector, "_fetch_from_node", return_value=([], [])):
             with patch.object(collector, "_fetch_from_cache", return_value=[]):
                 with patch.object(collector, "_fetch_from_unified_cache", return_value=[]):
                     collector._fetch()
-        assert collector._lqm_links == []
+        assert collector._topo.links == []
+
+    def test_fetch_publishes_new_containers(self, collector):
+        """A reader's snapshot is never mutated by a later _fetch()."""
+        old_links = [{"source": "a", "target": "b", "network": "aredn"}]
+        old_coords = {"a": (34.0, -118.0)}
+        collector._publish_topology(old_links, old_coords)
+        old = collector._topo
+        with patch.object(collector, "_fetch_from_node", return_value=([], [])), \
+                patch.object(collector, "_fetch_from_cache", return_value=[]), \
+                patch.object(collector, "_fetch_from_unified_cache", return_value=[]):
+            collector._fetch()
+        assert collector._topo is not old
+        assert collector._topo.version == old.version + 1
+        assert old_links == [{"source": "a", "target": "b", "network": "aredn"}]
+        assert old_coords == {"a": (34.0, -118.0)}
 
 
 class TestPortDetection:
@@ -384,32 +542,30 @@ class TestPortDetection:
     def collector(self):
         return AREDNCollector(cache_ttl_seconds=0)
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_hostname_without_port_adds_8080(self, mock_urlopen, collector):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_hostname_without_port_adds_8080(self, mock_get, collector):
         """Hostnames without port should get :8080 appended."""
-        mock_urlopen.side_effect = URLError("expected")
+        mock_get.side_effect = URLError("expected")
         collector._fetch_from_node("test-node.local.mesh")
         # Verify the URL had :8080
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        assert ":8080" in req.full_url
+        url = mock_get.call_args[0][0]
+        assert ":8080" in url
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_hostname_with_port_preserved(self, mock_urlopen, collector):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_hostname_with_port_preserved(self, mock_get, collector):
         """Hostnames with explicit port should not get :8080."""
-        mock_urlopen.side_effect = URLError("expected")
+        mock_get.side_effect = URLError("expected")
         collector._fetch_from_node("test-node:9090")
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        assert ":9090" in req.full_url
-        assert ":8080" not in req.full_url
+        url = mock_get.call_args[0][0]
+        assert ":9090" in url
+        assert ":8080" not in url
 
 
 class TestLQMFromSysinfo:
     """Tests for LQM parsing from full sysinfo response."""
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_sysinfo_with_null_lqm(self, mock_urlopen):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_sysinfo_with_null_lqm(self, mock_get):
         """lqm field is null."""
         collector = AREDNCollector(cache_ttl_seconds=0)
         data = {
@@ -418,17 +574,13 @@ class TestLQMFromSysinfo:
             "lon": "-118.0",
             "lqm": None,
         }
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = json.dumps(data).encode()
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_get.return_value = json.dumps(data).encode()
         features, links = collector._fetch_from_node("test")
         assert len(features) == 1  # Node parsed, no LQM links
         assert links == []
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_sysinfo_with_empty_lqm(self, mock_urlopen):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_sysinfo_with_empty_lqm(self, mock_get):
         """lqm field is empty array."""
         collector = AREDNCollector(cache_ttl_seconds=0)
         data = {
@@ -437,17 +589,13 @@ class TestLQMFromSysinfo:
             "lon": "-118.0",
             "lqm": [],
         }
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = json.dumps(data).encode()
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_get.return_value = json.dumps(data).encode()
         features, links = collector._fetch_from_node("test")
         assert len(features) == 1
         assert links == []
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_sysinfo_with_lqm_links(self, mock_urlopen):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_sysinfo_with_lqm_links(self, mock_get):
         """Valid sysinfo with LQM neighbors."""
         collector = AREDNCollector(cache_ttl_seconds=0)
         data = {
@@ -461,11 +609,7 @@ class TestLQMFromSysinfo:
                 {"name": "blocked-node", "blocked": True, "snr": 5},  # Blocked
             ],
         }
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = json.dumps(data).encode()
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_get.return_value = json.dumps(data).encode()
         features, links = collector._fetch_from_node("mynode")
         assert len(features) == 1
         assert len(links) == 2  # 2 valid, 1 empty name, 1 blocked
@@ -478,7 +622,7 @@ class TestCoordinateBuildUp:
     @patch.object(AREDNCollector, "_fetch_from_cache")
     @patch.object(AREDNCollector, "_fetch_from_unified_cache")
     def test_coordinates_built_from_features(self, mock_unified, mock_cache, mock_node):
-        """_fetch should populate _node_coords from all collected features."""
+        """_fetch should populate node coords from all collected features."""
         collector = AREDNCollector(node_targets=["test"], cache_ttl_seconds=0)
         feature = {
             "properties": {"id": "nodeA", "network": "aredn"},
@@ -489,14 +633,14 @@ class TestCoordinateBuildUp:
         mock_unified.return_value = []
 
         collector._fetch()
-        assert "nodeA" in collector._node_coords
-        assert collector._node_coords["nodeA"] == (34.0, -118.0)
+        assert "nodeA" in collector._topo.coords
+        assert collector._topo.coords["nodeA"] == (34.0, -118.0)
 
     @patch.object(AREDNCollector, "_fetch_from_node")
     @patch.object(AREDNCollector, "_fetch_from_cache")
     @patch.object(AREDNCollector, "_fetch_from_unified_cache")
     def test_feature_without_coordinates_skipped(self, mock_unified, mock_cache, mock_node):
-        """Features without coordinates should not be in _node_coords."""
+        """Features without coordinates should not be in the node coords."""
         collector = AREDNCollector(node_targets=["test"], cache_ttl_seconds=0)
         feature = {
             "properties": {"id": "nodeB", "network": "aredn"},
@@ -507,7 +651,7 @@ class TestCoordinateBuildUp:
         mock_unified.return_value = []
 
         collector._fetch()
-        assert "nodeB" not in collector._node_coords
+        assert "nodeB" not in collector._topo.coords
 
 
 class TestIPv6AddressHandling:
@@ -517,52 +661,52 @@ class TestIPv6AddressHandling:
     def collector(self):
         return AREDNCollector(cache_ttl_seconds=0)
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_bare_ipv6_wrapped_in_brackets(self, mock_urlopen, collector):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_bare_ipv6_wrapped_in_brackets(self, mock_get, collector):
         """Bare IPv6 like '::1' should become '[::1]:8080'."""
-        mock_urlopen.side_effect = URLError("test")
+        mock_get.side_effect = URLError("test")
         collector._fetch_from_node("::1")
         # Check first URL attempted (new API endpoint)
-        first_url = mock_urlopen.call_args_list[0][0][0].full_url
+        first_url = mock_get.call_args_list[0][0][0]
         assert "[::1]:8080" in first_url
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_bare_ipv6_link_local(self, mock_urlopen, collector):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_bare_ipv6_link_local(self, mock_get, collector):
         """Link-local IPv6 like 'fe80::1' should become '[fe80::1]:8080'."""
-        mock_urlopen.side_effect = URLError("test")
+        mock_get.side_effect = URLError("test")
         collector._fetch_from_node("fe80::1")
-        first_url = mock_urlopen.call_args_list[0][0][0].full_url
+        first_url = mock_get.call_args_list[0][0][0]
         assert "[fe80::1]:8080" in first_url
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_bracketed_ipv6_with_port_unchanged(self, mock_urlopen, collector):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_bracketed_ipv6_with_port_unchanged(self, mock_get, collector):
         """'[::1]:9090' already has port — should not add :8080."""
-        mock_urlopen.side_effect = URLError("test")
+        mock_get.side_effect = URLError("test")
         collector._fetch_from_node("[::1]:9090")
-        first_url = mock_urlopen.call_args_list[0][0][0].full_url
+        first_url = mock_get.call_args_list[0][0][0]
         assert "[::1]:9090" in first_url
         assert "8080" not in first_url
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_hostname_gets_default_port(self, mock_urlopen, collector):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_hostname_gets_default_port(self, mock_get, collector):
         """Plain hostname should get :8080 appended."""
-        mock_urlopen.side_effect = URLError("test")
+        mock_get.side_effect = URLError("test")
         collector._fetch_from_node("mynode.local.mesh")
-        first_url = mock_urlopen.call_args_list[0][0][0].full_url
+        first_url = mock_get.call_args_list[0][0][0]
         assert "mynode.local.mesh:8080" in first_url
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_ipv4_with_port_unchanged(self, mock_urlopen, collector):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_ipv4_with_port_unchanged(self, mock_get, collector):
         """'192.168.1.1:8080' already has port — should not double-add."""
-        mock_urlopen.side_effect = URLError("test")
+        mock_get.side_effect = URLError("test")
         collector._fetch_from_node("192.168.1.1:8080")
-        first_url = mock_urlopen.call_args_list[0][0][0].full_url
+        first_url = mock_get.call_args_list[0][0][0]
         assert "192.168.1.1:8080" in first_url
 
-    @patch("src.collectors.aredn_collector.urlopen")
-    def test_ipv4_without_port(self, mock_urlopen, collector):
+    @patch("src.utils.http_pool.KeepAlivePool.get")
+    def test_ipv4_without_port(self, mock_get, collector):
         """'192.168.1.1' should get :8080 appended."""
-        mock_urlopen.side_effect = URLError("test")
+        mock_get.side_effect = URLError("test")
         collector._fetch_from_node("192.168.1.1")
-        first_url = mock_urlopen.call_args_list[0][0][0].full_url
+        first_url = mock_get.call_args_list[0][0][0]
         assert "192.168.1.1:8080" in first_url
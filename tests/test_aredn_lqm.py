@@ -1,6 +1,6 @@
 """Tests for AREDN LQM neighbor resolution."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -95,6 +95,12 @@ class TestLQMNeighborParsing:
         assert result["target"] == "minimal"
         assert result["network"] == "aredn"
 
+    def test_parse_neighbor_key_order_without_nones(self, collector):
+        result = collector._parse_lqm_neighbor(
+            {"name": "n", "snr": 5, "noise": None, "quality": 80, "type": "RF"}, "src",
+        )
+        assert list(result) == ["source", "target", "snr", "quality", "link_type", "network"]
+
 
 class TestLQMTopologyLinks:
     """Tests for get_topology_links() coordinate resolution."""
@@ -107,13 +113,14 @@ class TestLQMTopologyLinks:
         assert collector.get_topology_links() == []
 
     def test_resolved_links(self, collector):
-        collector._lqm_links = [
+        links = [
             {"source": "nodeA", "target": "nodeB", "snr": 20.0, "network": "aredn"},
         ]
-        collector._node_coords = {
+        coords = {
             "nodeA": (35.0, 139.0),
             "nodeB": (35.1, 139.1),
         }
+        collector._publish_topology(links, coords)
         links = collector.get_topology_links()
         assert len(links) == 1
         link = links[0]
@@ -123,24 +130,26 @@ class TestLQMTopologyLinks:
         assert link["target_lon"] == 139.1
 
     def test_unresolved_links_included(self, collector):
-        collector._lqm_links = [
+        links = [
             {"source": "nodeA", "target": "nodeB", "snr": 10.0, "network": "aredn"},
         ]
-        collector._node_coords = {
+        coords = {
             "nodeA": (35.0, 139.0),
             # nodeB has no coordinates
         }
+        collector._publish_topology(links, coords)
         links = collector.get_topology_links()
         assert len(links) == 1
         # Should be included but without resolved coordinates
         assert "source_lat" not in links[0]
 
     def test_lqm_links_persist_across_calls(self, collector):
-        collector._lqm_links = [
+        links = [
             {"source": "a", "target": "b", "network": "aredn"},
             {"source": "b", "target": "c", "network": "aredn"},
         ]
-        collector._node_coords = {}
+        coords = {}
+        collector._publish_topology(links, coords)
         assert len(collector.get_topology_links()) == 2
 
 
@@ -221,3 +230,56 @@ class TestPartialTopologyLinks:
         full = [f for f in features if not f["properties"].get("partial")]
         assert len(full) == 1
         assert full[0]["geometry"]["type"] == "LineString"
+
+
+class TestTopologyGeoJSONCache:
+    """DataAggregator caches topology GeoJSON until a source version moves."""
+
+    @pytest.fixture
+    def aggregator(self):
+        agg = DataAggregator({
+            "enable_meshtastic": False, "enable_reticulum": False,
+            "enable_hamclock": False, "enable_aredn": True,
+            "enable_meshcore": False, "enable_noaa_alerts": False,
+        })
+        yield agg
+        agg.shutdown()
+
+    def test_unchanged_topology_served_from_cache(self, aggregator):
+        first = aggregator.get_topology_geojson()
+        with patch.object(AREDNCollector, "get_topology_links") as links:
+            second = aggregator.get_topology_geojson()
+        links.assert_not_called()
+        assert second is first
+
+    def test_aredn_fetch_invalidates_cache(self, aggregator):
+        aredn = aggregator.get_collector("aredn")
+        first = aggregator.get_topology_geojson()
+        assert first["features"] == []
+        with patch.object(AREDNCollector, "_fetch_from_node") as node, \
+                patch.object(AREDNCollector, "_fetch_from_worldmap", return_value=[]), \
+                patch.object(AREDNCollector, "_fetch_from_cache", return_value=[]), \
+                patch.object(AREDNCollector, "_fetch_from_unified_cache", return_value=[]):
+            node.return_value = ([], [{"source": "a", "target": "b", "network": "aredn"}])
+            aredn._node_targets = ["a"]
+            aredn._fetch()
+        second = aggregator.get_topology_geojson()
+        assert second is not first
+        assert len(second["features"]) == 1
+
+    def test_mqtt_change_reuses_aredn_link_features(self, aggregator):
+        from src.collectors.mqtt_subscriber import MQTTNodeStore
+        store = MQTTNodeStore()
+        aggregator._mqtt_subscriber = MagicMock(store=store)
+        first = aggregator.get_topology_geojson()
+        store.update_position("!a", 35.0, 139.0)
+        with patch.object(AREDNCollector, "get_topology_links") as links:
+            second = aggregator.get_topology_geojson()
+        links.assert_not_called()
+        assert second is not first
+        aggregator._mqtt_subscriber = None
+
+    def test_clear_all_caches_drops_topology(self, aggregator):
+        first = aggregator.get_topology_geojson()
+        aggregator.clear_all_caches()
+        assert aggregator.get_topology_geojson() is not first
@@ -1,6 +1,7 @@
 """Tests for base collector module: GeoJSON helpers and BaseCollector caching."""
 
 import time
+from unittest.mock import patch
 
 
 from src.collectors.base import BaseCollector, make_feature, make_feature_collection, point_in_bboxes
@@ -141,6 +142,13 @@ class TestUsPresetShape:
 class TestMakeFeature:
     """Tests for make_feature() GeoJSON helper."""
 
+    def test_property_order_and_none_stripping(self):
+        f = make_feature("node1", 35.0, 139.0, "meshtastic",
+                         grid="PM95", snr=None, hardware="TBEAM", is_online=True)
+        assert list(f["properties"]) == [
+            "id", "name", "network", "node_type", "is_online", "hardware", "grid",
+        ]
+
     def test_basic_feature(self):
         f = make_feature("node1", 35.0, 139.0, "meshtastic", name="Test")
         assert f["type"] == "Feature"
@@ -206,9 +214,37 @@ class TestMakeFeature:
         assert p["role"] == "ROUTER"
 
 
+class TestMakeLinkFeature:
+    """Tests for make_link_feature() LineString construction."""
+
+    def test_linestring_geometry_and_props(self):
+        from src.collectors.base import make_link_feature
+        f = make_link_feature("!a", "!b", (1.0, 2.0), (3.0, 4.0), snr=5.0, network="aredn")
+        assert f["geometry"] == {"type": "LineString", "coordinates": ((1.0, 2.0), (3.0, 4.0))}
+        assert list(f["properties"]) == ["source", "target", "snr", "network"]
+
+    def test_coordinates_serialize_as_arrays(self):
+        from src.collectors.base import json_dumps_bytes, json_loads, make_link_feature
+        f = make_link_feature("!a", "!b", (1.0, 2.0), (3.0, 4.0))
+        assert json_loads(json_dumps_bytes(f))["geometry"]["coordinates"] == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_none_props_dropped(self):
+        from src.collectors.base import make_link_feature
+        f = make_link_feature("!a", "!b", (1.0, 2.0), (3.0, 4.0), snr=None, quality="good")
+        assert f["properties"] == {"source": "!a", "target": "!b", "quality": "good"}
+
+
 class TestMakeFeatureCollection:
     """Tests for make_feature_collection() GeoJSON wrapper."""
 
+    def test_collected_at_formatted_once_per_second(self):
+        with patch("src.collectors.base.time.time", return_value=1700000000.2), \
+                patch("src.collectors.base.time.strftime", wraps=time.strftime) as fmt:
+            a = make_feature_collection([], "a")["properties"]["collected_at"]
+            b = make_feature_collection([], "b")["properties"]["collected_at"]
+        assert a == b == "2023-11-14T22:13:20Z"
+        assert fmt.call_count <= 1
+
     def test_empty_collection(self):
         fc = make_feature_collection([], "test_source")
         assert fc["type"] == "FeatureCollection"
@@ -251,6 +287,48 @@ class ConcreteCollector(BaseCollector):
 class TestBaseCollector:
     """Tests for BaseCollector caching behavior."""
 
+    def test_repeated_failures_rate_limit_error_log(self, caplog):
+        def fetch():
+            raise OSError("down")
+
+        c = ConcreteCollector(fetch_func=fetch, cache_ttl_seconds=0)
+        with caplog.at_level("ERROR", logger="src.collectors.base"):
+            for _ in range(5):
+                c.collect()
+        failures = [r for r in caplog.records if "collection failed" in r.getMessage()]
+        assert len(failures) == 1
+        assert c.health_info["total_errors"] == 5
+
+        c._error_log_time -= c._ERROR_LOG_INTERVAL
+        caplog.clear()
+        with caplog.at_level("ERROR", logger="src.collectors.base"):
+            c.collect()
+        assert "(4 similar failures suppressed)" in caplog.records[0].getMessage()
+        # The counter keeps the running total after the pending count is logged
+        assert c.errors_suppressed == 4
+        assert c.health_info["errors_suppressed"] == 4
+
+    def test_retry_backoff_uses_precomputed_schedule(self):
+        attempts = []
+
+        class Flaky(BaseCollector):
+            source_name = "flaky"
+
+            def _fetch(self):
+                attempts.append(1)
+                if len(attempts) < 3:
+                    raise OSError("down")
+                return make_feature_collection([], "flaky")
+
+        c = Flaky(max_retries=2)
+        assert c._retry_delays == (1.0, 2.0)
+        with patch("src.collectors.base.time.sleep") as sleep:
+            c.collect()
+        assert len(attempts) == 3
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert 1.0 <= delays[0] <= 1.15
+        assert 2.0 <= delays[1] <= 2.3
+
     def test_first_collect_calls_fetch(self):
         called = []
         def fetch():
@@ -298,7 +376,7 @@ class TestBaseCollector:
         first = c.collect()
         assert first["properties"]["node_count"] == 1
         # Force cache expiry
-        c._cache_time = 0
+        c._cache_time = float("-inf")
         second = c.collect()
         # Should return stale cache
         assert second["properties"]["node_count"] == 1
@@ -317,7 +395,7 @@ class TestBaseCollector:
         assert c._cache is not None
         c.clear_cache()
         assert c._cache is None
-        assert c._cache_time == 0
+        assert c._cache_time == float("-inf")
 
     def test_health_info_initial(self):
         c = ConcreteCollector()
@@ -351,6 +429,50 @@ class TestBaseCollector:
         assert info["last_error"] == "test failure"
         assert "last_error_age_seconds" in info
 
+    def test_concurrent_collect_with_stale_cache_does_not_refetch(self):
+        import threading
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            if len(calls) == 2:
+                started.set()
+                release.wait(5)
+            return make_feature_collection([], "test")
+
+        c = ConcreteCollector(fetch_func=fetch)
+        stale = c.collect()
+        c._cache_time = float("-inf")
+        t = threading.Thread(target=c.collect)
+        t.start()
+        assert started.wait(5)
+        # Fetch in flight: a second caller gets the stale cache at once
+        assert c.collect() is stale
+        release.set()
+        t.join(5)
+        assert len(calls) == 2
+
+    def test_concurrent_cold_collect_waits_for_single_fetch(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        gate = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            gate.wait(5)
+            return make_feature_collection([], "test")
+
+        c = ConcreteCollector(fetch_func=fetch)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(c.collect) for _ in range(4)]
+            time.sleep(0.05)
+            gate.set()
+            results = [f.result(5) for f in futures]
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
 
 class TestDeduplicateFeatures:
     """Direct unit tests for deduplicate_features()."""
@@ -385,6 +507,19 @@ class TestDeduplicateFeatures:
         result = deduplicate_features([[f_with_id, f_no_id]], allow_no_id=False)
         assert len(result) == 1
 
+    def test_no_id_features_follow_id_features(self):
+        from src.collectors.base import deduplicate_features
+        anon = {"properties": {"name": "anonymous"}}
+        f1 = {"properties": {"id": "node1"}}
+        f2 = {"properties": {"id": "node2"}}
+        result = deduplicate_features([[anon, f1], [f1, f2]])
+        assert result == [f1, f2, anon]
+
+    def test_null_properties_treated_as_no_id(self):
+        from src.collectors.base import deduplicate_features
+        result = deduplicate_features([[{"properties": None}]], allow_no_id=False)
+        assert result == []
+
     def test_none_features_skipped(self):
         from src.collectors.base import deduplicate_features
         result = deduplicate_features([[None, {"properties": {"id": "x"}}]])
@@ -396,6 +531,34 @@ class TestDeduplicateFeatures:
         assert result == []
 
 
+class TestValidateCoordinates:
+    """validate_coordinates() rejects non-finite values via the range check."""
+
+    def test_non_finite_rejected(self):
+        from src.collectors.base import validate_coordinates
+        for bad in (float("nan"), float("inf"), float("-inf"), "nan", "inf"):
+            assert validate_coordinates(bad, 10.0) is None
+            assert validate_coordinates(10.0, bad) is None
+
+    def test_valid_pair_normalized(self):
+        from src.collectors.base import validate_coordinates
+        assert validate_coordinates("35.5", 139) == (35.5, 139.0)
+
+    def test_batch_keeps_only_valid_rows(self):
+        from src.collectors.base import validate_coordinates_batch
+        rows = [
+            ("a", 35.5, 139.0),
+            ("b", float("nan"), 10.0),
+            ("c", None, 10.0),
+            ("d", 0.0, 0.0),
+            ("e", 405000000, -1220000000),
+        ]
+        assert validate_coordinates_batch(rows) == {"a": (35.5, 139.0)}
+        assert validate_coordinates_batch(rows, convert_int=True) == {
+            "a": (35.5, 139.0), "e": (40.5, -122.0),
+        }
+
+
 class TestIsNodeOnline:
     """Regression tests for is_node_online clock-skew / unknown-network guards."""
 
@@ -448,3 +611,47 @@ class TestBoundedRead:
         resp = BytesIO(b"x" * 1025)
         with pytest.raises(ValueError, match="exceeded"):
             bounded_read(resp, max_bytes=1024)
+
+
+class TestJsonCodec:
+    """json_dumps_bytes/json_loads behave the same with and without orjson."""
+
+    def _roundtrip(self):
+        from src.collectors.base import json_dumps_bytes, json_loads
+        fc = make_feature_collection([make_feature("!a1", 35.0, 139.0, "meshtastic")], "test")
+        raw = json_dumps_bytes(fc)
+        assert isinstance(raw, bytes)
+        assert json_loads(raw) == fc
+        assert json_loads(raw.decode("utf-8")) == fc
+
+    def test_roundtrip_default_backend(self):
+        self._roundtrip()
+
+    def test_roundtrip_stdlib_fallback(self, monkeypatch):
+        import src.collectors.base as base
+        monkeypatch.setattr(base, "HAS_ORJSON", False)
+        self._roundtrip()
+
+    def test_unserializable_values_stringified(self, monkeypatch):
+        import src.collectors.base as base
+        from pathlib import Path
+        for has_orjson in (base.HAS_ORJSON, False):
+            monkeypatch.setattr(base, "HAS_ORJSON", has_orjson)
+            assert base.json_loads(base.json_dumps_bytes({"p": Path("/x")})) == {"p": "/x"}
+
+    def test_malformed_input_raises_value_error(self, monkeypatch):
+        import pytest
+        import src.collectors.base as base
+        for has_orjson in (base.HAS_ORJSON, False):
+            monkeypatch.setattr(base, "HAS_ORJSON", has_orjson)
+            with pytest.raises(ValueError):
+                base.json_loads(b"{not json")
+
+    def test_stdlib_only_literals_accepted(self, monkeypatch):
+        import math
+        import src.collectors.base as base
+        for has_orjson in (base.HAS_ORJSON, False):
+            monkeypatch.setattr(base, "HAS_ORJSON", has_orjson)
+            data = base.json_loads(b'{"snr": NaN, "big": 123456789012345678901234567890}')
+            assert math.isnan(data["snr"])
+            assert data["big"] == 123456789012345678901234567890
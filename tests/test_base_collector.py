@@ -127,3 +127,32 @@ class TestPersistentCacheSave:
 
         cache_file = tmp_path / "cache" / "test_source.json"
         assert not cache_file.exists()
+
+    def test_save_replaces_atomically(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "src.collectors.base.get_data_dir", lambda: tmp_path,
+        )
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "test_source.json").write_text("old")
+        data = make_feature_collection([], "test_source")
+        collector = _TestCollector(data=data, cache_ttl_seconds=0, persistent_cache=True)
+        collector.collect()
+
+        assert [p.name for p in cache_dir.iterdir()] == ["test_source.json"]
+        assert json.loads((cache_dir / "test_source.json").read_bytes())["type"] == "FeatureCollection"
+
+    def test_saved_cache_warms_next_instance(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "src.collectors.base.get_data_dir", lambda: tmp_path,
+        )
+        data = make_feature_collection(
+            [{"type": "Feature", "geometry": {"type": "Point", "coordinates": [1, 2]},
+              "properties": {"id": "!a"}}],
+            "test_source",
+        )
+        _TestCollector(data=data, persistent_cache=True).collect()
+
+        restarted = _TestCollector(persistent_cache=True)
+        result = restarted.collect()  # within TTL: served from disk, no fetch
+        assert result["features"][0]["properties"]["id"] == "!a"
@@ -2,9 +2,12 @@
 
 import json
 import subprocess
+import threading
 import time
+from concurrent.futures import Future
 from unittest.mock import MagicMock, mock_open, patch
 
+import pytest
 
 from src.collectors.base import make_feature, make_feature_collection
 from src.collectors.meshtastic_collector import MeshtasticCollector
@@ -80,26 +83,58 @@ class TestMeshtasticCollector:
             "longitude": -0.1,
         }) is None
 
-    @patch("src.collectors.meshtastic_collector.MQTT_CACHE_PATH")
-    def test_fetch_from_mqtt_cache_dict(self, mock_path, sample_mqtt_cache_dict, tmp_path):
+    def test_fetch_from_mqtt_cache_dict(self, sample_mqtt_cache_dict, tmp_path):
         cache_file = tmp_path / "mqtt_nodes.json"
         cache_file.write_text(json.dumps(sample_mqtt_cache_dict))
-        # Replace the module-level Path with our real temp file
-        mock_path.exists.return_value = True
         c = MeshtasticCollector()
-        with patch("builtins.open", mock_open(read_data=json.dumps(sample_mqtt_cache_dict))):
+        with patch("src.collectors.meshtastic_collector.MQTT_CACHE_PATH", cache_file):
             features = c._fetch_from_mqtt_cache()
         assert len(features) == 2
 
-    @patch("src.collectors.meshtastic_collector.MQTT_CACHE_PATH")
-    def test_fetch_from_mqtt_cache_geojson(self, mock_path, sample_mqtt_cache_geojson):
-        mock_path.exists.return_value = True
+    def test_fetch_from_mqtt_cache_geojson(self, sample_mqtt_cache_geojson, tmp_path):
+        cache_file = tmp_path / "mqtt_nodes.json"
+        cache_file.write_text(json.dumps(sample_mqtt_cache_geojson))
         c = MeshtasticCollector()
-        with patch("builtins.open", mock_open(read_data=json.dumps(sample_mqtt_cache_geojson))):
+        with patch("src.collectors.meshtastic_collector.MQTT_CACHE_PATH", cache_file):
             features = c._fetch_from_mqtt_cache()
         assert len(features) == 1
         assert features[0]["properties"]["id"] == "!geo001"
 
+    def test_fetch_from_mqtt_cache_reparses_only_on_change(
+        self, sample_mqtt_cache_geojson, sample_mqtt_cache_dict, tmp_path,
+    ):
+        cache_file = tmp_path / "mqtt_nodes.json"
+        c = MeshtasticCollector()
+        with patch("src.collectors.meshtastic_collector.MQTT_CACHE_PATH", cache_file):
+            assert c._fetch_from_mqtt_cache() == []  # missing file
+            cache_file.write_text(json.dumps(sample_mqtt_cache_geojson))
+            first = c._fetch_from_mqtt_cache()
+            with patch("src.collectors.meshtastic_collector.json_loads") as loads:
+                assert c._fetch_from_mqtt_cache() is first
+            loads.assert_not_called()
+            cache_file.write_text(json.dumps(sample_mqtt_cache_dict))
+            assert len(c._fetch_from_mqtt_cache()) == 2
+
+    def test_fetch_from_mqtt_cache_malformed(self, tmp_path):
+        cache_file = tmp_path / "mqtt_nodes.json"
+        c = MeshtasticCollector()
+        with patch("src.collectors.meshtastic_collector.MQTT_CACHE_PATH", cache_file):
+            for body in ("", "{not json", "[1, 2]", '{"!a": 5}',
+                         '{"type": "FeatureCollection", "features": [1, {"properties": 2}]}'):
+                cache_file.write_text(body)
+                assert c._fetch_from_mqtt_cache() == []
+
+    def test_merge_sources_first_id_wins_and_drops_id_less(self):
+        api = make_feature("!a", 30.0, -90.0, "meshtastic", name="api")
+        live = make_feature("!a", 31.0, -91.0, "meshtastic", name="live")
+        other = make_feature("!b", 32.0, -92.0, "meshtastic")
+        anon = make_feature("", 33.0, -93.0, "meshtastic")
+        c = MeshtasticCollector()
+        fc = c._merge_sources([api], [live, anon], [other])
+        assert [f["properties"]["id"] for f in fc["features"]] == ["!a", "!b"]
+        assert fc["features"][0] is api
+        assert fc["properties"]["node_count"] == 2
+
     def test_online_detection(self, sample_meshtastic_api_node):
         c = MeshtasticCollector()
         # Recent lastHeard -> online
@@ -310,6 +345,8 @@ class TestHamClockCollector:
         c = HamClockCollector()
         assert c._assess_band_conditions(None, None) == "unknown"
         assert c._assess_band_conditions("bad", 3) == "unknown"
+        assert c._assess_band_conditions(150, "nan") == "unknown"
+        assert c._assess_band_conditions("120", "3") == "good"
 
     def test_solar_terminator_calculation(self):
         c = HamClockCollector()
@@ -320,6 +357,38 @@ class TestHamClockCollector:
         assert -90 <= result["subsolar_lat"] <= 90
         assert -180 <= result["subsolar_lon"] <= 180
 
+    def test_solar_terminator_timestamp_format(self):
+        """API-visible timestamp stays datetime.isoformat() with +00:00."""
+        from datetime import datetime, timezone
+        c = HamClockCollector()
+        for fixed in (datetime(2026, 3, 20, 14, 5, 6, 789012, tzinfo=timezone.utc),
+                      datetime(2026, 3, 20, 14, 5, 6, tzinfo=timezone.utc)):
+            with patch("src.collectors.hamclock_collector.time.time",
+                       return_value=fixed.timestamp()):
+                ts = c._calculate_solar_terminator()["timestamp"]
+            assert ts == fixed.isoformat()
+        c.close()
+
+    def test_subsolar_lon_range_over_full_day(self):
+        from datetime import datetime, timezone
+        c = HamClockCollector()
+        for hour in range(24):
+            for minute in (0, 59):
+                now = datetime(2026, 3, 20, hour, minute, tzinfo=timezone.utc)
+                with patch("src.collectors.hamclock_collector.time.time",
+                           return_value=now.timestamp()):
+                    lon = c._calculate_solar_terminator()["subsolar_lon"]
+                assert -180 < lon <= 180
+        c.close()
+
+    def test_declination_table_matches_formula(self):
+        import math
+        from src.collectors.hamclock_collector import _DECLINATION_BY_DOY
+        assert len(_DECLINATION_BY_DOY) == 367
+        for doy in (1, 80, 172, 266, 355, 366):
+            expected = -23.44 * math.cos(math.radians(360 / 365 * (doy + 10)))
+            assert _DECLINATION_BY_DOY[doy] == expected
+
     # --- Constructor / config ---
 
     def test_constructor_defaults(self):
@@ -355,6 +424,32 @@ class TestHamClockCollector:
         result = _parse_key_value("path=DE to DX = 5000km")
         assert result["path"] == "DE to DX = 5000km"
 
+    def test_as_float(self):
+        from src.collectors.hamclock_collector import _as_float
+        assert _as_float(2) == 2.0
+        assert _as_float("2.33") == 2.33
+        assert _as_float(" -1.5 ") == -1.5
+        assert _as_float("1e2") == 100.0
+        for bad in ("", "n/a", "nan", "inf", float("nan"), None, [], {}):
+            assert _as_float(bad) is None
+
+    def test_noaa_kp_list_rows_and_bad_values(self):
+        from src.collectors.hamclock_collector import (
+            SWPC_KP_INDEX, SWPC_SOLAR_FLUX, SWPC_SOLAR_WIND,
+        )
+        feeds = {
+            SWPC_SOLAR_FLUX: [{"flux": "bad"}],
+            SWPC_KP_INDEX: [["time_tag", "Kp"], ["2024-01-01", "3.67"]],
+            SWPC_SOLAR_WIND: [{"proton_speed": None}],
+        }
+        c = HamClockCollector()
+        with patch.object(c, "_fetch_json", side_effect=feeds.get):
+            weather = c._fetch_space_weather_noaa()
+        c.close()
+        assert weather["solar_flux"] is None
+        assert weather["kp_index"] == 3.67
+        assert weather["solar_wind_speed"] is None
+
     # --- HamClock availability ---
 
     @patch.object(HamClockCollector, "_fetch_text")
@@ -497,6 +592,16 @@ class TestHamClockCollector:
         assert result["source"] == "HamClock API"
         assert "solar_flux" not in result
 
+    @patch.object(HamClockCollector, "_fetch_text")
+    def test_fetch_space_weather_hamclock_aliases(self, mock_fetch):
+        mock_fetch.return_value = "flux=140\nPF=3\nAur=7\nFoo=1\n"
+        c = HamClockCollector()
+        result = c._fetch_space_weather_hamclock()
+        assert result["solar_flux"] == "140"
+        assert result["proton_flux"] == "3"
+        assert result["aurora"] == "7"
+        assert "Foo" not in result and "foo" not in result
+
     # --- VOACAP ---
 
     @patch.object(HamClockCollector, "_fetch_text")
@@ -515,6 +620,16 @@ class TestHamClockCollector:
         assert result["best_band"] == "20m"
         assert result["best_reliability"] == 90
 
+    @patch.object(HamClockCollector, "_fetch_text")
+    def test_fetch_voacap_single_value_bad_rows_and_ties(self, mock_fetch):
+        mock_fetch.return_value = "40m=70\r\n20m=70, 9\r\n15m=abc\r\n10m=50,\r\n"
+        c = HamClockCollector()
+        result = c._fetch_voacap()
+        assert result["bands"]["40m"] == {"reliability": 70, "snr": 0, "status": "good"}
+        assert result["bands"]["20m"]["snr"] == 9
+        assert "15m" not in result["bands"] and "10m" not in result["bands"]
+        assert result["best_band"] == "40m"  # first band at the top reliability
+
     @patch.object(HamClockCollector, "_fetch_text")
     def test_fetch_voacap_returns_none_when_no_bands(self, mock_fetch):
         mock_fetch.return_value = "path=DE to DX\nutc=14\n"
@@ -558,6 +673,7 @@ class TestHamClockCollector:
         result = c._fetch_dx()
         assert result["lat"] == "48.85"
         assert result["grid"] == "JN18"
+        mock_fetch.assert_called_once_with("http://localhost:8080/get_dx.txt")
 
     # --- DX Spots ---
 
@@ -660,6 +776,33 @@ class TestHamClockCollector:
         assert fc["properties"]["hamclock"]["dxspots"][0]["dx_call"] == "JA1ABC"
         assert "solar_terminator" in fc["properties"]
 
+    @pytest.mark.parametrize("variant,concurrent", [
+        ("openhamclock", True), ("hamclock", False),
+    ])
+    def test_fetch_endpoint_concurrency_by_variant(self, variant, concurrent):
+        """OpenHamClock endpoints are fetched in parallel; legacy HamClock
+        (one client at a time) is queried sequentially."""
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def fake_fetch_text(url):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return None
+
+        c = HamClockCollector()
+        c._detected_variant = variant
+        with patch.object(c, "is_hamclock_available", return_value=True), \
+                patch.object(c, "_fetch_text", side_effect=fake_fetch_text):
+            fc = c._fetch()
+        c.close()
+        assert fc["properties"]["hamclock"]["available"] is True
+        assert (peak[0] > 1) is concurrent
+
     # --- Full _fetch: HamClock down (NOAA fallback) ---
 
     @patch.object(HamClockCollector, "is_hamclock_available", return_value=False)
@@ -679,6 +822,135 @@ class TestHamClockCollector:
         assert "de_station" not in fc["properties"]["hamclock"]
         assert "dxspots" not in fc["properties"]["hamclock"]
 
+    def test_noaa_feeds_fetched_concurrently(self):
+        """All three SWPC GETs are in flight at once, results stay mapped."""
+        from src.collectors.hamclock_collector import (
+            SWPC_KP_INDEX, SWPC_SOLAR_FLUX, SWPC_SOLAR_WIND,
+        )
+        barrier = threading.Barrier(3, timeout=5)
+        payloads = {
+            SWPC_SOLAR_FLUX: [{"flux": "150"}],
+            SWPC_KP_INDEX: [{"Kp": "2"}],
+            SWPC_SOLAR_WIND: [{"proton_speed": "400"}],
+        }
+
+        def fetch_json(url):
+            barrier.wait()  # BrokenBarrierError if fetched one at a time
+            return payloads[url]
+
+        c = HamClockCollector()
+        with patch.object(c, "_fetch_json", side_effect=fetch_json):
+            weather = c._fetch_space_weather_noaa()
+        c.close()
+        assert weather["solar_flux"] == 150.0
+        assert weather["kp_index"] == 2.0
+        assert weather["solar_wind_speed"] == 400.0
+
+    def test_noaa_fields_refetched_per_ttl(self):
+        """Each SWPC field is reused until its own TTL expires."""
+        from src.collectors.hamclock_collector import (
+            SWPC_KP_INDEX, SWPC_SOLAR_FLUX, SWPC_SOLAR_WIND,
+        )
+        feeds = {
+            SWPC_SOLAR_FLUX: [{"flux": "150"}],
+            SWPC_KP_INDEX: None,  # feed down: not cached, retried
+            SWPC_SOLAR_WIND: [{"proton_speed": "400"}],
+        }
+        c = HamClockCollector()
+        with patch.object(c, "_fetch_json", side_effect=feeds.get) as fetch:
+            first = c._fetch_space_weather_noaa()
+            assert fetch.call_count == 3
+            fetch.reset_mock()
+            second = c._fetch_space_weather_noaa()
+            assert [call.args[0] for call in fetch.call_args_list] == [SWPC_KP_INDEX]
+
+            fetch.reset_mock()
+            value = c._swpc_cache["solar_wind_speed"][1]
+            c._swpc_cache["solar_wind_speed"] = (time.monotonic() - 1, value)
+            c._fetch_space_weather_noaa()
+            assert sorted(call.args[0] for call in fetch.call_args_list) == sorted(
+                [SWPC_KP_INDEX, SWPC_SOLAR_WIND]
+            )
+        c.close()
+        assert first["solar_flux"] == second["solar_flux"] == 150.0
+        assert first["kp_index"] is None
+        assert second["solar_wind_speed"] == 400.0
+
+    def test_fetches_use_keepalive_pool(self):
+        """HTTP goes through the collector's shared KeepAlivePool."""
+        from urllib.error import URLError
+        c = HamClockCollector()
+        with patch.object(c._http, "get_with_headers", return_value=(b'[{"flux": 1}]', {})), \
+                patch.object(c._http, "get", return_value=b"version=1") as get:
+            assert c._fetch_json("https://example.invalid/a.json") == [{"flux": 1}]
+            assert c._fetch_text("http://localhost:8080/get_sys.txt") == "version=1"
+        assert get.call_count == 1
+        with patch.object(c._http, "get_with_headers", side_effect=URLError("down")), \
+                patch.object(c._http, "get", side_effect=URLError("down")):
+            assert c._fetch_json("https://example.invalid/a.json") is None
+            assert c._fetch_text("http://localhost:8080/get_sys.txt") is None
+        c.close()
+
+    def test_fetch_json_follows_redirects_and_env_proxy(self, monkeypatch):
+        """SWPC/HamClock hosts behind a redirect or egress proxy still work."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if self.path == "/old.json":
+                    self.send_response(301)
+                    self.send_header("Location", "/new.json")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                # /new.json directly, or an absolute-form URL via the proxy
+                body = b'[{"flux": "%d"}]' % (2 if self.path.startswith("http://") else 1)
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        for var in ("http_proxy", "HTTP_PROXY", "no_proxy", "NO_PROXY"):
+            monkeypatch.delenv(var, raising=False)
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{httpd.server_address[1]}"
+        try:
+            c = HamClockCollector()
+            assert c._fetch_json(base + "/old.json") == [{"flux": "1"}]
+            c.close()
+            monkeypatch.setenv("http_proxy", base)
+            c = HamClockCollector()
+            assert c._fetch_json("http://swpc.invalid/x.json") == [{"flux": "2"}]
+            c.close()
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+    def test_fetch_json_revalidates_with_etag(self):
+        """A 304 reuses the last parsed body; the ETag is sent back."""
+        from urllib.error import HTTPError
+        url = "https://example.invalid/kp.json"
+        c = HamClockCollector()
+        first = (b'[["t", "3"]]', {"ETag": '"abc"'})
+        not_modified = HTTPError(url, 304, "Not Modified", {}, None)
+        with patch.object(c._http, "get_with_headers",
+                          side_effect=[first, not_modified]) as get:
+            data = c._fetch_json(url)
+            assert c._fetch_json(url) is data
+        assert "If-None-Match" not in get.call_args_list[0].kwargs["headers"]
+        assert get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+        # A 304 without a cached body is treated as a failure
+        c._etags.clear()
+        with patch.object(c._http, "get_with_headers", side_effect=not_modified):
+            assert c._fetch_json(url) is None
+        c.close()
+
     # --- Reliability to status ---
 
     def test_reliability_to_status(self):
@@ -783,6 +1055,29 @@ class TestDataAggregator:
         ids = [f["properties"]["id"] for f in result["features"]]
         assert ids.count("dup-1") == 1
 
+    @patch.object(MeshtasticCollector, "collect")
+    @patch.object(ReticulumCollector, "collect")
+    @patch.object(HamClockCollector, "collect")
+    @patch.object(AREDNCollector, "collect")
+    def test_deduplication_keeps_idless_features(self, mock_aredn, mock_ham, mock_ret, mock_mesh):
+        anon = {"type": "Feature", "geometry": {"type": "Point", "coordinates": [2.0, 1.0]},
+                "properties": {"network": "aredn"}}
+        mock_mesh.return_value = make_feature_collection(
+            [make_feature("dup-1", 1.0, 2.0, "meshtastic")], "meshtastic"
+        )
+        mock_ret.return_value = make_feature_collection(
+            [make_feature("dup-1", 1.0, 2.0, "reticulum"),
+             make_feature("r-2", 3.0, 4.0, "reticulum")], "reticulum"
+        )
+        mock_ham.return_value = make_feature_collection([], "hamclock")
+        mock_aredn.return_value = make_feature_collection([anon, dict(anon)], "aredn")
+
+        agg = DataAggregator(dict(DEFAULT_CONFIG_SUBSET))
+        result = agg.collect_all()
+        ids = [f["properties"].get("id") for f in result["features"]]
+        assert ids == ["dup-1", "r-2", None, None]
+        assert result["features"][0]["properties"]["network"] == "meshtastic"
+
     @patch.object(MeshtasticCollector, "collect")
     @patch.object(ReticulumCollector, "collect")
     @patch.object(HamClockCollector, "collect")
@@ -828,6 +1123,26 @@ class TestDataAggregator:
         assert cached["space_weather"]["solar_flux"] == 150
         assert cached["solar_terminator"]["subsolar_lat"] == 10
 
+    @patch.object(MeshtasticCollector, "collect")
+    @patch.object(ReticulumCollector, "collect")
+    @patch.object(HamClockCollector, "collect")
+    @patch.object(AREDNCollector, "collect")
+    def test_overlay_kept_when_hamclock_fails(self, mock_aredn, mock_ham, mock_ret, mock_mesh):
+        mock_mesh.return_value = make_feature_collection([], "meshtastic")
+        mock_ret.return_value = make_feature_collection([], "reticulum")
+        mock_aredn.return_value = make_feature_collection([], "aredn")
+        ham_fc = make_feature_collection([], "hamclock")
+        ham_fc["properties"]["space_weather"] = {"solar_flux": 150}
+        mock_ham.return_value = ham_fc
+
+        agg = DataAggregator(dict(DEFAULT_CONFIG_SUBSET))
+        agg.collect_all()
+        agg._cached_result = None  # bypass the 2 s result dedup
+        mock_ham.side_effect = RuntimeError("hamclock down")
+        result = agg.collect_all()
+        assert agg.get_cached_overlay()["space_weather"]["solar_flux"] == 150
+        assert result["properties"]["overlay_data"]["space_weather"]["solar_flux"] == 150
+
     @patch.object(MeshtasticCollector, "collect")
     @patch.object(ReticulumCollector, "collect")
     @patch.object(HamClockCollector, "collect")
@@ -858,6 +1173,33 @@ class TestDataAggregator:
         finally:
             db.close()
 
+    @patch.object(MeshtasticCollector, "collect")
+    @patch.object(ReticulumCollector, "collect")
+    @patch.object(HamClockCollector, "collect")
+    @patch.object(AREDNCollector, "collect")
+    def test_observations_share_result_feature_list(self, mock_aredn, mock_ham,
+                                                    mock_ret, mock_mesh):
+        """The observation thread reads the published list, not a copy."""
+        mock_mesh.return_value = make_feature_collection(
+            [make_feature("m1", 35.0, 139.0, "meshtastic")], "meshtastic",
+        )
+        for mock, name in ((mock_ret, "reticulum"), (mock_ham, "hamclock"),
+                           (mock_aredn, "aredn")):
+            mock.return_value = make_feature_collection([], name)
+        agg = DataAggregator(dict(DEFAULT_CONFIG_SUBSET))
+        agg._node_history = MagicMock()
+        seen = []
+        with patch.object(agg, "_record_observations", side_effect=seen.append):
+            result = agg.collect_all()
+            agg._obs_thread.join(timeout=5)
+        assert seen[0] is result["features"]
+
+    def test_collector_ttls_jittered_within_ten_percent(self):
+        agg = DataAggregator(dict(DEFAULT_CONFIG_SUBSET, cache_ttl_minutes=10))
+        ttls = {name: c._cache_ttl for name, c in agg._collectors.items()}
+        for name in ("meshtastic", "reticulum", "hamclock", "aredn"):
+            assert 540 <= ttls[name] <= 660
+
     def test_get_cached_overlay_empty_initially(self):
         agg = DataAggregator({
             "enable_meshtastic": False, "enable_reticulum": False,
@@ -865,6 +1207,18 @@ class TestDataAggregator:
         })
         assert agg.get_cached_overlay() == {}
 
+    @patch.object(HamClockCollector, "collect")
+    def test_get_cached_overlay_falls_back_to_hamclock_keys_only(self, mock_ham):
+        ham_fc = make_feature_collection([], "hamclock")
+        ham_fc["properties"]["space_weather"] = {"kp": 3}
+        mock_ham.return_value = ham_fc
+        agg = DataAggregator({
+            "enable_meshtastic": False, "enable_reticulum": False,
+            "enable_hamclock": True, "enable_aredn": False, "enable_meshcore": False,
+        })
+        overlay = agg.get_cached_overlay()
+        assert overlay == {"space_weather": {"kp": 3}}
+
     def test_shutdown_is_safe(self):
         agg = DataAggregator({
             "enable_meshtastic": False, "enable_reticulum": False,
@@ -878,9 +1232,10 @@ class TestDataAggregator:
             "enable_meshtastic": False, "enable_reticulum": False,
             "enable_hamclock": False, "enable_aredn": False, "enable_meshcore": False,
         })
-        agg._cached_overlay = {"test": True}
+        from src.collectors.aggregator import _AggState
+        agg._state = _AggState({"test": True}, 0, {})
         agg.clear_all_caches()
-        assert agg._cached_overlay == {}
+        assert agg.get_cached_overlay() == {}
 
     def test_get_source_health_returns_per_collector(self):
         config = dict(DEFAULT_CONFIG_SUBSET)
@@ -923,6 +1278,138 @@ class TestDataAggregator:
         assert result["properties"]["sources"]["reticulum"] == 1
         assert result["properties"]["total_nodes"] == 1
 
+    @patch.object(MeshtasticCollector, "collect")
+    @patch.object(ReticulumCollector, "collect")
+    @patch.object(HamClockCollector, "collect")
+    @patch.object(AREDNCollector, "collect")
+    def test_collectors_run_concurrently_and_keep_priority(
+        self, mock_aredn, mock_ham, mock_ret, mock_mesh,
+    ):
+        """Sources overlap in time, yet the slow first source still wins dedup."""
+        def slow_mesh():
+            time.sleep(0.3)
+            return make_feature_collection(
+                [make_feature("dup-1", 1.0, 2.0, "meshtastic")], "meshtastic")
+
+        def slow_ret():
+            time.sleep(0.3)
+            return make_feature_collection(
+                [make_feature("dup-1", 1.0, 2.0, "reticulum")], "reticulum")
+
+        mock_mesh.side_effect = slow_mesh
+        mock_ret.side_effect = slow_ret
+        mock_ham.return_value = make_feature_collection([], "hamclock")
+        mock_aredn.return_value = make_feature_collection([], "aredn")
+
+        agg = DataAggregator(dict(DEFAULT_CONFIG_SUBSET))
+        start = time.monotonic()
+        result = agg.collect_all()
+        elapsed = time.monotonic() - start
+        agg.shutdown()
+        assert elapsed < 0.55
+        assert len(result["features"]) == 1
+        assert result["features"][0]["properties"]["network"] == "meshtastic"
+
+    def test_geojson_seq_empty_before_first_collect(self):
+        agg = DataAggregator(dict(DEFAULT_CONFIG_SUBSET))
+        assert list(agg.iter_geojson_seq()) == []
+
+    @patch.object(MeshtasticCollector, "collect")
+    @patch.object(ReticulumCollector, "collect")
+    @patch.object(HamClockCollector, "collect")
+    @patch.object(AREDNCollector, "collect")
+    def test_geojson_seq_yields_rs_delimited_features(self, mock_aredn, mock_ham, mock_ret, mock_mesh):
+        mock_mesh.return_value = make_feature_collection(
+            [make_feature("m1", 1.0, 2.0, "meshtastic")], "meshtastic"
+        )
+        mock_ret.return_value = make_feature_collection(
+            [make_feature("r1", 5.0, 6.0, "reticulum")], "reticulum"
+        )
+        mock_ham.return_value = make_feature_collection([], "hamclock")
+        mock_aredn.return_value = make_feature_collection([], "aredn")
+
+        agg = DataAggregator(dict(DEFAULT_CONFIG_SUBSET))
+        agg.collect_all()
+        records = list(agg.iter_geojson_seq())
+        assert len(records) == 2
+        for rec in records:
+            assert rec.startswith(b"\x1e") and rec.endswith(b"\n")
+        ids = [json.loads(rec[1:])["properties"]["id"] for rec in records]
+        assert ids == ["m1", "r1"]
+
+    @patch.object(MeshtasticCollector, "refresh_live")
+    @patch.object(MeshtasticCollector, "collect")
+    @patch.object(ReticulumCollector, "collect")
+    @patch.object(HamClockCollector, "collect")
+    @patch.object(AREDNCollector, "collect")
+    def test_mqtt_node_event_triggers_live_refresh(
+        self, mock_aredn, mock_ham, mock_ret, mock_mesh, mock_refresh,
+    ):
+        from src.utils.event_bus import NodeEvent
+        empty = make_feature_collection([], "x")
+        for m in (mock_aredn, mock_ham, mock_ret, mock_mesh):
+            m.return_value = empty
+        mock_refresh.return_value = make_feature_collection(
+            [make_feature("!live1", 1.0, 2.0, "meshtastic")], "meshtastic")
+
+        agg = DataAggregator(dict(DEFAULT_CONFIG_SUBSET))
+        agg.collect_all()
+        mock_refresh.assert_not_called()
+
+        agg.event_bus.publish(NodeEvent.position("!live1", 1.0, 2.0))
+        agg._cached_result = None  # bypass the 2 s result dedup
+        result = agg.collect_all()
+        mock_refresh.assert_called_once()
+        assert result["properties"]["sources"]["meshtastic"] == 1
+        stats = agg.perf_monitor.get_source_stats("meshtastic")
+        assert stats["live_refreshes"] == 1
+        assert stats["cache_hit_ratio"] == 0
+        # Dirty flag is consumed by the cycle that handled it
+        agg._cached_result = None
+        agg.collect_all()
+        mock_refresh.assert_called_once()
+        agg.shutdown()
+
+    def test_escaped_collector_failures_share_one_gate_and_reach_perf(self, caplog):
+        agg = DataAggregator({
+            "enable_meshtastic": False, "enable_reticulum": True,
+            "enable_hamclock": False, "enable_aredn": False,
+            "enable_meshcore": False, "enable_noaa_alerts": False,
+        })
+        ret = agg._collectors["reticulum"]
+        with patch.object(ret, "collect", side_effect=RuntimeError("boom")), \
+                caplog.at_level("ERROR"):
+            for _ in range(3):
+                agg._cached_result = None
+                agg.collect_all()
+        logged = [r for r in caplog.records if "boom" in r.getMessage()]
+        assert len(logged) == 1
+        assert ret.errors_suppressed == 2
+        stats = agg.perf_monitor.get_source_stats("reticulum")
+        assert stats["errors_suppressed"] == 2
+        agg.shutdown()
+
+    def test_node_event_does_not_wait_on_data_lock(self):
+        """The MQTT thread marks dirty while a cycle holds _data_lock."""
+        from src.utils.event_bus import NodeEvent
+        agg = DataAggregator({"enable_meshtastic": False})
+        with agg._data_lock:
+            done = threading.Event()
+            t = threading.Thread(target=lambda: (
+                agg.event_bus.publish(NodeEvent.position("!n", 1.0, 2.0)), done.set()))
+            t.start()
+            assert done.wait(2)
+        assert agg._dirty_sources == {"meshtastic"}
+        agg.shutdown()
+
+    def test_secondary_broker_update_marks_dirty(self):
+        agg = DataAggregator({"enable_meshtastic": False})
+        agg._on_secondary_node_update("!n", "topology")
+        assert not agg._dirty_sources
+        agg._on_secondary_node_update("!n", "position")
+        assert agg._dirty_sources == {"meshtastic"}
+        agg.shutdown()
+
     def test_last_collect_age_none_before_collect(self):
         agg = DataAggregator({
             "enable_meshtastic": False, "enable_reticulum": False,
@@ -964,10 +1451,196 @@ class TestDataAggregator:
         counts = agg.last_collect_counts
         assert counts["meshtastic"] == 1
         assert counts["reticulum"] == 0
-        # Verify it's a copy (not mutable reference)
-        counts["meshtastic"] = 999
+        # Read-only view: callers can't mutate the published snapshot
+        with pytest.raises(TypeError):
+            counts["meshtastic"] = 999
         assert agg.last_collect_counts["meshtastic"] == 1
 
+    def test_state_snapshot_is_immutable(self):
+        from dataclasses import FrozenInstanceError
+        agg = DataAggregator({
+            "enable_meshtastic": False, "enable_reticulum": False,
+            "enable_hamclock": False, "enable_aredn": False, "enable_meshcore": False,
+        })
+        agg.collect_all()
+        state = agg._state
+        with pytest.raises(FrozenInstanceError):
+            state.ts = 0
+        with pytest.raises(TypeError):
+            state.counts["meshtastic"] = 1
+
+
+class TestAggregateSnapshot:
+    """Opt-in on-disk snapshot of the aggregated result."""
+
+    _CFG = {
+        "enable_meshtastic": False, "enable_reticulum": False,
+        "enable_hamclock": False, "enable_aredn": False,
+        "enable_meshcore": False, "enable_noaa_alerts": False,
+    }
+
+    def test_disabled_by_default(self):
+        agg = DataAggregator(dict(self._CFG))
+        assert agg._snapshot_path is None
+        agg.shutdown()
+
+    def test_snapshot_round_trip_seeds_new_aggregator(self):
+        first = DataAggregator(dict(self._CFG, aggregate_snapshot=True))
+        first.collect_all()
+        assert first._snapshot_path.exists()
+        first.shutdown()
+
+        second = DataAggregator(dict(self._CFG, aggregate_snapshot=True))
+        assert second.get_cached_result()["type"] == "FeatureCollection"
+        assert second.get_cached_json() is not None
+        assert second.last_collect_age_seconds is not None
+        second.shutdown()
+
+    def test_corrupt_snapshot_ignored(self):
+        agg = DataAggregator(dict(self._CFG, aggregate_snapshot=True))
+        agg._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        agg._snapshot_path.write_bytes(b"{not json")
+        agg._load_snapshot()
+        assert agg.get_cached_result() is None
+        agg.shutdown()
+
+
+class TestPersistCollectorCache:
+    """persist_collector_cache opts the remote-API collectors into disk caches."""
+
+    _CFG = {
+        "enable_meshtastic": False, "enable_reticulum": True,
+        "enable_hamclock": False, "enable_aredn": True,
+        "enable_meshcore": False, "enable_noaa_alerts": False,
+    }
+
+    def test_off_by_default(self):
+        agg = DataAggregator(dict(self._CFG))
+        assert not agg.get_collector("aredn")._persistent_cache
+        agg.shutdown()
+
+    def test_enabled_for_remote_collectors(self):
+        agg = DataAggregator(dict(self._CFG, persist_collector_cache=True))
+        assert agg.get_collector("aredn")._persistent_cache
+        assert agg.get_collector("reticulum")._persistent_cache
+        agg.shutdown()
+
+
+class TestStaleWhileRevalidate:
+    """DataAggregator.get_aggregated() serves cached results around refreshes."""
+
+    def _agg(self):
+        return DataAggregator({
+            "enable_meshtastic": False, "enable_reticulum": False,
+            "enable_hamclock": False, "enable_aredn": False,
+            "enable_meshcore": False, "enable_noaa_alerts": False,
+        })
+
+    def test_first_call_returns_none_and_starts_refresh(self):
+        agg = self._agg()
+        assert agg.get_aggregated() is None
+        agg._refresh_future.result(timeout=5)
+        assert agg.get_cached_result() is not None
+        agg.shutdown()
+
+    def test_fresh_result_served_without_refresh(self):
+        agg = self._agg()
+        agg.collect_all()
+        with patch.object(agg, "_submit_refresh") as submit:
+            assert agg.get_aggregated() is agg.get_cached_result()
+        submit.assert_not_called()
+        agg.shutdown()
+
+    def test_collect_all_reuses_result_within_ttl(self):
+        agg = self._agg()
+        first = agg.collect_all()
+        stamp = agg._cached_result_time
+        assert agg.collect_all() is first
+        assert agg._cached_result_time == stamp
+        agg._cached_result_time -= agg._RESULT_CACHE_TTL + 1
+        assert agg.collect_all() is not first
+        agg.shutdown()
+
+    def test_concurrent_collect_all_is_single_flight(self):
+        agg = self._agg()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_collect():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return make_feature_collection([], "slow")
+
+        agg._collectors["slow"] = MagicMock(collect=slow_collect)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(agg.collect_all()))
+                   for _ in range(3)]
+        threads[0].start()
+        assert started.wait(5)
+        for t in threads[1:]:
+            t.start()
+        time.sleep(0.05)  # let the late callers block on the in-flight collect
+        release.set()
+        for t in threads:
+            t.join(5)
+        assert len(calls) == 1
+        assert len(results) == 3
+        assert all(r is results[0] for r in results)
+        agg.shutdown()
+
+    def test_stale_result_served_while_refreshing(self):
+        agg = self._agg()
+        stale = agg.collect_all()
+        agg._cached_result_time -= agg._AGGREGATE_TTL + 1
+        assert agg.get_aggregated() is stale
+        fresh = agg._refresh_future.result(timeout=5)
+        assert fresh is not stale
+        agg.shutdown()
+
+    def test_expired_result_blocks_on_refresh(self):
+        agg = self._agg()
+        stale = agg.collect_all()
+        agg._cached_result_time -= 2 * agg._AGGREGATE_TTL + 1
+        result = agg.get_aggregated()
+        assert result is not stale
+        assert result is agg.get_cached_result()
+        agg.shutdown()
+
+    def test_expired_result_wait_is_bounded(self):
+        agg = self._agg()
+        stale = agg.collect_all()
+        agg._cached_result_time -= 2 * agg._AGGREGATE_TTL + 1
+        hung = Future()  # a refresh that never finishes
+        with patch.object(agg, "_submit_refresh", return_value=hung), \
+                patch.object(agg, "_REFRESH_WAIT_TIMEOUT", 0.05):
+            assert agg.get_aggregated() is stale
+        agg.shutdown()
+
+    def test_get_aggregated_after_shutdown_serves_stale(self):
+        agg = self._agg()
+        stale = agg.collect_all()
+        agg.shutdown()
+        agg._cached_result_time -= 2 * agg._AGGREGATE_TTL + 1
+        assert agg.get_aggregated() is stale
+        agg._cached_result = None
+        assert agg.get_aggregated() is None
+
+    def test_aggregate_ttl_outlasts_background_interval(self):
+        # map_server re-collects every 120s; results must still be fresh
+        # while that collection is running.
+        assert DataAggregator._AGGREGATE_TTL > 120.0
+
+    def test_concurrent_callers_share_one_refresh(self):
+        agg = self._agg()
+        with patch.object(agg._refresh_pool, "submit") as submit:
+            submit.return_value = MagicMock(done=MagicMock(return_value=False))
+            agg.get_aggregated()
+            agg.get_aggregated()
+        assert submit.call_count == 1
+        agg.shutdown()
+
 
 # ---------------------------------------------------------------------------
 # Region post-filter (aggregator-level)
@@ -978,7 +1651,7 @@ class TestRegionPostFilter:
 
     Regression for the gap where Meshtastic (MQTT + meshmap.net) and any
     collector-side leak bypassed the region scope. Filter is applied after
-    deduplicate_features so it covers every source uniformly.
+    the cross-source dedup so it covers every source uniformly.
     """
 
     # City fixtures: (id, lat, lon)
@@ -1078,6 +1751,34 @@ class TestHamClockThreadSafety:
         assert hasattr(c, "_detection_lock")
         assert isinstance(c._detection_lock, type(threading.Lock()))
 
+    def test_concurrent_get_hamclock_data_fetches_once(self):
+        """Simultaneous TUI/API callers share one cycle: one GET per feed."""
+        gate = threading.Event()
+        calls = []
+
+        def fetch_json(url):
+            calls.append(url)
+            gate.wait(5)
+            return None
+
+        c = HamClockCollector()
+        with patch.object(c, "is_hamclock_available", return_value=False), \
+                patch.object(c, "_fetch_json", side_effect=fetch_json):
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(c.get_hamclock_data()))
+                for _ in range(5)
+            ]
+            for t in threads:
+                t.start()
+            time.sleep(0.2)
+            gate.set()
+            for t in threads:
+                t.join(5)
+        c.close()
+        assert len(results) == 5
+        assert sorted(calls) == sorted(set(calls)) and len(calls) == 3
+
 
 # ==========================================================================
 # MeshCore Collector — bounded_read cap regression
@@ -433,6 +433,18 @@ class TestCloudHardeningValidation:
         assert "enable_hsts" not in validated
         assert errors
 
+    def test_mqtt_topics_list_accepted(self):
+        validated, errors = MapsConfig.validate_update(
+            {"mqtt_topics": [" msh/US/2/e/# ", "msh/EU_868"]},
+        )
+        assert errors == []
+        assert validated["mqtt_topics"] == ["msh/US/2/e/#", "msh/EU_868"]
+
+    def test_mqtt_topics_non_list_rejected(self):
+        validated, errors = MapsConfig.validate_update({"mqtt_topics": "msh/#"})
+        assert "mqtt_topics" not in validated
+        assert errors
+
     def test_ws_allowed_origins_must_be_list(self):
         validated, errors = MapsConfig.validate_update(
             {"ws_allowed_origins": "http://x"},
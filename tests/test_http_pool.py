@@ -0,0 +1,171 @@
+"""Unit tests for src/utils/http_pool.py."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+
+import pytest
+
+from src.utils.http_pool import KeepAlivePool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    connections = []  # client ports seen, one entry per request
+
+    def do_GET(self):
+        type(self).connections.append(self.client_address[1])
+        if self.path.startswith("http://"):  # absolute-form: we are the proxy
+            self._reply(200, b"proxied " + self.path.encode())
+            return
+        if self.path in _REDIRECTS:
+            self.send_response(302)
+            self.send_header("Location", _REDIRECTS[self.path].format(port=self.server.server_address[1]))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/created":
+            self._reply(201, b"made")
+            return
+        if self.path == "/nolen":  # no Content-Length: body runs to close
+            self.send_response(200)
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(b"x" * 64)
+            self.close_connection = True
+            return
+        if self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = b'{"v": 1}'
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        status = 404 if self.path == "/missing" else 200
+        body = b"x" * 64 if self.path == "/big" else b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_REDIRECTS = {
+    "/moved": "/ok",
+    "/moved-twice": "/moved",
+    "/moved-away": "http://localhost:{port}/ok",  # different hostname
+}
+
+
+@pytest.fixture(autouse=True)
+def _no_env_proxy(monkeypatch):
+    for var in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+
+
+@pytest.fixture
+def server():
+    _Handler.connections = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestKeepAlivePool:
+    def test_reuses_connection_across_requests(self, server):
+        pool = KeepAlivePool()
+        assert pool.get(server + "/a?lqm=1") == b'{"ok": true}'
+        assert pool.get(server + "/b") == b'{"ok": true}'
+        assert len(set(_Handler.connections)) == 1
+        pool.close()
+
+    def test_non_200_raises_http_error_and_keeps_connection(self, server):
+        pool = KeepAlivePool()
+        with pytest.raises(HTTPError) as exc:
+            pool.get(server + "/missing")
+        assert exc.value.code == 404
+        pool.get(server + "/ok")
+        assert len(set(_Handler.connections)) == 1
+        pool.close()
+
+    def test_oversized_undeclared_body_rejected(self, server):
+        pool = KeepAlivePool()
+        with pytest.raises(ValueError, match="refusing to buffer"):
+            pool.get(server + "/nolen", max_bytes=10)
+        pool.close()
+
+    def test_declared_oversized_body_rejected_before_read(self, server):
+        pool = KeepAlivePool()
+        with pytest.raises(ValueError, match="Content-Length"):
+            pool.get(server + "/big", max_bytes=10)
+        pool.close()
+
+    def test_close_stops_pooling(self, server):
+        pool = KeepAlivePool()
+        pool.get(server + "/a")
+        pool.close()
+        pool.get(server + "/b")
+        assert len(set(_Handler.connections)) == 2
+
+    def test_get_with_headers_and_not_modified(self, server):
+        pool = KeepAlivePool()
+        body, headers = pool.get_with_headers(server + "/etag")
+        assert body == b'{"v": 1}'
+        assert headers["ETag"] == '"v1"'
+        with pytest.raises(HTTPError) as exc:
+            pool.get(server + "/etag", headers={"If-None-Match": '"v1"'})
+        assert exc.value.code == 304
+        # Empty 304 body leaves the connection reusable
+        pool.get(server + "/ok")
+        assert len(set(_Handler.connections)) == 1
+        pool.close()
+
+    def test_connection_refused_is_os_error(self):
+        pool = KeepAlivePool()
+        with pytest.raises(OSError):
+            pool.get("http://127.0.0.1:1/", timeout=1)
+
+    def test_any_2xx_is_success(self, server):
+        pool = KeepAlivePool()
+        assert pool.get(server + "/created") == b"made"
+        pool.close()
+
+    def test_same_host_redirect_followed_on_pooled_connection(self, server):
+        pool = KeepAlivePool()
+        assert pool.get(server + "/moved") == b'{"ok": true}'
+        assert len(set(_Handler.connections)) == 1
+        pool.close()
+
+    def test_redirect_chain_and_cross_host_redirect_followed(self, server):
+        pool = KeepAlivePool()
+        assert pool.get(server + "/moved-twice") == b'{"ok": true}'
+        assert pool.get(server + "/moved-away") == b'{"ok": true}'
+        pool.close()
+
+    def test_env_proxy_used_and_no_proxy_honored(self, server, monkeypatch):
+        monkeypatch.setenv("http_proxy", server)
+        monkeypatch.setenv("no_proxy", "127.0.0.1")
+        pool = KeepAlivePool()
+        assert pool.get("http://node.invalid/a") == b"proxied http://node.invalid/a"
+        # Bypassed host goes direct (the handler sees an origin-form path)
+        assert pool.get(server + "/ok") == b'{"ok": true}'
+        pool.close()
@@ -122,6 +122,20 @@ class TestMapServerHTTPEndpoints:
         assert "properties" in data
         assert "total_nodes" in data["properties"]
 
+    def test_geojson_seq_endpoint_streams_records(self):
+        from src.collectors.base import make_feature, make_feature_collection
+        self.server._aggregator._cached_result = make_feature_collection(
+            [make_feature("a1", 1.0, 2.0, "aredn"), make_feature("a2", 3.0, 4.0, "aredn")],
+            "aggregated",
+        )
+        req = self.Request(self.base + "/api/nodes/geojson-seq")
+        with self.urlopen(req, timeout=5) as resp:
+            assert resp.status == 200
+            assert resp.headers["Content-Type"] == "application/geo+json-seq"
+            body = resp.read()
+        records = [r for r in body.split(b"\x1e") if r]
+        assert [json.loads(r)["properties"]["id"] for r in records] == ["a1", "a2"]
+
     def test_status_endpoint_returns_health(self):
         data = self._get_json("/api/status")
         assert data["status"] == "ok"
@@ -131,6 +145,15 @@ class TestMapServerHTTPEndpoints:
         assert isinstance(data["sources"], list)
         assert "mqtt_live" in data
 
+    def test_status_and_health_serialize_source_counts(self):
+        from types import MappingProxyType
+        from src.collectors.aggregator import _AggState
+        self.server._aggregator._state = _AggState(
+            MappingProxyType({}), time.time(), MappingProxyType({"aredn": 3}),
+        )
+        assert self._get_json("/api/status")["source_counts"] == {"aredn": 3}
+        assert self._get_json("/api/health")["sources_reporting"] == {"aredn": 3}
+
     def test_topology_endpoint_returns_links(self):
         data = self._get_json("/api/topology")
         assert "links" in data
@@ -153,3 +153,59 @@ class TestSourceModeDataFlow:
 
         ids = [f["properties"]["id"] for f in result["features"]]
         assert ids.count("!dup1") == 1
+
+
+class TestRefreshLive:
+    """refresh_live() re-merges live MQTT nodes without refetching polled sources."""
+
+    @staticmethod
+    def _feature(node_id, lat, lon):
+        return make_feature(node_id=node_id, lat=lat, lon=lon, network="meshtastic")
+
+    @patch.object(MeshtasticCollector, "_fetch_from_meshmap")
+    @patch.object(MeshtasticCollector, "_fetch_from_mqtt_cache")
+    @patch.object(MeshtasticCollector, "_fetch_from_live_mqtt")
+    @patch.object(MeshtasticCollector, "_fetch_from_api")
+    def test_merges_new_live_nodes_only(self, mock_api, mock_live, mock_cache, mock_meshmap):
+        mock_api.return_value = [self._feature("!api1", 30.0, -90.0)]
+        mock_live.return_value = [self._feature("!live1", 31.0, -91.0)]
+        mock_cache.return_value = []
+        mock_meshmap.return_value = [self._feature("!map1", 32.0, -92.0)]
+        collector = MeshtasticCollector(source_mode="auto")
+        collector.collect()
+        cache_time = collector._cache_time
+
+        mock_live.return_value = [self._feature("!live1", 31.0, -91.0),
+                                  self._feature("!live2", 33.0, -93.0)]
+        result = collector.refresh_live()
+
+        ids = [f["properties"]["id"] for f in result["features"]]
+        assert ids == ["!api1", "!live1", "!live2", "!map1"]
+        assert mock_api.call_count == 1
+        assert mock_meshmap.call_count == 1
+        assert collector._cache is result
+        assert collector._cache_time == cache_time
+
+    @patch.object(MeshtasticCollector, "_fetch_from_meshmap", return_value=[])
+    @patch.object(MeshtasticCollector, "_fetch_from_mqtt_cache", return_value=[])
+    @patch.object(MeshtasticCollector, "_fetch_from_live_mqtt")
+    @patch.object(MeshtasticCollector, "_fetch_from_api", return_value=[])
+    def test_defers_to_in_flight_fetch(self, mock_api, mock_live, mock_cache, mock_meshmap):
+        mock_live.return_value = [self._feature("!live1", 31.0, -91.0)]
+        collector = MeshtasticCollector(source_mode="auto")
+        cached = collector.collect()
+        mock_live.reset_mock()
+        with collector._fetch_lock:  # a collect() is mid-fetch
+            assert collector.refresh_live() is cached
+        mock_live.assert_not_called()
+        assert collector._cache is cached
+
+    @patch.object(MeshtasticCollector, "_fetch_from_meshmap", return_value=[])
+    @patch.object(MeshtasticCollector, "_fetch_from_mqtt_cache", return_value=[])
+    @patch.object(MeshtasticCollector, "_fetch_from_live_mqtt", return_value=[])
+    @patch.object(MeshtasticCollector, "_fetch_from_api", return_value=[])
+    def test_cold_cache_falls_back_to_collect(self, mock_api, mock_live, mock_cache, mock_meshmap):
+        collector = MeshtasticCollector(source_mode="auto")
+        collector.refresh_live()
+        mock_api.assert_called_once()
+        mock_meshmap.assert_called_once()
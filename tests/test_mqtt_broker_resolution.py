@@ -18,6 +18,16 @@ class TestResolveBrokerSpecs:
         assert specs[0]["broker"] == "mqtt.example.org"
         assert specs[0]["topic"] == "msh/US"
         assert specs[0]["username"] == "u"
+        assert specs[0]["topics"] == ["msh/US"]
+
+    def test_mqtt_topics_list_used_for_legacy_spec(self):
+        config = {
+            "mqtt_broker": "mqtt.example.org",
+            "mqtt_topic": "msh/US",
+            "mqtt_topics": ["msh/US", "msh/EU_868"],
+        }
+        specs = _resolve_broker_specs(config)
+        assert specs[0]["topics"] == ["msh/US", "msh/EU_868"]
 
     def test_multi_broker_list_used_when_populated(self):
         config = {
@@ -1,6 +1,8 @@
 """Tests for MQTT subscriber node store and topology."""
 
 import time
+from unittest.mock import MagicMock
+
 import pytest
 
 from src.collectors.mqtt_subscriber import MQTTNodeStore, MQTTSubscriber
@@ -192,6 +194,30 @@ class TestMQTTSubscriber:
         sub.stop()  # Should not raise
 
 
+class TestMQTTBatchedSubscribe:
+    """on_connect issues a single SUBSCRIBE covering every topic filter."""
+
+    def test_single_topic_subscribes_with_json_twin_in_one_call(self):
+        sub = MQTTSubscriber(topic="msh/US/2/e/#")
+        client = MagicMock()
+        sub._on_connect(client, None, None, 0)
+        client.subscribe.assert_called_once_with(
+            [("msh/US/2/e/#", 0), ("msh/US/2/json/#", 0)])
+
+    def test_multiple_topics_batched_and_expanded(self):
+        sub = MQTTSubscriber(topics=["msh/US/HI", "msh/EU_868/2/e/#", "msh/US/HI"])
+        client = MagicMock()
+        sub._on_connect(client, None, None, 0)
+        client.subscribe.assert_called_once_with([
+            ("msh/US/HI/2/e/#", 0), ("msh/US/HI/2/json/#", 0),
+            ("msh/EU_868/2/e/#", 0), ("msh/EU_868/2/json/#", 0),
+        ])
+
+    def test_empty_topics_falls_back_to_topic(self):
+        sub = MQTTSubscriber(topic="msh/#", topics=[])
+        assert sub.get_stats()["topics"] == ["msh/#"]
+
+
 # ---------------------------------------------------------------------------
 # MQTT Position Coordinate Validation (via validate_coordinates)
 # ---------------------------------------------------------------------------
@@ -48,6 +48,21 @@ class TestPerfMonitorRecording:
         assert stats["cycle"]["count"] == 1
         assert stats["cycle"]["total_nodes_collected"] == 42
 
+    def test_live_refresh_not_counted_as_cache_hit(self, monitor):
+        monitor.record_timing("src", 5.0, from_cache=True)
+        monitor.record_timing("src", 5.0, from_cache=True, live_refresh=True)
+        stats = monitor.get_source_stats("src")
+        assert stats["live_refreshes"] == 1
+        assert stats["cache_hit_ratio"] == 0.5
+
+    def test_record_errors_suppressed(self, monitor):
+        monitor.record_errors_suppressed("source_a", 3)
+        assert monitor.get_source_stats("source_a")["errors_suppressed"] == 3
+        monitor.record_timing("source_a", 10.0)
+        stats = monitor.get_stats()["sources"]["source_a"]
+        assert stats["errors_suppressed"] == 3
+        assert stats["count"] == 1
+
     def test_unknown_source_returns_none(self, monitor):
         assert monitor.get_source_stats("nonexistent") is None
 
@@ -126,6 +126,25 @@ class TestReconnectStrategyWait:
         assert elapsed >= 0.04
 
 
+class TestReconnectStrategySchedule:
+    """Tests for the precomputed schedule() / jittered() helpers."""
+
+    def test_schedule_matches_next_delay_progression(self):
+        strategy = ReconnectStrategy(base_delay=1.0, max_delay=5.0, jitter_factor=0.0)
+        assert strategy.schedule(4) == (1.0, 2.0, 4.0, 5.0)
+        assert [strategy.next_delay() for _ in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_schedule_does_not_advance_attempts(self):
+        strategy = ReconnectStrategy()
+        strategy.schedule(3)
+        assert strategy.attempt == 0
+
+    def test_jittered_within_bounds(self):
+        strategy = ReconnectStrategy(jitter_factor=0.2)
+        for _ in range(50):
+            assert 4.0 <= strategy.jittered(4.0) <= 4.8
+
+
 class TestReconnectStrategyFactories:
     """Tests for factory class methods."""
 
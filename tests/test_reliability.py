@@ -65,7 +65,7 @@ class TestBaseCollectorRetry:
         c._cache = make_feature_collection(
             [make_feature("cached", 1.0, 2.0, "test")], "test"
         )
-        c._cache_time = 0  # Force expiry
+        c._cache_time = float("-inf")  # Force expiry
 
         result = c.collect()
         assert result["properties"]["node_count"] == 1  # Stale cache
@@ -105,8 +105,8 @@ class TestTopologyGeoJSON:
 
         coords = feature["geometry"]["coordinates"]
         assert len(coords) == 2
-        assert coords[0] == [139.0, 35.0]  # source [lon, lat]
-        assert coords[1] == [139.1, 35.1]  # target [lon, lat]
+        assert coords[0] == (139.0, 35.0)  # source (lon, lat)
+        assert coords[1] == (139.1, 35.1)  # target (lon, lat)
 
         props = feature["properties"]
         assert props["source"] == "!src"
@@ -157,3 +157,75 @@ class TestTopologyGeoJSON:
         qualities = [f["properties"]["quality"] for f in result["features"]]
         assert "excellent" in qualities
         assert "bad" in qualities
+
+
+class TestTopologyVersion:
+    """MQTTNodeStore.topology_version tracks changes to link inputs."""
+
+    def test_bumps_on_position_and_neighbors(self):
+        store = MQTTNodeStore()
+        v0 = store.topology_version
+        store.update_position("!a", 35.0, 139.0)
+        v1 = store.topology_version
+        store.update_neighbors("!a", [{"node_id": "!b", "snr": 3.0}])
+        assert v0 < v1 < store.topology_version
+
+    def test_telemetry_does_not_bump(self):
+        store = MQTTNodeStore()
+        store.update_position("!a", 35.0, 139.0)
+        v = store.topology_version
+        store.update_telemetry("!a", battery=80)
+        store.update_nodeinfo("!a", long_name="Alpha")
+        assert store.topology_version == v
+
+    def test_bumps_on_stale_removal(self):
+        store = MQTTNodeStore(remove_seconds=10)
+        store.update_position("!a", 35.0, 139.0, timestamp=1)
+        v = store.topology_version
+        assert store.cleanup_stale_nodes() == 1
+        assert store.topology_version > v
+
+    def test_links_memoized_until_version_moves(self):
+        store = MQTTNodeStore()
+        store.update_position("!a", 35.0, 139.0)
+        store.update_position("!b", 35.1, 139.1)
+        store.update_neighbors("!a", [{"node_id": "!b", "snr": 3.0}])
+        first = store.get_topology_links()
+        second = store.get_topology_links()
+        assert first == second and first is not second
+        assert first[0] is second[0]  # shared build
+        store.update_position("!b", 35.2, 139.2)
+        third = store.get_topology_links()
+        assert third[0] is not first[0]
+        assert third[0]["target_lat"] == 35.2
+
+    def test_eviction_invalidates_links(self):
+        store = MQTTNodeStore(max_nodes=2)
+        store.update_position("!a", 35.0, 139.0, timestamp=1)
+        store.update_position("!b", 35.1, 139.1, timestamp=2)
+        store.update_neighbors("!a", [{"node_id": "!b", "snr": 3.0}])
+        assert len(store.get_topology_links()) == 1
+        store.update_position("!c", 36.0, 140.0, timestamp=3)  # evicts !a
+        assert store.get_topology_links() == []
+
+
+class TestSNRLookupTable:
+    """Table-driven _classify_snr() matches the tier walk exactly."""
+
+    def test_matches_tier_walk_across_range(self):
+        from src.collectors.mqtt_subscriber import _snr_tier
+        for tenths in range(-500, 601):
+            snr = tenths / 10.0
+            assert _classify_snr(snr) == _snr_tier(snr), snr
+
+    def test_integer_and_string_inputs(self):
+        assert _classify_snr(8) == ("good", "#8bc34a")
+        assert _classify_snr("9") == ("excellent", "#4caf50")
+
+    def test_out_of_table_values_clamp(self):
+        assert _classify_snr(120.0)[0] == "excellent"
+        assert _classify_snr(-99.5)[0] == "bad"
+
+    def test_non_finite_is_unknown(self):
+        assert _classify_snr(float("nan"))[0] == "unknown"
+        assert _classify_snr(float("inf"))[0] == "unknown"